@@ -66,6 +66,8 @@ _LAZY_IMPORTS: dict[str, str] = {
     "FreeBusy": "caldav.calendarobjectresource",
     # search
     "CalDAVSearcher": "caldav.search",
+    # mirror
+    "CalendarMirror": "caldav.mirror",
 }
 
 # Submodules accessible as attributes (e.g. ``caldav.error``).
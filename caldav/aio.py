@@ -27,7 +27,14 @@ unified dual-mode classes.
 """
 
 # Import the async client (this is truly async)
-from caldav.async_davclient import AsyncDAVClient, DAVResponse, get_calendar, get_calendars
+from caldav.async_davclient import (
+    AsyncBatch,
+    AsyncDAVClient,
+    BatchResult,
+    DAVResponse,
+    get_calendar,
+    get_calendars,
+)
 from caldav.async_davclient import get_davclient as get_async_davclient
 from caldav.calendarobjectresource import CalendarObjectResource, Event, FreeBusy, Journal, Todo
 from caldav.collection import (
@@ -59,6 +66,8 @@ AsyncScheduleOutbox = ScheduleOutbox
 __all__ = [
     # Client
     "AsyncDAVClient",
+    "AsyncBatch",
+    "BatchResult",
     "DAVResponse",
     "get_async_davclient",
     # Factory functions (async equivalents of caldav.get_calendar / get_calendars)
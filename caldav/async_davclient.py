@@ -9,7 +9,9 @@ For sync usage, see the davclient.py wrapper.
 import asyncio
 import logging
 import sys
-from collections.abc import Mapping
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import unquote
@@ -97,7 +99,9 @@ from caldav.base_client import get_davclient as _base_get_davclient
 from caldav.compatibility_hints import FeatureSet
 from caldav.lib import error
 from caldav.lib.python_utilities import to_wire
+from caldav.lib.ratelimit import RateLimiter, rate_limiter_from_settings
 from caldav.lib.url import URL
+from caldav.lib.validationcache import ValidationCache, validation_cache_from_settings
 from caldav.requests import HTTPBearerAuth
 from caldav.response import CalendarQueryResult, DAVResponse, PropfindResult
 
@@ -124,6 +128,9 @@ class AsyncDAVClient(BaseDAVClient):
     proxy: str | None = None
     url: URL = None
     huge_tree: bool = False
+    rate_limiter: RateLimiter | None = None
+    validation_cache: ValidationCache | None = None
+    fake_sync_token_stores: dict | None = None
 
     def __init__(
         self,
@@ -144,6 +151,9 @@ class AsyncDAVClient(BaseDAVClient):
         rate_limit_handle: bool | None = None,
         rate_limit_default_sleep: int | None = None,
         rate_limit_max_sleep: int | None = None,
+        rate_limit_interval: float | None = None,
+        rate_limit_count: int | None = None,
+        validation_cache: "bool | ValidationCache" = False,
     ) -> None:
         """
         Initialize an async DAV client.
@@ -171,6 +181,15 @@ class AsyncDAVClient(BaseDAVClient):
                 rather than sleeping when no Retry-After is provided.
             rate_limit_max_sleep: Cap on sleep duration in seconds regardless of
                 server's Retry-After value. None (default) means no cap.
+            rate_limit_interval: When set, throttle the client to send at most
+                rate_limit_count requests within this number of seconds, rather
+                than waiting for the server to respond with 429.  Default: taken
+                from the rate-limit feature in the server compatibility hints.
+            rate_limit_count: Number of requests allowed per rate_limit_interval.
+                Default: taken from the compatibility hints, or 1.
+            validation_cache: When set (True or a ValidationCache), objects loaded
+                before are reloaded through a conditional GET, see
+                caldav.lib.validationcache.
         """
         headers = headers or {}
 
@@ -271,6 +290,17 @@ class AsyncDAVClient(BaseDAVClient):
         self.rate_limit_handle = rate_limit_handle
         self.rate_limit_default_sleep = rate_limit_default_sleep
         self.rate_limit_max_sleep = rate_limit_max_sleep
+        ## Pro-active rate limiting, shared by everything using this client
+        self.rate_limiter = rate_limiter_from_settings(
+            rate_limit, rate_limit_interval, rate_limit_count
+        )
+        self.validation_cache = validation_cache_from_settings(validation_cache)
+        ## Calendar URL -> snapshots behind the fake sync tokens, see
+        ## Calendar.fake_sync_token_store
+        self.fake_sync_token_stores = {}
+        ## time.monotonic() value until which all requests through this
+        ## client are held back, after the server asked us to back off
+        self._rate_limit_paused_until = 0.0
 
     def _create_session(self) -> None:
         """Create or recreate the async HTTP client with current settings."""
@@ -352,6 +382,7 @@ class AsyncDAVClient(BaseDAVClient):
         body: str = "",
         headers: Mapping[str, str] | None = None,
         rate_limit_time_slept: float = 0,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Send an async HTTP request, with optional rate-limit sleep-and-retry.
@@ -361,9 +392,23 @@ class AsyncDAVClient(BaseDAVClient):
         adaptive backoff (each retry adds half the already-slept time). Stops
         retrying when rate_limit_max_sleep is exceeded or no sleep duration is
         available. Otherwise re-raises immediately.
+
+        The sleep is shared by all tasks using this client: requests started
+        while some other request is sleeping on a rate limit will wait for
+        the same amount of time before being sent.
+
+        With ``stream=True`` the body of a successful response is left on
+        the wire, to be consumed through ``DAVResponse.aiter_propfind()`` or
+        ``DAVResponse.aiter_calendar_query()``.
         """
+        ## (retries have already done their sleep)
+        pause = self._rate_limit_paused_until - time.monotonic()
+        if pause > 0 and not rate_limit_time_slept:
+            await asyncio.sleep(pause)
+        if self.rate_limiter:
+            await self.rate_limiter.async_acquire()
         try:
-            return await self._async_request(url, method, body, headers)
+            return await self._async_request(url, method, body, headers, stream=stream)
         except error.RateLimitError as e:
             if not self.rate_limit_handle:
                 raise
@@ -379,9 +424,12 @@ class AsyncDAVClient(BaseDAVClient):
                 and rate_limit_time_slept > self.rate_limit_max_sleep
             ):
                 raise
+            self._rate_limit_paused_until = max(
+                self._rate_limit_paused_until, time.monotonic() + sleep_seconds
+            )
             await asyncio.sleep(sleep_seconds)
             return await self.request(
-                url, method, body, headers, rate_limit_time_slept + sleep_seconds
+                url, method, body, headers, rate_limit_time_slept + sleep_seconds, stream=stream
             )
 
     async def _async_request(
@@ -390,6 +438,7 @@ class AsyncDAVClient(BaseDAVClient):
         method: str = "GET",
         body: str = "",
         headers: Mapping[str, str] | None = None,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Async HTTP request implementation with auth negotiation.
@@ -427,7 +476,16 @@ class AsyncDAVClient(BaseDAVClient):
             }
 
         try:
-            r = await self.session.request(**request_kwargs)
+            if not stream:
+                r = await self.session.request(**request_kwargs)
+            elif _USE_HTTPX:
+                send_kwargs = dict(request_kwargs)
+                auth = send_kwargs.pop("auth")
+                r = await self.session.send(
+                    self.session.build_request(**send_kwargs), auth=auth, stream=True
+                )
+            else:
+                r = await self.session.request(**request_kwargs, stream=True)
             reason = r.reason_phrase if _USE_HTTPX else r.reason
             log.debug(f"server responded with {r.status_code} {reason}")
             if (
@@ -449,7 +507,8 @@ class AsyncDAVClient(BaseDAVClient):
                     if auth_types:
                         msg += "\nSupported authentication types: {}".format(", ".join(auth_types))
                 log.warning(msg)
-            response = DAVResponse(r, self)
+            stream_kwargs = {"stream": True} if stream else {}
+            response = DAVResponse(r, self, **stream_kwargs)
         except Exception:
             # Workaround for servers that abort connection on unauthenticated requests
             # ref https://github.com/python-caldav/caldav/issues/158
@@ -486,13 +545,18 @@ class AsyncDAVClient(BaseDAVClient):
                 r = await self.session.request(**request_kwargs)
             response = DAVResponse(r, self)
 
+        ## Error responses are always buffered, so that the error
+        ## message can include the body
+        if response.streaming and response.status >= 400:
+            await response._abuffer_stream()
+
         # Handle 429/503 rate-limit responses
         error.raise_if_rate_limited(r.status_code, str(url_obj), r.headers.get("Retry-After"))
 
         # Handle 401: negotiate auth then retry
         if self._should_negotiate_auth(r.status_code, r.headers):
             self._build_auth_from_401(r.headers["WWW-Authenticate"])
-            return await self._async_request(url, method, body, headers)
+            return await self._async_request(url, method, body, headers, stream=stream)
 
         elif (
             r.status_code == 401
@@ -507,7 +571,7 @@ class AsyncDAVClient(BaseDAVClient):
             self._create_session()
             # Set multiplexing to False BEFORE retry to prevent infinite loop
             self.features.set_feature("http.multiplexing", False)
-            return await self._async_request(str(url_obj), method, body, headers)
+            return await self._async_request(str(url_obj), method, body, headers, stream=stream)
 
         # Raise AuthorizationError for 401/403 responses
         if response.status in (401, 403):
@@ -528,6 +592,7 @@ class AsyncDAVClient(BaseDAVClient):
         depth: int = 0,
         headers: Mapping[str, str] | None = None,
         props: list[str] | None = None,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Send a PROPFIND request.
@@ -538,6 +603,8 @@ class AsyncDAVClient(BaseDAVClient):
             depth: Maximum recursion depth.
             headers: Additional headers.
             props: List of property names to request (uses protocol layer).
+            stream: Don't buffer the response body.  Iterate over
+                ``response.aiter_propfind()`` to parse it incrementally.
 
         Returns:
             DAVResponse with results attribute containing parsed PropfindResult list.
@@ -547,7 +614,11 @@ class AsyncDAVClient(BaseDAVClient):
             body = self._build_propfind_body(props).decode("utf-8")
 
         final_headers = self._build_method_headers("PROPFIND", depth, headers)
-        response = await self.request(url or str(self.url), "PROPFIND", body, final_headers)
+        ## stream is only passed on when set, as subclasses may override request()
+        stream_kwargs = {"stream": True} if stream else {}
+        response = await self.request(
+            url or str(self.url), "PROPFIND", body, final_headers, **stream_kwargs
+        )
 
         if response.status in (200, 207) and response._raw:
             response.results = response.parse_propfind()
@@ -560,6 +631,7 @@ class AsyncDAVClient(BaseDAVClient):
         body: str = "",
         depth: int | None = 0,
         headers: Mapping[str, str] | None = None,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Send a REPORT request.
@@ -570,12 +642,18 @@ class AsyncDAVClient(BaseDAVClient):
             depth: Maximum recursion depth. None means don't send Depth header
                 (required for calendar-multiget per RFC 4791 section 7.9).
             headers: Additional headers.
+            stream: Don't buffer the response body.  Iterate over
+                ``response.aiter_calendar_query()`` to parse it incrementally.
 
         Returns:
             DAVResponse
         """
         final_headers = self._build_method_headers("REPORT", depth, headers)
-        return await self.request(url or str(self.url), "REPORT", body, final_headers)
+        ## stream is only passed on when set, as subclasses may override request()
+        stream_kwargs = {"stream": True} if stream else {}
+        return await self.request(
+            url or str(self.url), "REPORT", body, final_headers, **stream_kwargs
+        )
 
     async def options(
         self,
@@ -713,6 +791,24 @@ class AsyncDAVClient(BaseDAVClient):
         """
         return await self.request(url, "DELETE", "", headers)
 
+    def batch(self, max_in_flight: int = 16) -> "AsyncBatch":
+        """
+        Create a batch for running many requests concurrently over
+        this client, with at most ``max_in_flight`` of them in flight
+        at any time.
+
+        Example:
+            batch = client.batch(max_in_flight=16)
+            for url, ical in items:
+                batch.put(url, ical, {"Content-Type": "text/calendar; charset=utf-8"})
+            for result in await batch.run():
+                if not result.ok:
+                    print(result.error)
+
+        See :class:`AsyncBatch`.
+        """
+        return AsyncBatch(self, max_in_flight=max_in_flight)
+
     # ==================== High-Level CalDAV Methods ====================
     # These methods use the protocol layer for building XML and parsing responses
 
@@ -1145,6 +1241,112 @@ class AsyncDAVClient(BaseDAVClient):
         return await self.check_scheduling_support()
 
 
+@dataclass
+class BatchResult:
+    """The outcome of one operation in an :class:`AsyncBatch`.
+
+    Exactly one of ``result`` and ``error`` is meaningful, ``ok`` tells which.
+    """
+
+    index: int
+    result: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AsyncBatch:
+    """
+    Runs many operations against an :class:`AsyncDAVClient` concurrently,
+    with at most ``max_in_flight`` operations running at the same time.
+
+    Operations are added through :meth:`add` (any awaitable, or a callable
+    returning one - like ``event.save`` or ``lambda: calendar.save_event(ical)``)
+    or through the request shortcuts :meth:`request`, :meth:`put`,
+    :meth:`delete`, :meth:`propfind` and :meth:`report`.  Nothing is
+    sent before :meth:`run` is awaited.
+
+    All operations share the session of the client.  Rate limiting is
+    handled by :meth:`AsyncDAVClient.request`: when ``rate_limit_handle``
+    is set, a 429 or 503 with Retry-After on one operation holds back
+    every operation in the batch (and every other request on the client)
+    for the requested time.  Otherwise the ``RateLimitError`` is returned
+    as the error of that operation.
+
+    One failing operation does not stop the others; :meth:`run` returns a
+    :class:`BatchResult` per operation, in the order they were added.
+    """
+
+    def __init__(self, client: AsyncDAVClient, max_in_flight: int = 16) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self._operations: list[Callable[[], Awaitable[Any]] | Awaitable[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, operation: Callable[[], Awaitable[Any]] | Awaitable[Any]) -> int:
+        """Add an operation to the batch.  Returns its index in the results.
+
+        Passing a callable rather than a coroutine object defers creating
+        the coroutine until the operation is started.
+        """
+        self._operations.append(operation)
+        return len(self._operations) - 1
+
+    def request(
+        self,
+        url: str,
+        method: str = "GET",
+        body: str = "",
+        headers: Mapping[str, str] | None = None,
+    ) -> int:
+        """Add a request, see :meth:`AsyncDAVClient.request`."""
+        return self.add(lambda: self.client.request(url, method, body, headers))
+
+    def put(self, url: str, body: str, headers: Mapping[str, str] | None = None) -> int:
+        """Add a PUT request, see :meth:`AsyncDAVClient.put`."""
+        return self.add(lambda: self.client.put(url, body, headers))
+
+    def delete(self, url: str, headers: Mapping[str, str] | None = None) -> int:
+        """Add a DELETE request, see :meth:`AsyncDAVClient.delete`."""
+        return self.add(lambda: self.client.delete(url, headers))
+
+    def propfind(self, url: str | None = None, body: str = "", depth: int = 0) -> int:
+        """Add a PROPFIND request, see :meth:`AsyncDAVClient.propfind`."""
+        return self.add(lambda: self.client.propfind(url, body, depth))
+
+    def report(self, url: str | None = None, body: str = "", depth: int | None = 0) -> int:
+        """Add a REPORT request, see :meth:`AsyncDAVClient.report`."""
+        return self.add(lambda: self.client.report(url, body, depth))
+
+    async def run(self) -> list[BatchResult]:
+        """Run all operations added so far, and empty the batch.
+
+        Returns:
+            A list of :class:`BatchResult`, one per operation, in the order
+            the operations were added.
+        """
+        (operations, self._operations) = (self._operations, [])
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def run_one(index, operation):
+            async with semaphore:
+                try:
+                    if callable(operation):
+                        operation = operation()
+                    return BatchResult(index, result=await operation)
+                except Exception as e:
+                    log.debug(f"Operation {index} in batch failed: {e}")
+                    return BatchResult(index, error=e)
+
+        return list(await asyncio.gather(*(run_one(i, op) for (i, op) in enumerate(operations))))
+
+
 # ==================== Factory Function ====================
 
 
@@ -1246,12 +1448,11 @@ async def get_calendars(
             _try(None, "getting principal")
             return CalendarCollection(client=client)
 
-        calendars = []
         calendar_urls = _normalize_to_list(calendar_url)
         calendar_names = _normalize_to_list(calendar_name)
 
         # Fetch specific calendars by URL/ID
-        for cal_url in calendar_urls:
+        async def probe_url(cal_url):
             if "/" in str(cal_url):
                 calendar = principal.calendar(cal_url=cal_url)
             else:
@@ -1260,22 +1461,30 @@ async def get_calendars(
             try:
                 display_name = await calendar.get_display_name()
                 if display_name is not None:
-                    calendars.append(calendar)
+                    return calendar
             except Exception as e:
                 log.error(f"Problems fetching calendar {cal_url}: {e}")
                 if raise_errors:
                     raise
+            return None
 
         # Fetch specific calendars by name
-        for cal_name in calendar_names:
+        async def probe_name(cal_name):
             try:
-                calendar = await principal.calendar(name=cal_name)
-                if calendar:
-                    calendars.append(calendar)
+                return await principal.calendar(name=cal_name)
             except Exception as e:
                 log.error(f"Problems fetching calendar by name '{cal_name}': {e}")
                 if raise_errors:
                     raise
+            return None
+
+        ## The lookups are independent, so they are done concurrently.
+        ## The calendars are still returned in the order asked for.
+        found = await asyncio.gather(
+            *(probe_url(cal_url) for cal_url in calendar_urls),
+            *(probe_name(cal_name) for cal_name in calendar_names),
+        )
+        calendars = [calendar for calendar in found if calendar]
 
         # If no specific calendars requested, get all calendars
         if not calendars and not calendar_urls and not calendar_names:
@@ -7,6 +7,7 @@ functionality for both sync (DAVClient) and async (AsyncDAVClient) clients.
 
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
@@ -21,6 +22,7 @@ from caldav.lib import error
 from caldav.lib.auth import extract_auth_types, select_auth_type
 from caldav.lib.python_utilities import to_normal_str
 from caldav.lib.url import URL
+from caldav.lib.xmltemplates import SLOT, BodyTemplate
 
 if TYPE_CHECKING:
     from caldav.compatibility_hints import FeatureSet
@@ -30,6 +32,9 @@ log = logging.getLogger("caldav")
 ## Common HTTP headers
 ICALH = {"Content-Type": 'text/calendar; charset="utf-8"'}
 
+## Number of accounts get_calendars connects to simultaneously
+GET_CALENDARS_MAX_CONCURRENCY = 8
+
 
 def _prop_name_to_element(name: str, value: Any | None = None) -> BaseElement | None:
     """Convert a property name string (plain or Clark-notation) to a DAV element object."""
@@ -67,6 +72,114 @@ def _prop_name_to_element(name: str, value: Any | None = None) -> BaseElement |
     return None
 
 
+## ── Request body trees and templates ──────────────────────────────────────
+## The XML builders in BaseDAVClient render the common request bodies from
+## templates (see caldav.lib.xmltemplates), serialized the first time they
+## are needed.  The trees below are used both for building the templates
+## (with SLOT in place of the variable values) and for the uncommon bodies.
+
+
+def _tostring(root: BaseElement) -> bytes:
+    return etree.tostring(root.xmlelement(), encoding="utf-8", xml_declaration=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _propfind_body(props: tuple[str, ...] | None, allprop: bool) -> bytes:
+    if allprop:
+        propfind = dav.Propfind() + dav.Allprop()
+    elif props:
+        prop_elements = [e for name in props if (e := _prop_name_to_element(name)) is not None]
+        propfind = dav.Propfind() + (dav.Prop() + prop_elements)
+    else:
+        propfind = dav.Propfind() + dav.Prop()
+    return _tostring(propfind)
+
+
+def _calendar_query_tree(
+    start: str | None,
+    end: str | None,
+    expand: bool,
+    comp_type: str | None,
+    props: list[BaseElement] | None = None,
+    filters: list[BaseElement] | None = None,
+) -> BaseElement:
+    ## start and end are given as UTC date strings
+    data = cdav.CalendarData()
+    if expand:
+        expand_elem = cdav.Expand(None)
+        expand_elem.attributes.update(start=start, end=end)
+        data += expand_elem
+
+    props_list: list[BaseElement] = [data] + (list(props) if props else [])
+    prop = dav.Prop() + props_list
+
+    vcalendar = cdav.CompFilter("VCALENDAR")
+    filter_list: list[BaseElement] = list(filters) if filters else []
+    if start or end:
+        time_range = cdav.TimeRange()
+        if start:
+            time_range.attributes["start"] = start
+        if end:
+            time_range.attributes["end"] = end
+        filter_list.append(time_range)
+
+    if comp_type:
+        comp_filter_elem = cdav.CompFilter(comp_type)
+        if filter_list:
+            comp_filter_elem += filter_list
+        vcalendar += comp_filter_elem
+    elif filter_list:
+        vcalendar += filter_list
+
+    return cdav.CalendarQuery() + [prop, cdav.Filter() + vcalendar]
+
+
+@functools.lru_cache(maxsize=64)
+def _calendar_query_template(
+    expand: bool, comp_type: str | None, has_start: bool, has_end: bool
+) -> BodyTemplate:
+    return BodyTemplate(
+        _calendar_query_tree(
+            SLOT if has_start else None, SLOT if has_end else None, expand, comp_type
+        )
+    )
+
+
+def _calendar_multiget_tree(
+    hrefs: list[str], include_data: bool, include_etag: bool
+) -> BaseElement:
+    elements: list[BaseElement] = []
+    if include_etag:
+        elements.append(dav.Prop() + [dav.GetEtag(), cdav.CalendarData()])
+    elif include_data:
+        elements.append(dav.Prop() + cdav.CalendarData())
+    for href in hrefs:
+        elements.append(dav.Href(value=href))
+    return cdav.CalendarMultiGet() + elements
+
+
+@functools.lru_cache(maxsize=8)
+def _calendar_multiget_template(include_data: bool, include_etag: bool) -> BodyTemplate:
+    return BodyTemplate(_calendar_multiget_tree([SLOT], include_data, include_etag))
+
+
+@functools.lru_cache(maxsize=64)
+def _sync_collection_template(
+    has_token: bool, props: tuple[str, ...] | None, sync_level: str
+) -> BodyTemplate:
+    elements: list[BaseElement] = [
+        dav.SyncToken(value=SLOT if has_token else ""),
+        dav.SyncLevel(value=sync_level),
+    ]
+    if props:
+        prop_elements = [e for name in props if (e := _prop_name_to_element(name)) is not None]
+        if prop_elements:
+            elements.append(dav.Prop() + prop_elements)
+    else:
+        elements.append(dav.Prop() + [dav.GetEtag(), cdav.CalendarData()])
+    return BodyTemplate(dav.SyncCollection() + elements)
+
+
 class BaseDAVClient(ABC):
     """
     Base class for DAV clients providing shared authentication and configuration logic.
@@ -266,14 +379,7 @@ class BaseDAVClient(ABC):
         allprop: bool = False,
     ) -> bytes:
         """Build PROPFIND request body XML."""
-        if allprop:
-            propfind = dav.Propfind() + dav.Allprop()
-        elif props:
-            prop_elements = [e for name in props if (e := _prop_name_to_element(name)) is not None]
-            propfind = dav.Propfind() + (dav.Prop() + prop_elements)
-        else:
-            propfind = dav.Propfind() + dav.Prop()
-        return etree.tostring(propfind.xmlelement(), encoding="utf-8", xml_declaration=True)
+        return _propfind_body(tuple(props) if props else None, allprop)
 
     @staticmethod
     def _build_proppatch_body(set_props: dict[str, Any] | None = None) -> bytes:
@@ -304,51 +410,39 @@ class BaseDAVClient(ABC):
         """Build calendar-query REPORT request body.
 
         Returns (XML bytes, component type name or None).
-        """
-        data = cdav.CalendarData()
-        if expand:
-            if not start or not end:
-                raise error.ReportError("can't expand without a date range")
-            data += cdav.Expand(start, end)
-
-        props_list: list[BaseElement] = [data] + (list(props) if props else [])
-        prop = dav.Prop() + props_list
 
-        vcalendar = cdav.CompFilter("VCALENDAR")
+        Unless extra props or filters are given, the body is rendered
+        from a template.
+        """
+        if expand and (not start or not end):
+            raise error.ReportError("can't expand without a date range")
         comp_type = comp_filter or (
             "VEVENT" if event else "VTODO" if todo else "VJOURNAL" if journal else None
         )
-        filter_list: list[BaseElement] = list(filters) if filters else []
-        if start or end:
-            filter_list.append(cdav.TimeRange(start, end))
-
-        if comp_type:
-            comp_filter_elem = cdav.CompFilter(comp_type)
-            if filter_list:
-                comp_filter_elem += filter_list
-            vcalendar += comp_filter_elem
-        elif filter_list:
-            vcalendar += filter_list
-
-        root = cdav.CalendarQuery() + [prop, cdav.Filter() + vcalendar]
-        return (
-            etree.tostring(root.xmlelement(), encoding="utf-8", xml_declaration=True),
-            comp_type,
-        )
+        start_ = cdav._to_utc_date_string(start) if start else None
+        end_ = cdav._to_utc_date_string(end) if end else None
+        if props or filters:
+            root = _calendar_query_tree(start_, end_, expand, comp_type, props, filters)
+            return (_tostring(root), comp_type)
+        template = _calendar_query_template(expand, comp_type, bool(start), bool(end))
+        values = [v for v in (start_, end_) if v]
+        if expand:
+            values = values + values
+        return (template.render(*values), comp_type)
 
     @staticmethod
     def _build_calendar_multiget_body(
         hrefs: list[str],
         include_data: bool = True,
+        include_etag: bool = False,
     ) -> bytes:
-        """Build calendar-multiget REPORT request body."""
-        elements: list[BaseElement] = []
-        if include_data:
-            elements.append(dav.Prop() + cdav.CalendarData())
-        for href in hrefs:
-            elements.append(dav.Href(href))
-        multiget = cdav.CalendarMultiGet() + elements
-        return etree.tostring(multiget.xmlelement(), encoding="utf-8", xml_declaration=True)
+        """Build calendar-multiget REPORT request body.
+
+        The body is rendered from a template.
+        """
+        if not hrefs:
+            return _tostring(_calendar_multiget_tree([], include_data, include_etag))
+        return _calendar_multiget_template(include_data, include_etag).render_list(list(hrefs))
 
     @staticmethod
     def _build_sync_collection_body(
@@ -356,19 +450,14 @@ class BaseDAVClient(ABC):
         props: list[str] | None = None,
         sync_level: str = "1",
     ) -> bytes:
-        """Build sync-collection REPORT request body."""
-        elements: list[BaseElement] = [
-            dav.SyncToken(value=sync_token or ""),
-            dav.SyncLevel(value=sync_level),
-        ]
-        if props:
-            prop_elements = [e for name in props if (e := _prop_name_to_element(name)) is not None]
-            if prop_elements:
-                elements.append(dav.Prop() + prop_elements)
-        else:
-            elements.append(dav.Prop() + [dav.GetEtag(), cdav.CalendarData()])
-        sync_collection = dav.SyncCollection() + elements
-        return etree.tostring(sync_collection.xmlelement(), encoding="utf-8", xml_declaration=True)
+        """Build sync-collection REPORT request body.
+
+        The body is rendered from a template.
+        """
+        template = _sync_collection_template(
+            bool(sync_token), tuple(props) if props else None, sync_level
+        )
+        return template.render(sync_token) if sync_token else template.render()
 
     @staticmethod
     def _build_mkcalendar_body(
@@ -717,6 +806,7 @@ def get_calendars(
     environment: bool = True,
     name: str | None = None,
     raise_errors: bool = False,
+    max_concurrency: int = GET_CALENDARS_MAX_CONCURRENCY,
     **config_data,
 ) -> CalendarCollection:
     """
@@ -746,6 +836,10 @@ def get_calendars(
     Function-level ``calendar_name`` / ``calendar_url`` arguments override
     per-section values when provided.
 
+    Up to ``max_concurrency`` servers are contacted simultaneously, in
+    worker threads.  The calendars are collected server by server, in
+    the order the servers respond.
+
     The returned :class:`CalendarCollection` is a list that can be used as a
     context manager; on exit **all** underlying connections are closed.
 
@@ -761,6 +855,7 @@ def get_calendars(
         environment: Whether to read from environment variables (default: True).
         name: Name of test server to use (for testconfig).
         raise_errors: If True, raise exceptions on errors; if False, log and skip.
+        max_concurrency: Max number of servers to contact simultaneously.
         **config_data: Explicit connection parameters (url, username, password, …).
 
     Returns:
@@ -830,6 +925,7 @@ def get_calendars(
 
     all_calendars: list = []
     all_clients: list = []
+    jobs: list = []
 
     for params in all_params:
         # Per-section calendar filters — function-level args override them
@@ -840,10 +936,30 @@ def get_calendars(
 
         conn_params = {k: v for k, v in params.items() if k in CONNKEYS}
         c = client_class(**conn_params)
-        section_cals = _fetch_calendars_for_client(c, eff_cal_url, eff_cal_name, raise_errors)
-        all_calendars.extend(section_cals)
+        jobs.append((c, eff_cal_url, eff_cal_name, raise_errors))
         all_clients.append(c)
 
+    ## Connecting, finding the principal and listing the calendars
+    ## takes some round trips per server - the servers are probed
+    ## concurrently.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    failure = None
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(jobs)))) as pool:
+        try:
+            futures = [pool.submit(_fetch_calendars_for_client, *job) for job in jobs]
+            for future in as_completed(futures):
+                all_calendars.extend(future.result())
+        except Exception as e:
+            ## The probes still waiting for a worker are not started
+            pool.shutdown(cancel_futures=True)
+            failure = e
+
+    if failure is not None:
+        ## The clients are closed after the probes in progress are done with them
+        CalendarCollection(clients=all_clients).close()
+        raise failure
+
     return CalendarCollection(all_calendars, clients=all_clients)
 
 
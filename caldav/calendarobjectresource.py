@@ -29,7 +29,7 @@ if TYPE_CHECKING:
 
     from .davclient import DAVClient
 
-from collections.abc import Callable, Container, Coroutine
+from collections.abc import Callable, Container, Coroutine, Iterator
 from typing import Literal
 
 if sys.version_info < (3, 11):
@@ -47,6 +47,7 @@ from .lib import error, vcal
 from .lib.error import errmsg
 from .lib.python_utilities import to_normal_str, to_unicode, to_wire
 from .lib.url import URL
+from .lib.validationcache import ValidationCache
 
 log = logging.getLogger("caldav")
 
@@ -96,13 +97,37 @@ class CalendarObjectResource(DAVObject):
 
     _ENDPARAM = None
 
-    _vobject_instance = None
-    _icalendar_instance = None
-    _data = None
+    ## See DAVObject.__slots__.  Those are initialized in __init__.
+    __slots__ = (
+        "_vobject_instance",
+        "_icalendar_instance",
+        "_data",
+        "_state",
+        "_borrowed",
+        "_partial_fields",
+        "_shared",
+        "_etag_state",
+    )
+
+    _vobject_instance: Optional["vobject.base.Component"]
+    _icalendar_instance: icalendar.Calendar | None
+    _data: Any
 
     # New state management (issue #613)
-    _state: DataState | None = None
-    _borrowed: bool = False
+    _state: DataState | None
+    _borrowed: bool
+
+    ## The iCalendar properties fetched, for objects from search(fields=...)
+    _partial_fields: frozenset | None
+
+    ## The icalendar instance shares timezones and property values with
+    ## other objects (occurrences from an expanded search)
+    _shared: bool
+
+    ## The state holding the data as it came from the server, together
+    ## with the etag in props.  The data is untouched as long as it is
+    ## still the current state.
+    _etag_state: DataState | None
 
     # Schedule tag (ref https://github.com/python-caldav/caldav/issues/660 and docs/design/TODO-SCHEDULE.md)
     @property
@@ -153,6 +178,14 @@ class CalendarObjectResource(DAVObject):
         CalendarObjectResource has an additional parameter for its constructor:
          * data = "...", vCal data for the event
         """
+        self._vobject_instance = None
+        self._icalendar_instance = None
+        self._data = None
+        self._state = None
+        self._borrowed = False
+        self._partial_fields = None
+        self._shared = False
+        self._etag_state = None
         super().__init__(client=client, url=url, parent=parent, id=id, props=props)
         if data is not None:
             self.data = data
@@ -162,6 +195,8 @@ class CalendarObjectResource(DAVObject):
                 # Clear raw data and update state to use the modified icalendar instance
                 self._data = None
                 self._state = IcalendarState(self._icalendar_instance)
+            elif self.etag:
+                self._etag_state = self._ensure_state()
 
     def set_end(self, end, move_dtstart=False):
         """The RFC specifies that a VEVENT/VTODO cannot have both
@@ -297,11 +332,19 @@ class CalendarObjectResource(DAVObject):
             stacklevel=2,
         )
 
-        import recurring_ical_events
+        from caldav.lib.recurrence import expand_recurrence_set
+
+        recurrings = expand_recurrence_set(
+            [x for x in self.icalendar_instance.subcomponents if x.name != "VTIMEZONE"],
+            start,
+            end,
+        )
+        if recurrings is None:
+            import recurring_ical_events
 
-        recurrings = recurring_ical_events.of(
-            self.icalendar_instance, components=["VJOURNAL", "VTODO", "VEVENT"]
-        ).between(start, end)
+            recurrings = recurring_ical_events.of(
+                self.icalendar_instance, components=["VJOURNAL", "VTODO", "VEVENT"]
+            ).between(start, end)
 
         recurrence_properties = {"exdate", "exrule", "rdate", "rrule"}
 
@@ -363,6 +406,7 @@ class CalendarObjectResource(DAVObject):
 
     def _add_relation_to_ical(self, uid, reltype) -> None:
         """Add a RELATED-TO property to the icalendar component (no-op if already present)."""
+        self._unshare()
         existing_relation = self.icalendar_component.get("related-to", None)
         existing_relations = (
             existing_relation if isinstance(existing_relation, list) else [existing_relation]
@@ -731,6 +775,7 @@ class CalendarObjectResource(DAVObject):
             attendee_obj = vCalAddress()
 
         ## TODO: if possible, check that the attendee exists
+        self._unshare()
         ievent = self.icalendar_component
         existing = ievent.get("attendee", [])
         if isinstance(existing, str):
@@ -932,6 +977,44 @@ class CalendarObjectResource(DAVObject):
             obj.url = self.url
         return obj
 
+    def _expanded_occurrence(self, component: icalendar.cal.Component, timezones: list) -> Self:
+        """
+        An object holding one occurrence from an expansion of this
+        object, as returned by searches with ``split_expanded``.
+
+        Unlike ``self.copy(keep_uid=True)``, the calendar data isn't
+        serialized and parsed again for every occurrence.  The calendar
+        properties, the timezones and the property values are shared
+        with this object and the other occurrences, and the object
+        takes a full copy of its own before it's edited in place (see
+        :meth:`_unshare`).  Repeated properties (i.e. ATTENDEE) are
+        held in lists, which ``Component.add()`` appends to - those
+        lists are copied.
+        """
+        obj = self.__class__(parent=self.parent)
+        obj.url = self.url
+        cal = icalendar.Calendar(self.icalendar_instance)
+        cal.subcomponents = [*timezones, component]
+        for comp in (cal, component):
+            for key, value in list(comp.items()):
+                if isinstance(value, list):
+                    comp[key] = list(value)
+        obj._set_icalendar_instance(cal)
+        obj._shared = True
+        return obj
+
+    def _unshare(self) -> None:
+        """
+        Replaces a shared icalendar instance (see
+        :meth:`_expanded_occurrence`) with a deep copy, so that property
+        parameters, alarms and timezones can be modified without
+        affecting the other occurrences.  Replacing, adding or removing
+        properties does not need this, the component and the lists of
+        repeated properties are not shared.
+        """
+        if self._shared:
+            self._set_icalendar_instance(self._icalendar_instance.copy(recursive=True))
+
     ## TODO: move get-logics to a load_by_get method.
     ## The load method should deal with "server quirks".
     def load(self, only_if_unloaded: bool = False) -> "Self | Coroutine[Any, Any, Self]":
@@ -968,10 +1051,13 @@ class CalendarObjectResource(DAVObject):
         if self.client is None:
             raise ValueError("Unexpected value None for self.client")
 
+        cached = self._validation_cache_entry()
         try:
-            r = self.client.request(str(self.url))
+            r = self.client.request(str(self.url), **self._validation_headers(cached))
             if r.status and r.status == 404:
                 raise error.NotFoundError(errmsg(r))
+            if r.status == 304 and cached:
+                return self._post_not_modified(cached)
             self.data = r.raw  # type: ignore
         except error.NotFoundError:
             # Only attempt fallbacks if the object was previously loaded
@@ -1000,12 +1086,7 @@ class CalendarObjectResource(DAVObject):
         except Exception:
             return self.load_by_multiget()
 
-        ## consider refactoring - this is repeated many places now
-        if "Etag" in r.headers:
-            self.props[dav.GetEtag.tag] = r.headers["Etag"]
-        if "Schedule-Tag" in r.headers:
-            self.props[cdav.ScheduleTag.tag] = r.headers["Schedule-Tag"]
-        return self
+        return self._post_load(r)
 
     async def _async_load(self, only_if_unloaded: bool = False) -> Self:
         """Async implementation of load."""
@@ -1017,10 +1098,13 @@ class CalendarObjectResource(DAVObject):
         if self.client is None:
             raise ValueError("Unexpected value None for self.client")
 
+        cached = self._validation_cache_entry()
         try:
-            r = await self.client.request(str(self.url))
+            r = await self.client.request(str(self.url), **self._validation_headers(cached))
             if r.status and r.status == 404:
                 raise error.NotFoundError(errmsg(r))
+            if r.status == 304 and cached:
+                return self._post_not_modified(cached)
             self.data = r.raw  # type: ignore
         except error.NotFoundError:
             uid = self.id
@@ -1046,12 +1130,69 @@ class CalendarObjectResource(DAVObject):
         except Exception:
             return await self.load_by_multiget()
 
+        return self._post_load(r)
+
+    def _post_load(self, r) -> Self:
+        """Post-processing shared by load and _async_load (no I/O)."""
+        ## consider refactoring - this is repeated many places now
         if "Etag" in r.headers:
             self.props[dav.GetEtag.tag] = r.headers["Etag"]
+            cache = getattr(self.client, "validation_cache", None)
+            if isinstance(cache, ValidationCache):
+                cache.put(str(self.url.canonical()), r.headers["Etag"], self._data)
         if "Schedule-Tag" in r.headers:
             self.props[cdav.ScheduleTag.tag] = r.headers["Schedule-Tag"]
         return self
 
+    def _validation_cache_entry(self) -> tuple[str, str | None] | None:
+        """
+        The ``(etag, data)`` last loaded from the object URL, if the
+        client has a validation cache.  If the URL is not in the cache,
+        but the object holds the data it got together with its etag
+        (i.e. from a search or a sync) and the data hasn't been touched
+        since, ``(etag, None)`` is returned - meaning the object data is
+        to be kept as it is on 304 Not Modified.
+
+        Partial objects (from ``search(fields=...)``) are always loaded
+        in full.
+        """
+        cache = getattr(self.client, "validation_cache", None)
+        if not isinstance(cache, ValidationCache) or self._partial_fields is not None:
+            return None
+        cached = cache.get(str(self.url.canonical()))
+        if (
+            cached is None
+            and self.etag
+            and isinstance(self._state, RawDataState)
+            and self._state is self._etag_state
+            and self.is_loaded()
+        ):
+            cached = (self.etag, None)
+        return cached
+
+    @staticmethod
+    def _validation_headers(cached: tuple[str, str | None] | None) -> dict:
+        ## Only pass headers when needed, the request method may be
+        ## replaced by something not taking them
+        return {"headers": {"If-None-Match": cached[0]}} if cached else {}
+
+    def _post_not_modified(self, cached: tuple[str, str | None]) -> Self:
+        """
+        The server responded 304 Not Modified to a conditional GET.  If
+        the object still holds the (unparsed) data from the cache, it's
+        kept as it is - otherwise the cached data is put back in place.
+        """
+        (etag, data) = cached
+        if data is not None and self._data is not data:
+            ## The cached data was passed through vcal.fix when loaded
+            self._data = data
+            self._partial_fields = None
+            self._vobject_instance = None
+            self._icalendar_instance = None
+            self._state = None
+        self.props[dav.GetEtag.tag] = etag
+        return self
+
     def load_by_multiget(self) -> "Self | Coroutine[Any, Any, Self]":
         """
         Some servers do not accept a GET, but we can still do a REPORT
@@ -1268,6 +1409,7 @@ class CalendarObjectResource(DAVObject):
             error.assert_(cnt == 1)
             return
 
+        self._unshare()
         ical_obj = self.icalendar_component
         attendee_lines = ical_obj["attendee"]
         if isinstance(attendee_lines, str):
@@ -1335,6 +1477,12 @@ class CalendarObjectResource(DAVObject):
         if not self.is_loaded():
             return self
 
+        if self._partial_fields is not None:
+            raise error.ConsistencyError(
+                "Refusing to save a partial object (from a search with fields), "
+                "as the missing properties would be lost.  Load the object first"
+            )
+
         # Delegate to async version for async clients (all logic that calls parent
         # collection methods must be async-aware to avoid getting unawaited coroutines)
         if self.is_async_client:
@@ -1380,8 +1528,6 @@ class CalendarObjectResource(DAVObject):
         if (
             only_this_recurrence is not False or all_recurrences
         ) and "RECURRENCE-ID" in self.icalendar_component:
-            from caldav.lib import error
-
             obj = get_self()
             if obj is None:
                 if only_this_recurrence is True:
@@ -1535,6 +1681,13 @@ class CalendarObjectResource(DAVObject):
         # Check if there's an actual component (not just empty VCALENDAR)
         return self._get_component_type_cheap() is not None
 
+    def is_partial(self) -> bool:
+        """Returns True if the object contains only some of the
+        iCalendar properties, as returned from ``search(fields=...)``.
+        Loading the object will fetch the full data.
+        """
+        return self._partial_fields is not None
+
     def has_component(self) -> bool:
         """
         Returns True if there exists a VEVENT, VTODO or VJOURNAL in the data.
@@ -1559,6 +1712,9 @@ class CalendarObjectResource(DAVObject):
         ## set it to a vobject object or an icalendar object, hence we should
         ## do type checking on the data (TODO: but should probably use
         ## isinstance rather than this kind of logic
+        self._partial_fields = None
+        self._shared = False
+        self._etag_state = None
         if type(data).__module__.startswith("vobject"):
             self._set_vobject_instance(data)
             return self
@@ -1570,9 +1726,32 @@ class CalendarObjectResource(DAVObject):
         self._data = vcal.fix(data)
         self._vobject_instance = None
         self._icalendar_instance = None
+        self._state = None
+        return self
+
+    def _set_raw_data(self, data: str | None):
+        """Like _set_data, but for icalendar text as received in a
+        REPORT response.  The text is kept as it is, and neither
+        vcal.fix nor any parsing is done until the data is needed.  The
+        UID and component type are still available through the cheap
+        accessors.
+        """
+        self._data = None
+        self._vobject_instance = None
+        self._icalendar_instance = None
+        self._partial_fields = None
+        self._shared = False
+        self._state = None if data is None else RawDataState(data, fixup=vcal.fix)
+        self._etag_state = self._state
         return self
 
+    def _load_deferred_data(self) -> None:
+        """Moves data set through _set_raw_data into self._data"""
+        if self._data is None and isinstance(self._state, RawDataState):
+            self._data = self._state.get_data()
+
     def _get_data(self):
+        self._load_deferred_data()
         if self._data:
             return to_normal_str(self._data)
         elif self._vobject_instance:
@@ -1582,6 +1761,7 @@ class CalendarObjectResource(DAVObject):
         return None
 
     def _get_wire_data(self):
+        self._load_deferred_data()
         if self._data:
             return to_wire(self._data)
         elif self._vobject_instance:
@@ -1603,6 +1783,7 @@ class CalendarObjectResource(DAVObject):
         self._vobject_instance = inst
         self._data = None
         self._icalendar_instance = None
+        self._shared = False
         # Keep _state in sync with _vobject_instance
         self._state = VobjectState(inst)
         return self
@@ -1676,6 +1857,7 @@ class CalendarObjectResource(DAVObject):
         self._icalendar_instance = inst
         self._data = None
         self._vobject_instance = None
+        self._shared = False
         # Keep _state in sync with _icalendar_instance
         self._state = IcalendarState(inst)
         return self
@@ -1791,6 +1973,7 @@ class CalendarObjectResource(DAVObject):
                 "Complete the current edit before starting another."
             )
 
+        self._unshare()
         state = self._ensure_state()
 
         # Switch to icalendar state if not already
@@ -1894,6 +2077,14 @@ class CalendarObjectResource(DAVObject):
         """
         return self._ensure_state().get_component_type()
 
+    def _scan_cheap(self, names) -> Iterator | None:
+        """Pick properties out of the raw data without parsing it.
+
+        See :func:`caldav.datastate.scan_components`.  Returns None if
+        the data has already been parsed.
+        """
+        return self._ensure_state().scan(names)
+
     def _has_data(self) -> bool:
         """Check if we have any data without triggering conversions."""
         return self._ensure_state().has_data()
@@ -10,10 +10,15 @@ There are also some Mailbox classes to deal with RFC6638.
 A SynchronizableCalendarObjectCollection contains a local copy of objects from a calendar on the server.
 """
 
+import asyncio
+import heapq
 import logging
+import re
+import threading
 import uuid
 import warnings
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from datetime import date as _date
 from datetime import datetime, timezone
 from time import sleep
@@ -28,7 +33,14 @@ if TYPE_CHECKING:
     from .davclient import DAVClient
     from .search import CalDAVSearcher
 
-from collections.abc import Coroutine, Iterable, Iterator, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Coroutine,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Sequence,
+)
 from typing import Literal
 
 from .base_client import ICALH
@@ -48,6 +60,19 @@ from .lib.url import URL
 _CC = TypeVar("_CC", bound="CalendarObjectResource")
 log = logging.getLogger("caldav")
 
+_COMPONENT_BEGIN_RE = re.compile(
+    r"^[ \t]*BEGIN:(VEVENT|VTODO|VJOURNAL|VFREEBUSY)[ \t\r]*$", re.MULTILINE
+)
+
+## Number of hrefs sent in each calendar-multiget REPORT when loading
+## many objects at once, and the number of such REPORTs the async
+## client keeps in flight simultaneously
+MULTIGET_CHUNK_SIZE = 100
+MULTIGET_MAX_CONCURRENCY = 4
+
+## Number of calendars searched simultaneously by Principal.search
+SEARCH_MAX_CONCURRENCY = 4
+
 
 # ---------------------------------------------------------------------------
 # Helpers for extracting calendar / principal info from PROPFIND results.
@@ -56,6 +81,55 @@ log = logging.getLogger("caldav")
 # ---------------------------------------------------------------------------
 
 
+def _multiget_too_big(e: Exception) -> bool:
+    """
+    Whether a failed calendar-multiget may succeed with fewer hrefs -
+    that is, the server responded 413 Payload Too Large, or the request
+    timed out.  (The timeout exceptions differ between the HTTP
+    libraries, hence the check on the class names)
+    """
+    if isinstance(e, error.DAVError):
+        return any(str(x).startswith("413") for x in (e.url, e.reason))
+    return isinstance(e, TimeoutError) or any("Timeout" in cls.__name__ for cls in type(e).__mro__)
+
+
+class FakeSyncTokenStore(MutableMapping):
+    """
+    Holds the href -> etag snapshots behind the latest fake sync
+    tokens of one calendar, see :meth:`Calendar.get_objects_by_sync_token`.
+    Only the ``maxsize`` most recently stored snapshots are kept.
+
+    Any other mutable mapping (like a :mod:`shelve`) may be assigned
+    to ``Calendar.fake_sync_token_store`` instead, i.e. to keep the
+    snapshots across restarts.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self.maxsize = maxsize
+        self._snapshots: OrderedDict[str, dict[str, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, token: str) -> dict[str, str | None]:
+        return self._snapshots[token]
+
+    def __setitem__(self, token: str, snapshot: dict[str, str | None]) -> None:
+        with self._lock:
+            self._snapshots[token] = snapshot
+            self._snapshots.move_to_end(token)
+            while len(self._snapshots) > self.maxsize:
+                self._snapshots.popitem(last=False)
+
+    def __delitem__(self, token: str) -> None:
+        with self._lock:
+            del self._snapshots[token]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._snapshots))
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
 @dataclass
 class CalendarInfo:
     """Data for a calendar extracted from a PROPFIND response."""
@@ -572,6 +646,155 @@ class Principal(DAVObject):
         """
         return self.get_calendars()
 
+    def search(
+        self,
+        calendars: Iterable["Calendar"] | None = None,
+        searcher: Optional["CalDAVSearcher"] = None,
+        server_expand: bool = False,
+        split_expanded: bool = True,
+        sort_reverse: bool = False,
+        props: list[cdav.CalendarData] | None = None,
+        post_filter=None,
+        max_concurrency: int = SEARCH_MAX_CONCURRENCY,
+        **searchargs,
+    ) -> "list[CalendarObjectResource] | Coroutine[Any, Any, list[CalendarObjectResource]]":
+        """Searches all the calendars of the principal (or the
+        ``calendars`` given) and returns the objects found.
+
+        The search parameters are the same as for
+        :meth:`Calendar.search`, alternatively a prepared
+        :class:`caldav.search.CalDAVSearcher` may be passed.  Up to
+        ``max_concurrency`` calendars are searched simultaneously (in
+        worker threads for the sync client, sharing the client), so
+        the time spent is about the time of the slowest calendar
+        rather than the sum.  If sort keys are given, the results from
+        the calendars are merged in sort order, otherwise the results
+        comes in the order of the calendars.
+
+        For async clients, returns a coroutine that must be awaited.
+        """
+        searcher = self._federated_searcher(searcher, searchargs, sort_reverse)
+        args = (server_expand, split_expanded, props, None, post_filter)
+        if self.is_async_client:
+            return self._async_search(calendars, searcher, args, max_concurrency)
+        return list(self._iter_federated_search(calendars, searcher, args, max_concurrency))
+
+    def iter_search(
+        self,
+        calendars: Iterable["Calendar"] | None = None,
+        searcher: Optional["CalDAVSearcher"] = None,
+        server_expand: bool = False,
+        split_expanded: bool = True,
+        sort_reverse: bool = False,
+        props: list[cdav.CalendarData] | None = None,
+        post_filter=None,
+        max_concurrency: int = SEARCH_MAX_CONCURRENCY,
+        **searchargs,
+    ) -> "Iterator[CalendarObjectResource] | AsyncIterator[CalendarObjectResource]":
+        """Like :meth:`search`, but yields the objects as soon as their
+        position in the merged result is known.  Without sort keys,
+        the objects from the first calendar are yielded as soon as it
+        has been searched, even if other calendars are still being
+        searched.
+
+        For async clients, an async iterator is returned.
+        """
+        searcher = self._federated_searcher(searcher, searchargs, sort_reverse)
+        args = (server_expand, split_expanded, props, None, post_filter)
+        if self.is_async_client:
+            return self._aiter_federated_search(calendars, searcher, args, max_concurrency)
+        return self._iter_federated_search(calendars, searcher, args, max_concurrency)
+
+    @staticmethod
+    def _federated_searcher(searcher, searchargs: dict, sort_reverse: bool) -> "CalDAVSearcher":
+        ## Late import to avoid cyclic imports
+        from .search import CalDAVSearcher
+
+        if searcher is None:
+            searcher = CalDAVSearcher()
+            assert isinstance(searchargs.get("expand", True), bool)
+            Calendar._populate_searcher(searcher, searchargs, sort_reverse)
+        elif searchargs:
+            raise error.ConsistencyError("search parameters given together with a searcher")
+        return searcher
+
+    @staticmethod
+    def _merge_results(searcher, results: list[list[Any]]) -> Iterator[Any]:
+        """k-way merge of per-calendar results, each sorted by the searcher"""
+        if searcher._sort_keys:
+            return heapq.merge(*results, key=searcher.sorting_value)
+        return (obj for result in results for obj in result)
+
+    def _iter_federated_search(
+        self, calendars, searcher, args: tuple, max_concurrency: int
+    ) -> Iterator[CalendarObjectResource]:
+        ## WARNING: async logic is duplicated in _aiter_federated_search — mirror any changes there
+        if calendars is None:
+            calendars = self.get_calendars()
+        calendars = list(calendars)
+        if not calendars:
+            return
+
+        def search_calendar(calendar):
+            ## Each search gets its own copy, as the searcher is
+            ## modified during the search
+            return replace(searcher).search(calendar, *args)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calendars)))) as pool:
+            futures = [pool.submit(search_calendar, calendar) for calendar in calendars]
+            try:
+                if searcher._sort_keys:
+                    ## All heads are needed before anything can be yielded
+                    results = [future.result() for future in futures]
+                    yield from self._merge_results(searcher, results)
+                else:
+                    for future in futures:
+                        yield from future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    async def _aiter_federated_search(
+        self, calendars, searcher, args: tuple, max_concurrency: int
+    ) -> AsyncIterator[CalendarObjectResource]:
+        ## WARNING: sync logic is duplicated in _iter_federated_search — mirror any changes there
+        if calendars is None:
+            calendars = await self.get_calendars()
+        calendars = list(calendars)
+        if not calendars:
+            return
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def search_calendar(calendar):
+            async with semaphore:
+                return await replace(searcher).async_search(calendar, *args)
+
+        tasks = [asyncio.ensure_future(search_calendar(calendar)) for calendar in calendars]
+        try:
+            if searcher._sort_keys:
+                results = list(await asyncio.gather(*tasks))
+                for obj in self._merge_results(searcher, results):
+                    yield obj
+            else:
+                for task in tasks:
+                    for obj in await task:
+                        yield obj
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _async_search(
+        self, calendars, searcher, args: tuple, max_concurrency: int
+    ) -> list[CalendarObjectResource]:
+        return [
+            obj
+            async for obj in self._aiter_federated_search(
+                calendars, searcher, args, max_concurrency
+            )
+        ]
+
     ## TODO: we have code in lib.vcal for constructing icalendar objects,
     ## and from icalendar 7 there is also code in the icalendar library
     ## for this.  The cruft below for constructing the request should be
@@ -712,6 +935,30 @@ class Calendar(DAVObject):
             client=client, url=url, parent=parent, id=id, props=props, name=name, **extra
         )
 
+    def _fake_sync_token_stores(self) -> dict:
+        stores = getattr(self.client, "fake_sync_token_stores", None)
+        if not isinstance(stores, dict):
+            stores = self.__dict__.setdefault("fake_sync_token_stores", {})
+        return stores
+
+    @property
+    def fake_sync_token_store(self) -> MutableMapping:
+        """
+        The snapshots behind the fake sync tokens of this calendar.  Every
+        calendar has a store of its own, kept by the client, so that it
+        outlives the Calendar object and isn't shared between accounts.
+        """
+        stores = self._fake_sync_token_stores()
+        key = str(self.url.canonical())
+        store = stores.get(key)
+        if store is None:
+            store = stores.setdefault(key, FakeSyncTokenStore())
+        return store
+
+    @fake_sync_token_store.setter
+    def fake_sync_token_store(self, store: MutableMapping) -> None:
+        self._fake_sync_token_stores()[str(self.url.canonical())] = store
+
     def _create(
         self, name=None, id=None, supported_calendar_component_set=None, method=None
     ) -> "None | Coroutine[Any, Any, None]":
@@ -1148,8 +1395,7 @@ class Calendar(DAVObject):
         if self.url is None:
             raise ValueError("Unexpected value None for self.url")
 
-        prop = dav.Prop() + cdav.CalendarData()
-        root = cdav.CalendarMultiGet() + prop + [dav.Href(value=u.path) for u in event_urls]
+        root = self.client._build_calendar_multiget_body([u.path for u in event_urls])
         # RFC 4791 section 7.9: "the 'Depth' header MUST be ignored by the
         # server and SHOULD NOT be sent by the client" for calendar-multiget
         response = self._query(root, None, "report")
@@ -1169,21 +1415,132 @@ class Calendar(DAVObject):
                 self.client,
                 # Quote path to handle servers returning unencoded spaces (e.g., Zimbra)
                 url=self.url.join(quote(unquote(str(url)), safe="/:@")),
-                data=data,
                 parent=self,
-            )
+            )._set_raw_data(data)
             for url, data in results
         ]
 
-    def multiget(self, event_urls: Iterable[URL], raise_notfound: bool = False) -> Iterable[_CC]:
+    def multiget(
+        self,
+        event_urls: Iterable[URL],
+        raise_notfound: bool = False,
+        chunk_size: int | None = None,
+    ) -> Iterable[_CC]:
         """
         get multiple events' data
         TODO: Does it overlap the _request_report_build_resultlist method?
         @author mtorange@gmail.com (refactored by Tobias)
+
+        Big requests are split up in chunks, see :meth:`iter_multiget`.
         """
         if self.is_async_client:
-            return self._async_multiget_objects(event_urls, raise_notfound=raise_notfound)
-        return self._post_multiget(self._multiget(event_urls, raise_notfound=raise_notfound))
+            return self._async_multiget_objects(
+                event_urls, raise_notfound=raise_notfound, chunk_size=chunk_size
+            )
+        return list(
+            self.iter_multiget(event_urls, raise_notfound=raise_notfound, chunk_size=chunk_size)
+        )
+
+    def iter_multiget(
+        self,
+        event_urls: Iterable[URL],
+        raise_notfound: bool = False,
+        chunk_size: int | None = None,
+    ) -> "Iterator[_CC] | AsyncIterator[_CC]":
+        """
+        Like :meth:`multiget`, but yields the objects as the chunks
+        arrive from the server, rather than returning a list.
+
+        The hrefs are sent in calendar-multiget REPORTs with up to
+        ``chunk_size`` hrefs each.  The default is taken from the
+        ``multiget`` feature in the server compatibility hints, falling
+        back to MULTIGET_CHUNK_SIZE.  If the server answers 413 Payload
+        Too Large or the request times out, the chunk size is halved
+        and the chunk retried.  If the server supports HTTP/2
+        multiplexing, up to MULTIGET_MAX_CONCURRENCY chunks are sent
+        concurrently over the same connection.
+
+        The objects are yielded in the order of ``event_urls`` (as far
+        as the server returns them in order).  For async clients, an
+        async iterator is returned.
+
+        ## WARNING: async logic is duplicated in _async_iter_multiget — mirror any changes there
+        """
+        if self.is_async_client:
+            return self._async_iter_multiget(event_urls, raise_notfound, chunk_size)
+        return self._iter_multiget(event_urls, raise_notfound, chunk_size)
+
+    def _iter_multiget(
+        self, event_urls: Iterable[URL], raise_notfound: bool, chunk_size: int | None
+    ) -> Iterator[_CC]:
+        ## The chunk size is shared between the chunks, so that a
+        ## server rejecting a chunk size once will not see it again
+        size = [self._multiget_chunk_size(chunk_size)]
+
+        def multiget_chunk(chunk):
+            results = []
+            while chunk:
+                part = chunk[: size[0]]
+                try:
+                    results.extend(self._multiget(part, raise_notfound=raise_notfound))
+                except Exception as e:
+                    if len(part) == 1 or not _multiget_too_big(e):
+                        raise
+                    size[0] = min(size[0], len(part) // 2)
+                    log.info(f"calendar-multiget failed ({e}), retrying with {size[0]} hrefs")
+                    continue
+                chunk = chunk[len(part) :]
+            return results
+
+        for results in self._map_multiplexed(
+            multiget_chunk,
+            self._multiget_chunks(event_urls, size[0]),
+            MULTIGET_MAX_CONCURRENCY,
+        ):
+            yield from self._post_multiget(results)
+
+    async def _async_iter_multiget(
+        self, event_urls: Iterable[URL], raise_notfound: bool, chunk_size: int | None
+    ) -> AsyncIterator[_CC]:
+        ## WARNING: sync logic is duplicated in _iter_multiget — mirror any changes there
+        size = [self._multiget_chunk_size(chunk_size)]
+
+        async def multiget_chunk(chunk):
+            results = []
+            while chunk:
+                part = chunk[: size[0]]
+                try:
+                    results.extend(await self._async_multiget(part, raise_notfound=raise_notfound))
+                except Exception as e:
+                    if len(part) == 1 or not _multiget_too_big(e):
+                        raise
+                    size[0] = min(size[0], len(part) // 2)
+                    log.info(f"calendar-multiget failed ({e}), retrying with {size[0]} hrefs")
+                    continue
+                chunk = chunk[len(part) :]
+            return results
+
+        chunks = self._multiget_chunks(event_urls, size[0])
+        if self.client.features.is_supported("http.multiplexing"):
+            ## Keep up to MULTIGET_MAX_CONCURRENCY chunks in flight, but
+            ## yield them in order
+            pending: deque[asyncio.Task] = deque()
+            try:
+                for chunk in chunks:
+                    if len(pending) >= MULTIGET_MAX_CONCURRENCY:
+                        for obj in self._post_multiget(await pending.popleft()):
+                            yield obj
+                    pending.append(asyncio.ensure_future(multiget_chunk(chunk)))
+                while pending:
+                    for obj in self._post_multiget(await pending.popleft()):
+                        yield obj
+            finally:
+                for task in pending:
+                    task.cancel()
+        else:
+            for chunk in chunks:
+                for obj in self._post_multiget(await multiget_chunk(chunk)):
+                    yield obj
 
     async def _async_multiget(
         self, event_urls: Iterable[URL], raise_notfound: bool = False
@@ -1192,8 +1549,7 @@ class Calendar(DAVObject):
         if self.url is None:
             raise ValueError("Unexpected value None for self.url")
 
-        prop = dav.Prop() + cdav.CalendarData()
-        root = cdav.CalendarMultiGet() + prop + [dav.Href(value=u.path) for u in event_urls]
+        root = self.client._build_calendar_multiget_body([u.path for u in event_urls])
         response = await self._query(root, None, "report")
         results = response.expand_simple_props([cdav.CalendarData()])
         if raise_notfound:
@@ -1204,12 +1560,23 @@ class Calendar(DAVObject):
         return [(r, results[r][cdav.CalendarData.tag]) for r in results]
 
     async def _async_multiget_objects(
-        self, event_urls: Iterable[URL], raise_notfound: bool = False
+        self,
+        event_urls: Iterable[URL],
+        raise_notfound: bool = False,
+        chunk_size: int | None = None,
     ) -> list[_CC]:
         """Async version of multiget."""
-        return self._post_multiget(
-            await self._async_multiget(event_urls, raise_notfound=raise_notfound)
-        )
+        return [
+            obj async for obj in self._async_iter_multiget(event_urls, raise_notfound, chunk_size)
+        ]
+
+    def _multiget_chunk_size(self, chunk_size: int | None = None) -> int:
+        """The number of hrefs to send in each calendar-multiget REPORT"""
+        if chunk_size is None:
+            chunk_size = self.client.features.is_supported("multiget", dict).get(
+                "chunk_size", MULTIGET_CHUNK_SIZE
+            )
+        return max(1, chunk_size)
 
     def calendar_multiget(self, *largs, **kwargs):
         """
@@ -1220,6 +1587,192 @@ class Calendar(DAVObject):
         """
         return list(self.multiget(*largs, **kwargs))
 
+    def _load_objects(
+        self,
+        objects: Sequence["CalendarObjectResource"],
+        chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
+    ) -> "list[CalendarObjectResource] | Coroutine[Any, Any, list[CalendarObjectResource]]":
+        """
+        Load the data of many objects using calendar-multiget REPORTs
+        with up to ``chunk_size`` hrefs each, rather than doing one GET
+        per object.  The chunk size is found and adjusted the same way
+        as in :meth:`iter_multiget`.
+
+        Objects the multiget did not return any data for - or all
+        objects in a chunk where the REPORT failed - are loaded one by
+        one through :meth:`CalendarObjectResource.load`.  The async
+        client runs up to ``max_concurrency`` chunks simultaneously.
+        So does the sync client, through worker threads, if the server
+        supports HTTP/2 multiplexing.
+
+        Returns the objects that were not found on the server.
+
+        ## WARNING: async logic is duplicated in _async_load_objects — mirror any changes there
+        """
+        if self.is_async_client:
+            return self._async_load_objects(objects, chunk_size, max_concurrency)
+
+        ## Shared between the chunks, like in _iter_multiget
+        size = [self._multiget_chunk_size(chunk_size)]
+
+        def load_chunk(chunk):
+            chunk_gone = []
+            while chunk:
+                part = chunk[: size[0]]
+                try:
+                    response = self._query(self._multiget_etag_query(part), None, "report")
+                    (unloaded, gone) = self._post_load_objects(response, part)
+                except Exception as e:
+                    if len(part) > 1 and _multiget_too_big(e):
+                        size[0] = min(size[0], len(part) // 2)
+                        log.info(f"calendar-multiget failed ({e}), retrying with {size[0]} hrefs")
+                        continue
+                    if not isinstance(e, error.DAVError):
+                        raise
+                    log.info(
+                        f"calendar-multiget failed ({e}), loading {len(part)} objects one by one"
+                    )
+                    (unloaded, gone) = (part, [])
+                for obj in unloaded:
+                    try:
+                        obj.load()
+                    except error.NotFoundError:
+                        gone.append(obj)
+                chunk_gone += gone
+                chunk = chunk[len(part) :]
+            return chunk_gone
+
+        results = self._map_multiplexed(
+            load_chunk, self._multiget_chunks(objects, size[0]), max_concurrency
+        )
+        return [obj for chunk_gone in results for obj in chunk_gone]
+
+    def _map_multiplexed(self, func, items: list[Any], max_concurrency: int) -> Iterator[Any]:
+        """
+        Yields ``func(item)`` for each item, in order.  If the server
+        supports HTTP/2 multiplexing, up to ``max_concurrency`` calls are
+        run concurrently in worker threads, sharing the one connection of
+        the client session.  Without multiplexing, concurrent requests
+        would mean extra TCP connections, so the calls are done one by one.
+        """
+        if (
+            len(items) < 2
+            or max_concurrency < 2
+            or not self.client.features.is_supported("http.multiplexing")
+        ):
+            for item in items:
+                yield func(item)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        ## No more than max_concurrency results are held back at any
+        ## time, even if the consumer is slow
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as pool:
+            try:
+                for item in items:
+                    if len(pending) >= max_concurrency:
+                        yield pending.popleft().result()
+                    pending.append(pool.submit(func, item))
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def _async_load_objects(
+        self,
+        objects: Sequence["CalendarObjectResource"],
+        chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
+    ) -> list["CalendarObjectResource"]:
+        """Async implementation of _load_objects."""
+        ## WARNING: sync logic is duplicated in _load_objects — mirror any changes there
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        size = [self._multiget_chunk_size(chunk_size)]
+
+        async def load_chunk(chunk):
+            chunk_gone = []
+            async with semaphore:
+                while chunk:
+                    part = chunk[: size[0]]
+                    try:
+                        response = await self._query(
+                            self._multiget_etag_query(part), None, "report"
+                        )
+                        (unloaded, gone) = self._post_load_objects(response, part)
+                    except Exception as e:
+                        if len(part) > 1 and _multiget_too_big(e):
+                            size[0] = min(size[0], len(part) // 2)
+                            log.info(
+                                f"calendar-multiget failed ({e}), retrying with {size[0]} hrefs"
+                            )
+                            continue
+                        if not isinstance(e, error.DAVError):
+                            raise
+                        log.info(
+                            f"calendar-multiget failed ({e}), loading {len(part)} objects one by one"
+                        )
+                        (unloaded, gone) = (part, [])
+                    for obj in unloaded:
+                        try:
+                            await obj.load()
+                        except error.NotFoundError:
+                            gone.append(obj)
+                    chunk_gone += gone
+                    chunk = chunk[len(part) :]
+            return chunk_gone
+
+        results = await asyncio.gather(
+            *(load_chunk(chunk) for chunk in self._multiget_chunks(objects, size[0]))
+        )
+        return [obj for chunk_gone in results for obj in chunk_gone]
+
+    @staticmethod
+    def _multiget_chunks(objects: Sequence[Any], chunk_size: int) -> list[list[Any]]:
+        objects = list(objects)
+        chunk_size = max(1, chunk_size)
+        return [objects[i : i + chunk_size] for i in range(0, len(objects), chunk_size)]
+
+    def _multiget_etag_query(self, objects: Iterable["CalendarObjectResource"]):
+        ## Same as the query built in _multiget, but also asking for the
+        ## etag, as a GET would have given us that through the headers
+        return self.client._build_calendar_multiget_body(
+            [obj.url.path for obj in objects], include_etag=True
+        )
+
+    def _post_load_objects(
+        self, response, objects: Sequence["CalendarObjectResource"]
+    ) -> tuple[list["CalendarObjectResource"], list["CalendarObjectResource"]]:
+        """Pure post-processing for _load_objects (no I/O).
+
+        Copies data and etags from a multiget response into the objects.
+        Returns a tuple of the objects that got no data, and the objects
+        the server reported as not found.
+        """
+        by_url = {obj.url.canonical(): obj for obj in objects}
+        gone = []
+        results = response.expand_simple_props([dav.GetEtag(), cdav.CalendarData()])
+        for href, props in results.items():
+            # Quote path to handle servers returning unencoded spaces (e.g., Zimbra)
+            url = self.url.join(quote(unquote(str(href)), safe="/:@")).canonical()
+            obj = by_url.get(url)
+            if obj is None:
+                continue
+            status = response.statuses.get(href)
+            if status and "404" in status:
+                gone.append(by_url.pop(url))
+                continue
+            data = props.get(cdav.CalendarData.tag)
+            if not data:
+                continue
+            obj._set_raw_data(data)
+            if props.get(dav.GetEtag.tag):
+                obj.props[dav.GetEtag.tag] = props[dav.GetEtag.tag]
+            by_url.pop(url)
+        return (list(by_url.values()), gone)
+
     def date_search(
         self,
         start: datetime,
@@ -1298,34 +1851,71 @@ class Calendar(DAVObject):
         results = response.expand_simple_props(props_)
         for r in results:
             pdata = results[r]
-            if cdav.CalendarData.tag in pdata:
-                cdata = pdata.pop(cdav.CalendarData.tag)
-                comp_class_ = (
-                    self._calendar_comp_class_by_data(cdata) if comp_class is None else comp_class
-                )
-            else:
-                cdata = None
-            if comp_class_ is None:
-                ## no CalendarData fetched - which is normal i.e. when doing a sync-token report and only asking for the URLs
-                comp_class_ = CalendarObjectResource
-            url = URL(r)
-            if url.hostname is None:
-                # Quote when result is not a full URL
-                url = quote(r)
-            ## icloud hack - icloud returns the calendar URL as well as the calendar item URLs
-            if self.url.join(url) == self.url:
-                continue
-            matches.append(
-                comp_class_(
-                    self.client,
-                    url=self.url.join(url),
-                    data=cdata,
-                    parent=self,
-                    props=pdata,
-                )
-            )
+            cdata = pdata.pop(cdav.CalendarData.tag, None)
+            obj = self._report_result_object(r, cdata, comp_class, pdata)
+            if obj is not None:
+                matches.append(obj)
         return (response, matches)
 
+    def _report_result_object(self, href, cdata, comp_class, pdata):
+        """Build the calendar object for one href found in a REPORT
+        response, or None if the href should be skipped."""
+        ## If no CalendarData was fetched (which is normal i.e. when doing a
+        ## sync-token report and only asking for the URLs), this gives the base class
+        comp_class_ = self._calendar_comp_class_by_data(cdata) if comp_class is None else comp_class
+        url = URL(href)
+        if url.hostname is None:
+            # Quote when result is not a full URL
+            url = quote(href)
+        ## icloud hack - icloud returns the calendar URL as well as the calendar item URLs
+        if self.url.join(url) == self.url:
+            return None
+        return comp_class_(
+            self.client,
+            url=self.url.join(url),
+            parent=self,
+            props=pdata,
+        )._set_raw_data(cdata)
+
+    def _request_report_iter_objects(
+        self, xml, comp_class=None
+    ) -> "Iterator[CalendarObjectResource] | Coroutine[Any, Any, AsyncIterator[CalendarObjectResource]]":
+        """
+        Like :meth:`_request_report_build_resultlist`, but the response
+        is streamed, and the objects are built one at a time as the
+        <response> elements are parsed.  Only the calendar data and
+        etag is collected.
+
+        The request itself is done before returning, so errors from the
+        server are raised immediately rather than on iteration.
+
+        For async clients, returns a coroutine giving an async iterator.
+        """
+        if self.is_async_client:
+            return self._async_request_report_iter_objects(xml, comp_class)
+        response = self._query(xml, 1, "report", stream=True)
+        return (
+            obj
+            for result in response.iter_calendar_query()
+            if (obj := self._calendar_query_result_object(result, comp_class)) is not None
+        )
+
+    async def _async_request_report_iter_objects(self, xml, comp_class=None):
+        """Async implementation of _request_report_iter_objects."""
+        response = await self._query(xml, 1, "report", stream=True)
+
+        async def _objects():
+            async for result in response.aiter_calendar_query():
+                obj = self._calendar_query_result_object(result, comp_class)
+                if obj is not None:
+                    yield obj
+
+        return _objects()
+
+    def _calendar_query_result_object(self, result, comp_class):
+        pdata = {dav.GetEtag.tag: result.etag} if result.etag else {}
+        return self._report_result_object(result.href, result.calendar_data, comp_class, pdata)
+
     def _request_report_build_resultlist(
         self, xml, comp_class=None, props=None, no_calendardata=False
     ) -> "tuple[Any, list[CalendarObjectResource]] | Coroutine[Any, Any, tuple[Any, list[CalendarObjectResource]]]":
@@ -1346,10 +1936,11 @@ class Calendar(DAVObject):
         response = await self._query(xml, 1, "report")
         return self._post_request_report_build_resultlist(response, comp_class, props_)
 
-    def _populate_searcher(self, my_searcher, searchargs: dict, sort_reverse: bool) -> None:
+    @staticmethod
+    def _populate_searcher(my_searcher, searchargs: dict, sort_reverse: bool) -> None:
         """Populate a CalDAVSearcher from a dict of search keyword arguments.
 
-        Shared by :meth:`searcher` and :meth:`search`.
+        Shared by :meth:`searcher`, :meth:`search` and :meth:`Principal.search`.
         """
         for key in searchargs:
             assert key[0] != "_"  ## not allowed
@@ -1536,6 +2127,55 @@ class Calendar(DAVObject):
             self, server_expand, split_expanded, props, xml, post_filter, _hacks
         )
 
+    def iter_search(
+        self,
+        xml: str = None,
+        server_expand: bool = False,
+        split_expanded: bool = True,
+        sort_reverse: bool = False,
+        props: list[cdav.CalendarData] | None = None,
+        filters=None,
+        post_filter=None,
+        _hacks=None,
+        **searchargs,
+    ) -> "Iterator[_CC] | AsyncIterator[_CC]":
+        """Like :meth:`search`, but yields the objects one by one as they
+        are parsed from the server response, rather than returning a list.
+
+        Useful for exports and other jobs running over large calendars,
+        as neither the time until the first object nor the memory usage
+        will grow with the size of the calendar.  (This does not hold if
+        ``sort_keys`` is given, as all objects then need to be fetched
+        before sorting, nor for some of the server compatibility
+        workarounds that needs several queries to be sent.)
+
+        For async clients, an async iterator is returned::
+
+            async for event in calendar.iter_search(event=True):
+                ...
+
+        See :meth:`search` for the parameters.
+        """
+        ## Late import to avoid cyclic imports
+        from .search import CalDAVSearcher
+
+        ## WARNING: this mirrors the parameter handling in search()
+        assert isinstance(searchargs.get("expand", True), bool)
+        my_searcher = CalDAVSearcher()
+        self._populate_searcher(my_searcher, searchargs, sort_reverse)
+
+        if not xml and filters:
+            xml = filters
+
+        if self.is_async_client:
+            return my_searcher.aiter_search(
+                self, server_expand, split_expanded, props, xml, post_filter, _hacks
+            )
+
+        return my_searcher.iter_search(
+            self, server_expand, split_expanded, props, xml, post_filter, _hacks
+        )
+
     def freebusy_request(
         self, start: datetime, end: datetime
     ) -> "FreeBusy | Coroutine[Any, Any, FreeBusy]":
@@ -1608,16 +2248,16 @@ class Calendar(DAVObject):
             ## class it really is.  Assign the base class as for now.
             return CalendarObjectResource
         if hasattr(data, "split"):
-            for line in data.split("\n"):
-                line = line.strip()
-                if line == "BEGIN:VEVENT":
-                    return Event
-                if line == "BEGIN:VTODO":
-                    return Todo
-                if line == "BEGIN:VJOURNAL":
-                    return Journal
-                if line == "BEGIN:VFREEBUSY":
-                    return FreeBusy
+            ## Stops at the first component line, rather than splitting
+            ## the whole text into lines
+            match = _COMPONENT_BEGIN_RE.search(data)
+            if match:
+                return {
+                    "VEVENT": Event,
+                    "VTODO": Todo,
+                    "VJOURNAL": Journal,
+                    "VFREEBUSY": FreeBusy,
+                }[match.group(1)]
         elif hasattr(data, "subcomponents"):
             if not len(data.subcomponents):
                 return CalendarObjectResource
@@ -1834,11 +2474,69 @@ class Calendar(DAVObject):
         hash_value = hashlib.md5(combined.encode(), usedforsecurity=False).hexdigest()
         return f"fake-{hash_value}"
 
+    def _post_etag_objects(self, response) -> list["CalendarObjectResource"]:
+        """Pure post-processing of a depth-1 getetag PROPFIND (no I/O).
+
+        Returns the (unloaded) objects in the calendar, with the etags set.
+        """
+        objects = []
+        for href, props in response.expand_simple_props([dav.GetEtag()]).items():
+            obj = self._report_result_object(href, None, None, props)
+            if obj is not None:
+                objects.append(obj)
+        return objects
+
+    def _post_fake_sync(
+        self, all_objects: list["CalendarObjectResource"], sync_token: Any | None
+    ) -> tuple[list["CalendarObjectResource"], list["CalendarObjectResource"], str]:
+        """Pure post-processing for the fake sync token fallback (no I/O).
+
+        The href -> etag snapshot of the calendar is stored in
+        ``fake_sync_token_store`` under the new fake token.  If the
+        snapshot for the given ``sync_token`` is found in the store,
+        only the added and modified objects are returned, plus (unloaded)
+        objects for the deleted hrefs, like a real sync-collection REPORT
+        would do.  Otherwise all objects are returned.
+
+        Returns a tuple of the objects, the objects among them that
+        needs to be loaded if ``load_objects`` is set, and the new token.
+        """
+        snapshot = {str(obj.url.canonical()): obj.props.get(dav.GetEtag.tag) for obj in all_objects}
+        fake_sync_token = self._generate_fake_sync_token(all_objects)
+        self.fake_sync_token_store[fake_sync_token] = snapshot
+
+        objects = all_objects
+        if sync_token and isinstance(sync_token, str) and sync_token.startswith("fake-"):
+            old_snapshot = self.fake_sync_token_store.get(sync_token)
+            if sync_token == fake_sync_token:
+                objects = []
+            elif old_snapshot is not None:
+                objects = [
+                    obj
+                    for obj in all_objects
+                    if old_snapshot.get(str(obj.url.canonical()), False)
+                    != snapshot[str(obj.url.canonical())]
+                ]
+                objects += [
+                    self._report_result_object(url, None, None, {})
+                    for url in old_snapshot
+                    if url not in snapshot
+                ]
+            ## Without the old snapshot, we can't tell what has changed,
+            ## and all objects are returned (emulating a full sync)
+
+        unloaded = [
+            obj for obj in objects if str(obj.url.canonical()) in snapshot and not obj._has_data()
+        ]
+        return (objects, unloaded, fake_sync_token)
+
     def get_objects_by_sync_token(
         self,
         sync_token: Any | None = None,
         load_objects: bool = False,
         disable_fallback: bool = False,
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
     ) -> "SynchronizableCalendarObjectCollection | Coroutine[Any, Any, SynchronizableCalendarObjectCollection]":
         """get_objects_by_sync_token aka get_objects
 
@@ -1856,13 +2554,23 @@ class Calendar(DAVObject):
 
         If load_objects is set to True, the objects will be loaded -
         otherwise empty CalendarObjectResource objects will be returned.
+        The objects are loaded through calendar-multiget REPORTs holding
+        up to multiget_chunk_size hrefs each (by default as given by
+        the server compatibility hints, and halved if the server
+        rejects a chunk as too large, see :meth:`iter_multiget`),
+        falling back to one GET per object if the multiget fails.  With the async client, or if
+        the server supports HTTP/2 multiplexing, up to max_concurrency
+        such REPORTs are sent concurrently.
 
         This method will return a SynchronizableCalendarObjectCollection object, which is
         an iterable.
 
-        This method transparently falls back to retrieving all objects if the server
-        doesn't support sync tokens. The fallback behavior is identical from the user's
-        perspective, but less efficient as it transfers the entire calendar on each sync.
+        This method transparently falls back to emulating sync tokens if the server
+        doesn't support them.  The etags of all objects are then fetched through a
+        PROPFIND, and a "fake" sync token is made from them.  The href -> etag snapshot
+        behind the token is kept in ``fake_sync_token_store``, so that a later call
+        with the token can return only the added, changed and deleted objects.  If the
+        snapshot is not found (i.e. after a restart), all objects are returned.
 
         If disable_fallback is set to True, the method will raise an exception instead
         of falling back to retrieving all objects. This is useful for testing whether
@@ -1871,7 +2579,9 @@ class Calendar(DAVObject):
         if self.is_async_client:
             ## TODO: lots of code duplication here.  It's difficult, since there is a lot of
             ## forth and back between the client and the server in this method.
-            return self._async_get_objects_by_sync_token(sync_token, load_objects, disable_fallback)
+            return self._async_get_objects_by_sync_token(
+                sync_token, load_objects, disable_fallback, multiget_chunk_size, max_concurrency
+            )
 
         ## Check if we should attempt to use sync tokens
         ## (either server supports them, or we haven't checked yet, or this is a fake token)
@@ -1895,13 +2605,9 @@ class Calendar(DAVObject):
                 )
 
                 ## this is not quite right - the etag we've fetched can already be outdated
+                ## (objects not found have been deleted, they are still returned)
                 if load_objects:
-                    for obj in objects:
-                        try:
-                            obj.load()
-                        except error.NotFoundError:
-                            ## The object was deleted
-                            pass
+                    self._load_objects(objects, multiget_chunk_size, max_concurrency)
                 return SynchronizableCalendarObjectCollection(
                     calendar=self, objects=objects, sync_token=response.sync_token
                 )
@@ -1913,67 +2619,22 @@ class Calendar(DAVObject):
                 ## Fall through to fallback implementation
 
         ## FALLBACK: Server doesn't support sync tokens
-        ## Retrieve all objects and emulate sync token behavior
-        log.debug("Using fallback sync mechanism (retrieving all objects)")
-
-        ## Use search() to get all objects. search() will include CalendarData by default.
-        ## We can't avoid this in the fallback mechanism without significant refactoring.
-        all_objects = list(self.search())
-
-        ## Load objects if requested (objects may already have data from search)
+        ## Emulate sync token behavior by comparing etags
+        log.debug("Using fallback sync mechanism (comparing etags)")
+        try:
+            all_objects = self._post_etag_objects(self._query_properties([dav.GetEtag()], depth=1))
+        except Exception as e:
+            ## Retrieve all objects instead.  If the search does not give
+            ## etags, we'll fall back to URL-based tokens which can't
+            ## detect content changes, only additions/deletions
+            log.debug(f"Failed to fetch ETags for fallback sync ({e}), retrieving all objects")
+            all_objects = list(self.search())
+
+        (objects, unloaded, fake_sync_token) = self._post_fake_sync(all_objects, sync_token)
         if load_objects:
-            for obj in all_objects:
-                ## Only load if not already loaded
-                if not hasattr(obj, "_data") or obj._data is None:
-                    try:
-                        obj.load()
-                    except error.NotFoundError:
-                        pass
-
-        ## Fetch ETags for all objects if not already present
-        ## ETags are crucial for detecting changes in the fallback mechanism
-        if all_objects and (
-            not hasattr(all_objects[0], "props") or dav.GetEtag.tag not in all_objects[0].props
-        ):
-            ## Use PROPFIND to fetch ETags for all objects
-            try:
-                ## Do a depth-1 PROPFIND on the calendar to get all ETags
-                response = self._query_properties([dav.GetEtag()], depth=1)
-                etag_props = response.expand_simple_props([dav.GetEtag()])
-
-                ## Map ETags to objects by URL (using string keys for reliable comparison)
-                url_to_obj = {str(obj.url.canonical()): obj for obj in all_objects}
-                log.debug(f"Fallback: Fetching ETags for {len(url_to_obj)} objects")
-                for url_str, props in etag_props.items():
-                    canonical_url_str = str(self.url.join(url_str).canonical())
-                    if canonical_url_str in url_to_obj:
-                        if not hasattr(url_to_obj[canonical_url_str], "props"):
-                            url_to_obj[canonical_url_str].props = {}
-                        url_to_obj[canonical_url_str].props.update(props)
-                        log.debug(f"Fallback: Added ETag to {canonical_url_str}")
-            except Exception as e:
-                ## If fetching ETags fails, we'll fall back to URL-based tokens
-                ## which can't detect content changes, only additions/deletions
-                log.debug(f"Failed to fetch ETags for fallback sync: {e}")
-                pass
-
-        ## Generate a fake sync token based on current state
-        fake_sync_token = self._generate_fake_sync_token(all_objects)
-
-        ## If a sync_token was provided, check if anything has changed
-        if sync_token and isinstance(sync_token, str) and sync_token.startswith("fake-"):
-            ## Compare the provided token with the new token
-            if sync_token == fake_sync_token:
-                ## Nothing has changed, return empty collection
-                return SynchronizableCalendarObjectCollection(
-                    calendar=self, objects=[], sync_token=fake_sync_token
-                )
-            ## If tokens differ, return all objects (emulating a full sync)
-            ## In a real implementation, we'd return only changed objects,
-            ## but that requires storing previous state which we don't have
-
+            self._load_objects(unloaded, multiget_chunk_size, max_concurrency)
         return SynchronizableCalendarObjectCollection(
-            calendar=self, objects=all_objects, sync_token=fake_sync_token
+            calendar=self, objects=objects, sync_token=fake_sync_token
         )
 
     def objects_by_sync_token(
@@ -1994,6 +2655,8 @@ class Calendar(DAVObject):
         sync_token: Any | None = None,
         load_objects: bool = False,
         disable_fallback: bool = False,
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
     ) -> "SynchronizableCalendarObjectCollection":
         """Async implementation of get_objects_by_sync_token."""
 
@@ -2018,11 +2681,7 @@ class Calendar(DAVObject):
                     root, props=[dav.GetEtag()], no_calendardata=True
                 )
                 if load_objects:
-                    for obj in objects:
-                        try:
-                            await obj.load()
-                        except error.NotFoundError:
-                            pass
+                    await self._async_load_objects(objects, multiget_chunk_size, max_concurrency)
                 return SynchronizableCalendarObjectCollection(
                     calendar=self, objects=objects, sync_token=response.sync_token
                 )
@@ -2031,46 +2690,20 @@ class Calendar(DAVObject):
                     raise
                 log.info(f"Sync-collection REPORT failed ({e}), falling back to full retrieval")
 
-        log.debug("Using fallback sync mechanism (retrieving all objects)")
-
-        all_objects = list(await self.search())
+        log.debug("Using fallback sync mechanism (comparing etags)")
+        try:
+            all_objects = self._post_etag_objects(
+                await self._query_properties([dav.GetEtag()], depth=1)
+            )
+        except Exception as e:
+            log.debug(f"Failed to fetch ETags for fallback sync ({e}), retrieving all objects")
+            all_objects = list(await self.search())
 
+        (objects, unloaded, fake_sync_token) = self._post_fake_sync(all_objects, sync_token)
         if load_objects:
-            for obj in all_objects:
-                if not hasattr(obj, "_data") or obj._data is None:
-                    try:
-                        await obj.load()
-                    except error.NotFoundError:
-                        pass
-
-        if all_objects and (
-            not hasattr(all_objects[0], "props") or dav.GetEtag.tag not in all_objects[0].props
-        ):
-            try:
-                response = await self._query_properties([dav.GetEtag()], depth=1)
-                etag_props = response.expand_simple_props([dav.GetEtag()])
-                url_to_obj = {str(obj.url.canonical()): obj for obj in all_objects}
-                log.debug(f"Fallback: Fetching ETags for {len(url_to_obj)} objects")
-                for url_str, props in etag_props.items():
-                    canonical_url_str = str(self.url.join(url_str).canonical())
-                    if canonical_url_str in url_to_obj:
-                        if not hasattr(url_to_obj[canonical_url_str], "props"):
-                            url_to_obj[canonical_url_str].props = {}
-                        url_to_obj[canonical_url_str].props.update(props)
-                        log.debug(f"Fallback: Added ETag to {canonical_url_str}")
-            except Exception as e:
-                log.debug(f"Failed to fetch ETags for fallback sync: {e}")
-
-        fake_sync_token = self._generate_fake_sync_token(all_objects)
-
-        if sync_token and isinstance(sync_token, str) and sync_token.startswith("fake-"):
-            if sync_token == fake_sync_token:
-                return SynchronizableCalendarObjectCollection(
-                    calendar=self, objects=[], sync_token=fake_sync_token
-                )
-
+            await self._async_load_objects(unloaded, multiget_chunk_size, max_concurrency)
         return SynchronizableCalendarObjectCollection(
-            calendar=self, objects=all_objects, sync_token=fake_sync_token
+            calendar=self, objects=objects, sync_token=fake_sync_token
         )
 
     def get_journals(self) -> "list[Journal] | Coroutine[Any, Any, list[Journal]]":
@@ -2271,6 +2904,15 @@ class SynchronizableCalendarObjectCollection:
                 self._objects_by_url[obj.url.canonical()] = obj
         return self._objects_by_url
 
+    def _is_fake_token(self) -> bool:
+        return isinstance(self.sync_token, str) and self.sync_token.startswith("fake-")
+
+    def _snapshot(self) -> dict[str, str | None]:
+        """The href -> etag snapshot of the collection, see Calendar._post_fake_sync"""
+        return {
+            str(url): obj.props.get(dav.GetEtag.tag) for url, obj in self.objects_by_url().items()
+        }
+
     def _post_sync_fallback(
         self, current_by_url: dict, old_by_url: dict
     ) -> tuple[list[Any], list[Any]]:
@@ -2300,125 +2942,125 @@ class SynchronizableCalendarObjectCollection:
         self.sync_token = self.calendar._generate_fake_sync_token(self.objects)
         return (updated_objs, deleted_objs)
 
+    def _changed_objects(self, updates: Iterable[Any]) -> list[Any]:
+        """Pure pre-processing for the real-token sync path (no I/O).
+
+        Returns the objects from a sync-collection report whose etag
+        differs from the cached copy, and puts them into the cache.
+        """
+        obu = self.objects_by_url()
+        changed = []
+        for obj in updates:
+            obj.url = obj.url.canonical()
+            if (
+                obj.url in obu
+                and dav.GetEtag.tag in obu[obj.url].props
+                and dav.GetEtag.tag in obj.props
+            ):
+                if obu[obj.url].props[dav.GetEtag.tag] == obj.props[dav.GetEtag.tag]:
+                    continue
+            obu[obj.url] = obj
+            changed.append(obj)
+        return changed
+
+    def _post_sync_changes(
+        self, changed: list[Any], gone: list[Any], sync_token: Any
+    ) -> tuple[list[Any], list[Any]]:
+        """Pure post-processing for the real-token sync path (no I/O).
+
+        ``gone`` holds the objects among ``changed`` that could not be
+        loaded from the server, those are considered deleted.
+        """
+        obu = self.objects_by_url()
+        gone_ids = {id(obj) for obj in gone}
+        updated_objs: list[Any] = []
+        deleted_objs: list[Any] = []
+        for obj in changed:
+            if id(obj) in gone_ids:
+                deleted_objs.append(obj)
+                obu.pop(obj.url)
+            else:
+                updated_objs.append(obj)
+        self.objects = list(obu.values())
+        self._objects_by_url = None
+        self.sync_token = sync_token
+        return (updated_objs, deleted_objs)
+
     def sync(
         self,
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
     ) -> "tuple[Any, Any] | Coroutine[Any, Any, tuple[Any, Any]]":
         """Contact the server, fetch changes, and update the local collection.
 
+        Changed objects are loaded through calendar-multiget REPORTs of
+        up to ``multiget_chunk_size`` hrefs, see
+        :meth:`Calendar.get_objects_by_sync_token`.
+
         Falls back to comparing the full calendar state when the server does
         not support sync tokens.
 
         Returns a coroutine for async clients; call with ``await`` in that case.
         """
         if self.calendar.is_async_client:
-            return self._async_sync()
-
-        updated_objs: list[Any] = []
-        deleted_objs: list[Any] = []
-
-        ## Check if we're using fake sync tokens (fallback mode)
-        is_fake_token = isinstance(self.sync_token, str) and self.sync_token.startswith("fake-")
-
-        if not is_fake_token:
-            ## Try to use real sync tokens.
-            ## NOTE: the loop below mixes I/O (obj.load()) with data manipulation;
-            ## any changes here must be mirrored in _async_sync().
-            try:
-                updates = self.calendar.get_objects_by_sync_token(
-                    self.sync_token, load_objects=False
-                )
-
-                if isinstance(updates.sync_token, str) and updates.sync_token.startswith("fake-"):
-                    is_fake_token = True
-                else:
-                    obu = self.objects_by_url()
-                    for obj in updates:
-                        obj.url = obj.url.canonical()
-                        if (
-                            obj.url in obu
-                            and dav.GetEtag.tag in obu[obj.url].props
-                            and dav.GetEtag.tag in obj.props
-                        ):
-                            if obu[obj.url].props[dav.GetEtag.tag] == obj.props[dav.GetEtag.tag]:
-                                continue
-                        obu[obj.url] = obj
-                        try:
-                            obj.load()
-                            updated_objs.append(obj)
-                        except error.NotFoundError:
-                            deleted_objs.append(obj)
-                            obu.pop(obj.url)
-
-                    self.objects = list(obu.values())
-                    self._objects_by_url = None
-                    self.sync_token = updates.sync_token
-                    return (updated_objs, deleted_objs)
-            except (error.ReportError, error.DAVError):
-                is_fake_token = True
+            return self._async_sync(multiget_chunk_size, max_concurrency)
+
+        is_fake_token = self._is_fake_token()
+        if is_fake_token:
+            ## Make sure the fallback in get_objects_by_sync_token can
+            ## compute the changes since our snapshot of the calendar
+            self.calendar.fake_sync_token_store[self.sync_token] = self._snapshot()
+
+        ## NOTE: any changes here must be mirrored in _async_sync().
+        try:
+            updates = self.calendar.get_objects_by_sync_token(self.sync_token, load_objects=False)
+            ## If the server suddenly gives fake tokens, the updates
+            ## are not relative to our sync token
+            if is_fake_token or not updates._is_fake_token():
+                changed = self._changed_objects(updates)
+                gone = self.calendar._load_objects(changed, multiget_chunk_size, max_concurrency)
+                return self._post_sync_changes(changed, gone, updates.sync_token)
+        except (error.ReportError, error.DAVError):
+            pass
 
         ## FALLBACK: fetch all objects and compare
         log.debug("Using fallback sync mechanism (comparing all objects)")
         current_objects = list(self.calendar.search())
-        for obj in current_objects:
-            try:
-                obj.load()
-            except error.NotFoundError:
-                pass
+        self.calendar._load_objects(current_objects, multiget_chunk_size, max_concurrency)
         current_by_url = {obj.url.canonical(): obj for obj in current_objects}
         return self._post_sync_fallback(current_by_url, self.objects_by_url())
 
-    async def _async_sync(self) -> tuple[Any, Any]:
+    async def _async_sync(
+        self,
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
+    ) -> tuple[Any, Any]:
         """Async implementation of sync().
 
-        NOTE: the real-token loop mixes I/O (await obj.load()) with data
-        manipulation; any changes here must be mirrored in sync().
+        NOTE: any changes here must be mirrored in sync().
         """
-        updated_objs: list[Any] = []
-        deleted_objs: list[Any] = []
+        is_fake_token = self._is_fake_token()
+        if is_fake_token:
+            self.calendar.fake_sync_token_store[self.sync_token] = self._snapshot()
 
-        is_fake_token = isinstance(self.sync_token, str) and self.sync_token.startswith("fake-")
-
-        if not is_fake_token:
-            try:
-                updates = await self.calendar.get_objects_by_sync_token(
-                    self.sync_token, load_objects=False
+        try:
+            updates = await self.calendar.get_objects_by_sync_token(
+                self.sync_token, load_objects=False
+            )
+            if is_fake_token or not updates._is_fake_token():
+                changed = self._changed_objects(updates)
+                gone = await self.calendar._async_load_objects(
+                    changed, multiget_chunk_size, max_concurrency
                 )
-
-                if isinstance(updates.sync_token, str) and updates.sync_token.startswith("fake-"):
-                    is_fake_token = True
-                else:
-                    obu = self.objects_by_url()
-                    for obj in updates:
-                        obj.url = obj.url.canonical()
-                        if (
-                            obj.url in obu
-                            and dav.GetEtag.tag in obu[obj.url].props
-                            and dav.GetEtag.tag in obj.props
-                        ):
-                            if obu[obj.url].props[dav.GetEtag.tag] == obj.props[dav.GetEtag.tag]:
-                                continue
-                        obu[obj.url] = obj
-                        try:
-                            await obj.load()
-                            updated_objs.append(obj)
-                        except error.NotFoundError:
-                            deleted_objs.append(obj)
-                            obu.pop(obj.url)
-
-                    self.objects = list(obu.values())
-                    self._objects_by_url = None
-                    self.sync_token = updates.sync_token
-                    return (updated_objs, deleted_objs)
-            except (error.ReportError, error.DAVError):
-                is_fake_token = True
+                return self._post_sync_changes(changed, gone, updates.sync_token)
+        except (error.ReportError, error.DAVError):
+            pass
 
         ## FALLBACK: fetch all objects and compare
         log.debug("Using fallback sync mechanism (comparing all objects)")
         current_objects = list(await self.calendar.search())
-        for obj in current_objects:
-            try:
-                await obj.load()
-            except error.NotFoundError:
-                pass
+        await self.calendar._async_load_objects(
+            current_objects, multiget_chunk_size, max_concurrency
+        )
         current_by_url = {obj.url.canonical(): obj for obj in current_objects}
         return self._post_sync_fallback(current_by_url, self.objects_by_url())
@@ -0,0 +1,755 @@
+# fmt: off
+"""
+The compatibility profiles of the well-known servers, as dicts in the
+format accepted by :class:`caldav.compatibility_hints.FeatureSet`.
+
+Most applications never need those, so this module is only imported
+when a profile is looked up by name, i.e. ``features="synology"`` in the
+client configuration or ``caldav.compatibility_hints.synology``.
+"""
+
+## TODO: Lots of silly comments in the compatibility matrixes now as I
+## at one point managed to check out the wrong version of the
+## caldav_server_checker, and things got messy from there.  We should
+## double-check the values where there is any doubt, and clean up.
+
+#### OLD STYLE
+
+## THE LIST BELOW IS TO BE REMOVED COMPLETELY.  DO NOT USE IT.
+
+## It's not considered to be part of the public API (though, it should
+## have been prefixed with _ to make it clear).  The list is being
+## removed little-by-little, without regards of SemVer.
+
+## The lists below are specifying what tests should be skipped or
+## modified to accept non-conforming resultsets from the different
+## calendar servers.  In addition there are some hacks in the library
+## code itself to work around some known compatibility issues, like
+## the caldav.lib.vcal.fix function.
+## Here is a list of all observed (in)compatibility issues the test framework needs to know about
+## TODO:
+## * references to the relevant parts of the RFC would be nice.
+## * Research should be done to triple-check that the issue is on the server side, and not on the client side
+## * Some of the things below should be possible to probe the server for.
+## * Perhaps some more readable format should be considered (yaml?).
+## * Consider how to get this into the documentation
+incompatibility_description = {
+    'calendar_order':
+        """Server supports (nonstandard) calendar ordering property""",
+
+    'calendar_color':
+        """Server supports (nonstandard) calendar color property""",
+
+    'duplicates_not_allowed':
+        """Duplication of an event in the same calendar not allowed """
+        """(even with different uid)""",
+
+
+    'event_by_url_is_broken':
+        """A GET towards a valid calendar object resource URL will yield 404 (wtf?)""",
+
+    'propfind_allprop_failure':
+        """The propfind test fails ... """
+        """it asserts DAV:allprop response contains the text 'resourcetype', """
+        """possibly this assert is wrong""",
+
+    'vtodo_datesearch_nodtstart_task_is_skipped':
+        """date searches for todo-items will not find tasks without a dtstart""",
+
+    'vtodo_datesearch_nodtstart_task_is_skipped_in_closed_date_range':
+        """only open-ended date searches for todo-items will find tasks without a dtstart""",
+
+    'vtodo_datesearch_notime_task_is_skipped':
+        """date searches for todo-items will (only) find tasks that has either """
+        """a dtstart or due set""",
+
+    'vtodo_no_due_infinite_duration':
+        """date search will find todo-items without due if dtstart is """
+        """before the date search interval.  This is in breach of rfc4791"""
+        """section 9.9""",
+
+    'vtodo-cannot-be-uncompleted':
+        """If a VTODO object has been set with STATUS:COMPLETE, it's not possible to delete the COMPLTEDED attribute and change back to STATUS:IN-ACTION""",
+
+    'sticky_events':
+        """Events should be deleted before the calendar is deleted, """
+        """and/or deleting a calendar may not have immediate effect""",
+
+    'no_overwrite':
+        """events cannot be edited""",
+
+    'dav_not_supported':
+        """when asked, the server may claim it doesn't support the DAV protocol.  Observed by one baikal server, should be investigated more (TODO) and robur""",
+
+   'fastmail_buggy_noexpand_date_search':
+        """The 'blissful anniversary' recurrent example event is returned when asked for a no-expand date search for some timestamps covering a completely different date""",
+
+    'non_existing_raises_other':
+        """Robur raises AuthorizationError when trying to access a non-existing resource (while 404 is expected).  Probably so one shouldn't probe a public name space?""",
+
+    'robur_rrule_freq_yearly_expands_monthly':
+        """Robur expands a yearly event into a monthly event.  I believe I've reported this one upstream at some point, but can't find back to it""",
+
+}
+
+xandikos = {
+    ## Principal property search returns 403 (not implemented)
+    "principal-search": "ungraceful",
+
+    ## VTODO RRULE expansion was fixed in xandikos PR #627 (released in 0.3.7).
+    ## Exception expansion (CALDAV:expand with EXDATE/RECURRENCE-ID) is now also supported.
+
+    ## this only applies for very simple installations
+    "auto-connect.url": {"domain": "localhost", "scheme": "http", "basepath": "/"},
+
+    "scheduling": {"support": "unsupported"},
+}
+
+## This seems to work as of version 3.5.4 of Radicale.
+## There is much development going on at Radicale as of summar 2025,
+## so I'm expecting this list to shrink a lot soon.
+radicale = {
+    "search.is-not-defined": {"support": "full"},
+    "search.text.case-sensitive": {"support": "unsupported"},
+    "search.recurrences.includes-implicit.todo.pending": {"support": "fragile", "behaviour": "inconsistent results between runs"},
+    "search.recurrences.expanded.todo": {"support": "unsupported"},
+    "search.recurrences.expanded.exception": {"support": "full"},
+    "principal-search": {"support": "unsupported"},
+    ## this only applies for very simple installations
+    "auto-connect.url": {"domain": "localhost", "scheme": "http", "basepath": "/"},
+    "scheduling": {"support": "unsupported"},
+    'old_flags': [
+    ## extra features not specified in RFC4791
+    "calendar_order",
+    "calendar_color"
+    ]
+}
+
+## Be aware that nextcloud by default have different rate limits, including how often a user is allowed to create a new calendar.  This may break test runs badly.
+nextcloud = {
+    'auto-connect.url': {
+        'basepath': '/remote.php/dav',
+    },
+    ## I'm surprised, I'm quite sure this was reported ungraceful earlier.  Passed with caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad 2026-02-15.  The commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad was however development done on the wrong branch and has been force-pushed awway.  It was again observed ungraceful at commits be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492
+    'search.comp-type.optional': {'support': 'ungraceful'},
+    'search.recurrences.expanded.todo': {'support': 'unsupported'},
+    "search.recurrences.includes-implicit.infinite-scope": False,
+    'delete-calendar': {
+        'support': 'fragile',
+        'behaviour': 'Deleting a recently created calendar fails'},
+    'delete-calendar.free-namespace': { ## TODO: not caught by server-tester
+        'behaviour': "deleting a calendar moves it to a trashbin, thrashbin has to be manually 'emptied' from the web-ui before the namespace is freed up",
+        'support': 'fragile',
+    },
+    # Calendar deletion goes to trashbin so delete-and-recreate doesn't give a
+    # fresh empty calendar.  Wipe objects instead of deleting the calendar itself.
+    "test-calendar": {"cleanup-regime": "wipe-calendar"},
+    'search.recurrences.includes-implicit.todo': {'support': 'unsupported'},
+    #'save-load.todo.mixed-calendar': {'support': 'unsupported'}, ## Why?  It started complaining about this just recently.
+    'principal-search.by-name.self': {'support': 'unsupported'},
+    'principal-search': {'support': 'ungraceful'},
+    'search.time-range.open.start.duration': 'broken',
+    ## I'm surprised, I'm quite sure this was passing earlier.  Caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad
+    'search.combined-is-logical-and': False,
+    ## Observed with Nextcloud 33: server delivers iTIP notification to the inbox AND
+    ## auto-schedules into the attendee's calendar.
+    'scheduling.schedule-tag': False,
+}
+
+## TODO: Latest - mismatch between config and test script in delete-calendar.free-namespace ... and create-calendar.set-displayname?
+ecloud = nextcloud | {
+    #'search.is-not-defined': {'support': 'unsupported'}, ## observed to work at 4bc0de765a2b53e6f223e0b9ac51c653bac11fb7 (caldav) / 3cae24cf99da1702b851b5a74a9b88c8e5317dad (server checker)
+    #'search.text.case-sensitive': {'support': 'unsupported'}, ## observed to work at 4bc0de765a2b53e6f223e0b9ac51c653bac11fb7 (caldav) / 3cae24cf99da1702b851b5a74a9b88c8e5317dad (server checker)
+    ## TODO: this applies only to test runs, not to ordinary usage
+    'rate-limit': {
+        'enable': True,
+        'interval': 2,
+        'count': 1,
+        'default_sleep': 4,
+        'max_sleep': 120,
+        'description': "It's needed to manually empty trashbin frequently when running tests.  Since this operation takes some time and/or there are some caches, it's needed to run tests slowly, even when hammering the 'empty thrashbin' frequently",
+    },
+    'auto-connect.url': {
+        'basepath': '/remote.php/dav',
+        'domain': 'ecloud.global',
+        'scheme': 'https',
+    },
+}
+
+## Zimbra is not very good at it's caldav support
+zimbra = {
+    'auto-connect.url': {'basepath': '/dav/'},
+    'delete-calendar': {'support': 'fragile', 'behaviour': 'may move to trashbin instead of deleting immediately'},
+    ## This is a zimbra bug when creating calendars with a display
+    ## name.  Now mitigated in the calendar creation code.
+    #'save-load.get-by-url': {'support': 'fragile', 'behaviour': '404 most of the time - but sometimes 200.  Weird, should be investigated more'},
+    ## Zimbra treats same-UID events across calendars as aliases of the same event
+    'save.duplicate-uid.cross-calendar': {'support': 'unsupported'},
+    'create-calendar.set-displayname': {'support': 'unsupported'},
+    'save-load.todo.mixed-calendar': {'support': 'unsupported'},
+    'save-load.todo.recurrences.count': {'support': 'unsupported'}, ## This is a new problem?
+    'save-load.journal': {'support': 'ungraceful'},
+    'sync-token': {'support': 'fragile'},
+    'search.is-not-defined': {'support': 'unsupported'},
+    'search.text': {'support': 'unsupported'},
+    "search.recurrences.includes-implicit.infinite-scope": False,
+    # sometimes throws a 500
+    'search.text.category': {'support': 'ungraceful'},
+    'search.recurrences.expanded.todo': { "support": "unsupported" },
+    'search.comp-type.optional': {'support': 'fragile'}, ## TODO: more research on this, looks like a bug in the checker,
+    'search.time-range.alarm': {'support': 'unsupported'},
+    'principal-search': "unsupported",
+    ## Zimbra implements server-side automatic scheduling: invitations are
+    ## auto-processed into the attendee's calendar; no iTIP notification appears in the inbox.
+    ## TODO: auto-scheduling did not work in the last test?  Check more around it
+    #"scheduling.mailbox.inbox-delivery": False,
+    "scheduling.schedule-tag": False,
+    'save-load.icalendar.related-to': {'support': 'unsupported'},
+    'search.time-range.open.start': {'support': 'broken'},
+
+    "old_flags": [
+    ## setting display name in zimbra does not work (display name,
+    ## calendar-ID and URL is the same, the display name cannot be
+    ## changed, it can only be given if no calendar-ID is given.  In
+    ## earlier versions of Zimbra display-name could be changed, but
+    ## then the calendar would not be available on the old URL
+    ## anymore)
+    ## 'event_by_url_is_broken' removed - works in zimbra/zcs-foss:latest
+    'vtodo_datesearch_notime_task_is_skipped',
+
+    ## TODO: I just discovered that when searching for a date some
+    ## years after a recurring daily event was made, the event does
+    ## not appear.
+
+    ## extra features not specified in RFC5545
+    "calendar_order",
+    "calendar_color"
+    ]
+}
+
+bedework = {
+    ## If tests are yielding unexpected results, try to increase this:
+    'search-cache': {'behaviour': 'delay', 'delay': 3},
+    'scheduling.auto-schedule': {'support': 'unknown'},
+    'scheduling.calendar-user-address-set': {'support': 'full'},
+    'scheduling.freebusy-query': {'support': 'full'},
+    'scheduling.mailbox': {'support': 'full'},
+    'scheduling.mailbox.inbox-delivery': {'support': 'unsupported'},
+    'scheduling.schedule-tag': {'support': 'full'},
+
+    'test-calendar': {'cleanup-regime': 'wipe-calendar'},
+    'auto-connect.url': {'basepath': '/ucaldav/'},
+    'save-load.journal': {'support': 'ungraceful'},
+    'save-load.todo.recurrences.thisandfuture': {'support': 'ungraceful'},
+    'save-load.event.recurrences.exception': {'support': 'unsupported'},
+    'search.time-range.alarm': {'support': 'unsupported'},
+    "freebusy-query": True,
+    "search.time-range.todo": False,
+    "search.text": False, ## sometimes ungraceful
+    "search.recurrences": False,
+    "sync-token": { "support": "fragile" },
+    'search.comp-type': {'support': 'broken', 'behaviour': 'Server returns everything when searching for events and nothing when searching for todos'},
+    'search.comp-type.optional': {'support': 'ungraceful'},
+    'search.is-not-defined.dtend': False,
+    "principal-search": {  "support": "ungraceful" },
+    ## Bedework hides past non-recurring events from REPORT without a time-range filter,
+    ## but still returns recurring events that have future occurrences.  The unlimited-time-range
+    ## check probe is a past-only non-recurring event; it is not returned even though the
+    ## PrepareCalendar recurring event (RRULE:FREQ=MONTHLY since 2000) is returned.
+    ## Result: objects is non-empty but the probe event is absent → "broken".
+    #"search.unlimited-time-range": {"support": "broken"},
+    ## Bedework uses a pre-built Docker image with no easy way to add users, so
+    ## cross-user scheduling tests cannot be run; inbox-delivery behaviour is unknown.
+    ## (not expected to be working though)
+    "scheduling": {"support": "unknown"},
+
+    ## TODO: play with this and see if it's needed
+    'save-load.icalendar.related-to': {'support': 'broken', 'behaviour': 'first RELATED-TO line is preserved but subsequent RELATED-TO lines are stripped'},
+    'old_flags': [
+    'propfind_allprop_failure',
+    'duplicates_not_allowed',
+    ],
+
+}
+
+synology = {
+    'principal-search': False,
+    'sync-token': 'fragile',
+    'delete-calendar': False,
+    'search.comp-type.optional': 'fragile',
+    'search.is-not-defined': {'support': 'fragile', 'behaviour': 'works for CLASS but not for CATEGORIES'},
+    'search.text.case-sensitive': {'support': 'unsupported'},
+    'search.time-range.alarm': {'support': 'unsupported'},
+    'old_flags': ['vtodo_datesearch_nodtstart_task_is_skipped'],
+    'test-calendar': {'cleanup-regime': 'wipe-calendar'},
+    'scheduling.schedule-tag': False,
+    'scheduling.mailbox.inbox-delivery': False,
+}
+
+baikal =  { ## version 0.10.1
+    # Baikal (sabre/dav) delivers iTIP notifications to the attendee inbox AND auto-schedules
+    # into their calendar.
+    "scheduling.schedule-tag": False,
+    "http.multiplexing": "fragile", ## ref https://github.com/python-caldav/caldav/issues/564
+    'search.comp-type.optional': {'support': 'ungraceful'},
+    'search.recurrences.expanded.todo': {'support': 'unsupported'},
+    'search.recurrences.includes-implicit.todo': {'support': 'unsupported'},
+    "search.recurrences.includes-implicit.infinite-scope": False,
+    'save-load.journal.mixed-calendar': {'support': 'unsupported'},
+    'principal-search': {'support': 'ungraceful'},
+    'principal-search.by-name.self': {'support': 'unsupported'},
+    'principal-search.list-all': {'support': 'ungraceful'},
+    #'sync-token.delete': {'support': 'unsupported'}, ## Perhaps on some older servers?
+    'old_flags': [
+        ## extra features not specified in RFC5545
+        "calendar_order",
+        "calendar_color",
+    ],
+    ## I'm surprised, I'm quite sure this was passing earlier.  Caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad
+    'search.combined-is-logical-and': False
+} ## TODO: testPrincipals, testWrongAuthType, testTodoDatesearch fails
+
+## Some unknown version of baikal has this
+baikal_old = baikal | {
+    'create-calendar': {'support': 'quirk', 'behaviour': 'mkcol-required'},
+    'create-calendar.auto': {'support': 'unsupported'}, ## this is the default, but the "quirk" from create-calendar overwrites it.  Hm.
+}
+
+cyrus = {
+    "search.comp-type.optional": {"support": "ungraceful"},
+    "search.recurrences.includes-implicit.infinite-scope": False,
+    "search.time-range.alarm": {"support": "ungraceful"},
+    'principal-search': {'support': 'ungraceful'},
+    # Cyrus enforces unique UIDs across all calendars for a user
+    "save.duplicate-uid.cross-calendar": {"support": "ungraceful"},
+    # Ephemeral Docker container: wipe objects but keep calendar (avoids UID conflicts)
+    "test-calendar": {"cleanup-regime": "wipe-calendar"},
+    'delete-calendar': {
+        'support': 'fragile',
+        'behaviour': 'Deleting a recently created calendar fails'},
+    # Cyrus changes the Schedule-Tag even on attendee PARTSTAT-only updates,
+    # violating RFC6638 section 3.2 which requires the tag to remain stable.
+    "scheduling.schedule-tag.stable-partstat": {"support": "unsupported"},
+    # Cyrus may not properly reject wrong passwords in some configurations.
+    # Cyrus implements server-side automatic scheduling: for cross-user invites,
+    # the server both auto-processes the invite into the attendee's calendar
+    # AND delivers an iTIP notification copy to the attendee's schedule-inbox.
+}
+
+## See comments on https://github.com/python-caldav/caldav/issues/3
+#icloud = [
+#    'duplicate_in_other_calendar_with_same_uid_breaks',
+#    'sticky_events',
+#    'no_journal', ## it threw a 500 internal server error!
+#    'no_todo',
+#    "no_freebusy_rfc4791",
+#    'no_recurring',
+#    'propfind_allprop_failure',
+#    'get_object_by_uid_is_broken'
+#]
+
+davical = {
+    # Disable HTTP/2 multiplexing - davical doesn't support it well and niquests
+    # lazy responses cause MultiplexingError when accessing status_code
+    "http.multiplexing": { "support": "unsupported" },
+    # DAViCal delivers iTIP notifications to the attendee inbox AND auto-schedules
+    # into their calendar.
+    "scheduling.schedule-tag": False,
+    "search.comp-type.optional": { "support": "fragile" },
+    "search.time-range.alarm": { "support": "unsupported" },
+    'sync-token': {'support': 'fragile'},
+    'principal-search': {'support': 'unsupported'},
+    'principal-search.list-all': {'support': 'unsupported'},
+    "old_flags": [
+        #'no_journal', ## it threw a 500 internal server error! ## for old versions
+        #'nofreebusy', ## for old versions
+        ## 'fragile_sync_tokens' removed - covered by 'sync-token': {'support': 'fragile'}
+        'vtodo_datesearch_nodtstart_task_is_skipped', ## no issue raised yet
+        'calendar_color',
+        'calendar_order',
+        'vtodo_datesearch_notime_task_is_skipped',
+    ],
+}
+
+sogo = {
+    "scheduling.schedule-tag": False,
+    "scheduling.mailbox.inbox-delivery": False,
+    ## I'm surprised, I'm quite sure this was passing earlier.  reported unsupported with caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad 2026-02-15
+    "search.text.category": False,
+    "search.time-range.event.old-dates": False,
+    "search.time-range.todo.old-dates": False,
+    "save-load.journal": {"support": "ungraceful"},
+    "search.is-not-defined": {"support": "unsupported"},
+    "search.text.case-sensitive": {
+        "support": "unsupported"
+    },
+    "search.text.case-insensitive": {
+        "support": "unsupported"
+    },
+    "search.time-range.alarm": {
+        "support": "unsupported"
+    },
+    ## was unsupported.  reported ungraceful with caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad 2026-02-15
+    "search.comp-type.optional": {
+        "support": "ungraceful"
+    },
+    ## includes-implicit.todo has been observed as both supported and unsupported
+    ## across different test runs.  Other includes-implicit children are unsupported.
+    ## Marking the parent as fragile to avoid cascading derivation issues.
+    "search.recurrences.includes-implicit": {
+        "support": "fragile"
+    },
+    "sync-token": {
+        "support": "fragile"
+    },
+    "search.recurrences.expanded": {
+        "support": "unsupported"
+    },
+    ## unsupported earlier, ungraceful at be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492
+    "freebusy-query": {"support": "ungraceful"},
+    "principal-search": {
+        "support": "ungraceful",
+        "behaviour": "Search by name failed: ReportError at '501 Not Implemented - <?xml version=\"1.0\" encoding=\"ISO-8859-1\"?>\n<html xmlns=\"http://www.w3.org/1999/xhtml\">\n<body><h3>An error occurred during object publishing</h3><p>did not find the specified REPORT</p></body>\n</html>\n', reason no reason",
+    },
+    # Ephemeral Docker container: wipe objects (delete-calendar fragile)
+    'test-calendar': {'cleanup-regime': 'wipe-calendar'},
+
+}
+## Old notes for sogo (todo - incorporate them in the structure above)
+## https://www.sogo.nu/bugs/view.php?id=3065
+## left a note about time-based sync tokens on https://www.sogo.nu/bugs/view.php?id=5163
+## https://www.sogo.nu/bugs/view.php?id=5282
+## https://bugs.sogo.nu/view.php?id=5693
+## https://bugs.sogo.nu/view.php?id=5694
+#sogo = [ ## and in addition ... the requests are efficiently rate limited, as it spawns lots of postgresql connections all until it hits a limit, after that it's 501 errors ...
+#    "time_based_sync_tokens",
+#    "search_needs_comptype",
+#    "fastmail_buggy_noexpand_date_search",
+#    "text_search_not_working",
+#    "isnotdefined_not_working",
+#    'no_journal',
+#    'no_freebusoy_rfc4791'
+#]
+
+
+
+#google = [
+#    'no_mkcalendar',
+#    'no_overwrite',
+#    'no_todo',
+#]
+
+#fastmail = [
+#    'duplicates_not_allowed',
+#    'duplicate_in_other_calendar_with_same_uid_breaks',
+#    'no_todo',
+#    'sticky_events',
+#    'fastmail_buggy_noexpand_date_search',
+#    'combined_search_not_working',
+#    'text_search_is_exact_match_sometimes',
+#    'rrule_takes_no_count',
+#    'isnotdefined_not_working',
+#]
+
+robur = {
+    "auto-connect.url": {
+        'domain': 'calendar.robur.coop',
+        'basepath': '/principals/', # TODO: this seems fishy
+    },
+    "save-load.journal": { "support": "ungraceful" },
+    "delete-calendar": { "support": "unsupported" },
+    "search.is-not-defined": { "support": "unsupported" },
+    "search.time-range.todo": { "support": "unsupported" },
+    "search.time-range.alarm": {'support': 'unsupported'},
+    "search.text": { "support": "unsupported", "behaviour": "a text search ignores the filter and returns all elements" },
+    "search.comp-type.optional": { "support": "ungraceful" },
+    "search.recurrences.expanded.todo": { "support": "unsupported" },
+    "search.recurrences.expanded.event": { "support": "fragile" },
+    'search.recurrences.includes-implicit.todo': {'support': 'unsupported'},
+    'principal-search': {'support': 'ungraceful'},
+    'freebusy-query': {'support': 'ungraceful'},
+    "scheduling": {"support": "unsupported"},
+    'old_flags': [
+        'non_existing_raises_other', ## AuthorizationError instead of NotFoundError
+    ],
+    'save-load.icalendar.related-to': {'support': 'unsupported'},
+    'test-calendar': {'cleanup-regime': 'wipe-calendar'},
+    "sync-token": {"support": "ungraceful"},
+    "get-supported-components": {"support": "unsupported"},
+}
+
+posteo = {
+    'auto-connect.url': {
+        'scheme': 'https',
+        'domain': 'posteo.de:8443',
+        'basepath': '/',
+    },
+    'create-calendar': {'support': 'unsupported'},
+    'save-load.journal': {'support': 'unsupported'},
+    ## TODO1: we should ignore cases where observations are unknown while configuration is known
+    ## TODO2: there are more calendars available at the posteo account, so it should be possible to check this.
+    "save.duplicate-uid.cross-calendar": { "support": "unknown" },
+    ## foo ... "full" observed for the next two, 70938dc1cbb6a839978eee4315699746d38ee5f0/3cae24cf99da1702b851b5a74a9b88c8e5317dad, 2026-02-17
+    ## bar ... 3cae24cf99da1702b851b5a74a9b88c8e5317dad was probably the rotten commit, ungraceful again in  be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492
+    'search.comp-type.optional': {'support': 'ungraceful'},
+    'search.recurrences.includes-implicit.infinite-scope': False,
+    #'search.text.case-sensitive': {'support': 'unsupported'},
+    ## Comment from claude:
+    ## Text search precondition check returns unexpected results on posteo
+    ## (possibly stale data on non-deletable calendar), so substring support
+    ## cannot be reliably determined.
+    ## perhaps the stale data was deleted, because "full" observed, 70938dc1cbb6a839978eee4315699746d38ee5f0/3cae24cf99da1702b851b5a74a9b88c8e5317dad, 2026-02-17
+    #'search.text.substring': {'support': 'unknown'},
+    ## search.time-range.todo was previously unsupported on posteo but
+    ## is now observed as working for recent dates (as of 2026-02).
+    ## Old dates (year 2000) still don't work.
+    ## foo ... "full" observed, 70938dc1cbb6a839978eee4315699746d38ee5f0/3cae24cf99da1702b851b5a74a9b88c8e5317dad, 2026-02-17
+    #'search.time-range.todo.old-dates': {'support': 'unsupported'},
+    'search.recurrences.expanded.todo': {'support': 'unsupported'},
+    'search.recurrences.includes-implicit.todo': {'support': 'unsupported'},
+    'search.combined-is-logical-and': {'support': 'unsupported'},
+    'sync-token': {'support': 'ungraceful'},
+    'principal-search': {'support': 'unsupported'},
+    "scheduling": {"support": "unsupported"},
+}
+
+#calendar_mail_ru = [
+#    'no_mkcalendar', ## weird.  It was working in early June 2024, then it stopped working in mid-June 2024.
+#    'no_current-user-principal',
+#    'no_todo',
+#    'no_journal',
+#    'search_always_needs_comptype',
+#    'no_sync_token', ## don't know if sync tokens are supported or not - the sync-token-code needs some workarounds ref https://github.com/python-caldav/caldav/issues/401
+#    'text_search_not_working',
+#    'isnotdefined_not_working',
+#    'no_scheduling_mailbox',
+#    'no_freebusy_rfc4791',
+#    'no_relships', ## mail.ru recreates the icalendar content, and strips everything it doesn't know anyhting about, including relationship info
+#]
+
+## Davis uses sabre/dav (same backend as Baikal), so hints are similar.
+## TODO: consolidate, make a sabredav dict and let davis/baikal build on it
+davis = {
+    # Davis uses sabre/dav (same backend as Baikal): delivers iTIP notifications to the
+    # attendee inbox AND auto-schedules into their calendar.
+    "scheduling.schedule-tag": False,
+    "search.recurrences.expanded.todo": {"support": "unsupported"},
+    "search.recurrences.includes-implicit.todo": {"support": "unsupported"},
+    "search.recurrences.includes-implicit.infinite-scope": False,
+    "principal-search.by-name.self": {"support": "unsupported"},
+    "principal-search": {"support": "ungraceful"},
+    "save-load.journal.mixed-calendar": {"support": "unsupported"},
+    "search.comp-type.optional": {"support": "ungraceful"},
+    "old_flags": [
+        "calendar_order",
+        "calendar_color",
+    ],
+    ## I'm surprised, I'm quite sure this was passing earlier.  Caldav commit a98d50490b872e9b9d8e93e2e401c936ad193003, caldav server checker commit 3cae24cf99da1702b851b5a74a9b88c8e5317dad
+    'search.combined-is-logical-and': False
+}
+
+## Apple CalendarServer (CCS) - archived 2019, Python 2/Twisted.
+## MKCALENDAR always creates VEVENT-only calendars; supported-calendar-component-set
+## cannot be changed.  The pre-provisioned "tasks" calendar supports VTODO only.
+## VJOURNAL is not supported at all.
+ccs = {
+    "scheduling.freebusy-query": {"support": "ungraceful"},
+    "scheduling.mailbox.inbox-delivery": True,
+    "scheduling.auto-schedule": True,
+    "scheduling.schedule-tag.stable-partstat": {"support": "unsupported"},
+    "save-load.journal": {"support": "unsupported"},
+    "save-load.todo.mixed-calendar": {"support": "unsupported"},
+    # CCS enforces unique UIDs across ALL calendars for a user
+    #"save.duplicate-uid.cross-calendar": {"support": "unsupported"},
+    ## "unsupported" observed earlier.  "ungraceful" at  be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492 2026-02-19.
+    "save.duplicate-uid.cross-calendar": {"support": "ungraceful"},
+    # CCS rejects multi-instance VTODOs (thisandfuture recurring completion)
+    "save-load.todo.recurrences.thisandfuture": {"support": "unsupported"},
+    "search.comp-type.optional": {"support": "ungraceful"},
+    ## "full" observed, 70938dc1cbb6a839978eee4315699746d38ee5f0/3cae24cf99da1702b851b5a74a9b88c8e5317dad, 2026-02-17.
+    ## However, this may be due to mess with the caldav-server-checker branches.  "unsupported" again at be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492
+    "search.text.case-sensitive": {"support": "unsupported"},
+    "search.time-range.event": {"support": "full"},
+    "search.time-range.event.old-dates": {"support": "ungraceful"},
+    "search.time-range.todo": {"support": "full"},
+    "search.time-range.todo.old-dates": {"support": "ungraceful"},
+    "search.time-range.open": {"support": "ungraceful"},
+    "search.time-range.alarm": {"support": "unsupported"},
+    "search.recurrences": {"support": "unsupported"},
+    "principal-search": {"support": "unsupported"},
+    # Ephemeral Docker container: wipe objects (avoids UID conflicts across calendars)
+    "test-calendar": {"cleanup-regime": "wipe-calendar"},
+    ## Did pass earlier, ungraceful at be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492
+    'freebusy-query': {'support': 'ungraceful'},
+    "old_flags": [
+        "propfind_allprop_failure",
+    ],
+}
+
+## Stalwart - all-in-one mail & collaboration server (CalDAV added 2024/2025)
+## https://stalw.art/
+## CalDAV served at /dav/cal/<username>/ over HTTP on port 8080.
+## Feature support mostly unknown until tested; starting with empty hints.
+stalwart = {
+    'rate-limit': {
+        'enable': True,
+        'default_sleep': 3,
+        'max_sleep': 60
+    },
+    'create-calendar.auto': True,
+    'principal-search': {'support': 'ungraceful'},
+    'search.time-range.alarm': False,
+    ## Stalwart supports implicit recurrence for datetime events but not for
+    ## all-day (VALUE=DATE) recurring events in time-range searches.
+    'search.recurrences.includes-implicit.event': {'support': 'fragile', 'behaviour': 'broken for all-day (VALUE=DATE) events'},
+    ## Stalwart returns the recurring todo in search results but doesn't return the
+    ## RRULE intact, so client-side expansion can't expand it to specific occurrences.
+    'search.recurrences.includes-implicit.todo': {'support': 'fragile'},
+    ## Stalwart correctly handles exceptions in server-side CALDAV:expand (observed supported).
+    ## Stalwart stores master+exception VEVENTs as a single resource with 2 VEVENTs.
+    'save-load.event.recurrences.exception': {'support': 'full'},
+    'search.time-range.open': True,
+    ## Stalwart delivers iTIP notifications to the attendee inbox AND auto-schedules
+    ## into their calendar (verified by running CheckSchedulingInboxDelivery).
+    "scheduling.mailbox.inbox-delivery": True,
+    "scheduling.auto-schedule": True,
+    'old_flags': [
+        ## Stalwart does not return VTODO items without DTSTART in date searches
+        'vtodo_datesearch_nodtstart_task_is_skipped',
+    ],
+}
+
+## Lots of transient problems with purelymail
+purelymail = {
+    ## Purelymail claims that the search indexes are "lazily" populated,
+    ## so search works some minutes after the event was created/edited.
+    'search-cache': {'behaviour': 'delay', 'delay': 180},
+    #'search-cache': {'behaviour': 'delay', 'delay': 0.3},
+    ## Hmmm .... weird, this is flapping in the caldav-server-tester?
+    "create-calendar.auto": {"support": "full"},
+    ## 409 Conflict with <must-have-parent> when PUTting to a URL not under an existing calendar
+    #'save-load.get-by-url': {'support': 'unknown'},
+    #'save-load.todo': {'support': 'ungraceful'},
+    'search.comp-type.optional': {'support': 'unsupported'},
+    ## The search features below are unreliable on purelymail, likely due
+    ## to the 160s search-cache delay.  Results flip between unsupported
+    ## and ungraceful across runs.  Marked fragile so the checker skips them.
+    ## was: (default, i.e. full) - observed ungraceful 2026-02
+    'search.is-not-defined': {'support': 'fragile'},
+    'search.time-range.alarm': {'support': 'unsupported'},
+    ## was: unsupported - observed ungraceful 2026-02
+    'search.time-range.event': {'support': 'fragile'},
+    ## was: ungraceful - observed unsupported 2026-02 (for .old-dates)
+    'search.time-range.todo': {'support': 'fragile'},
+    'principal-search': {'support': 'ungraceful'},
+    'principal-search.by-name.self': {'support': 'ungraceful'},
+    'principal-search.list-all': {'support': 'ungraceful'},
+    'auto-connect.url': {
+        'basepath': '/webdav/',
+        'domain': 'purelymail.com',
+    },
+    ## Known, work in progress
+    "scheduling": {"support": "unsupported"},
+    ## Known, not a breach of standard
+    "get-supported-components": {"support": "unsupported"},
+}
+
+gmx = {
+    'auto-connect.url': {
+        'scheme': 'https',
+        'domain': 'caldav.gmx.net',
+        'basepath': '/begenda/dav/{username}/',
+    },
+    'rate-limit': {
+        'enable': True,
+        'interval': 2,
+        'count': 1,
+        'default_sleep': 4,
+        'max_sleep': 30
+    },
+    'search.comp-type.optional': {'support': 'fragile', 'description': 'unexpected results from date-search without comp-type - but only sometimes - TODO: research more'},
+    'search.recurrences.expanded': {'support': 'unsupported'},
+    ## TODO: flapping between ungraceful and unsupported?
+    #'search.text.case-sensitive': {'support': 'ungraceful'},
+    'search.text.case-sensitive': {'support': 'unsupported'},
+    ## TODO: flapping between supported and unsupported?
+    #'search.text.case-insensitive': {'support': 'unsupported'},
+    ## TODO: flapping between unsupported and ungraceful?
+    #'sync-token': {'support': 'unsupported'},
+    'sync-token': {'support': 'ungraceful'},
+    'principal-search': {'support': 'ungraceful'},
+    'principal-search.by-name.self': {'support': 'unsupported'},
+    ## TODO: flapping ...?
+    #'freebusy-query': {'support': 'unsupported'},
+    'freebusy-query': {'support': 'ungraceful'},
+    ## flapping ...?
+    #'search.is-not-defined.category': {'support': 'unsupported'},
+    ## flapping ...?
+    #'search.is-not-defined.dtend': {'support': 'unsupported'},
+    'create-calendar': {'support': 'unknown' }, ## https://github.com/python-caldav/caldav/issues/624
+    ## was apparently observed working for a while, possibly due to the master/more_checks split-brain git branching incident in the server-checker project.
+    ## unsupported in be26d42b1ca3ff3b4fd183761b4a9b024ce12b84 / 537a23b145487006bb987dee5ab9e00cdebb0492 2026-02-19.  Supported when testing again short time after.  Either I'm confused or it's "fragile".
+    #'search.time-range.alarm': {'support': 'unsupported'},
+    ## GMX advertises calendar-auto-schedule but inbox/mailbox and
+    ## calendar-user-address-set are not functional (RFC6638 sub-features).
+    "scheduling": {"support": "full"},
+    "scheduling.mailbox": {"support": "unsupported"},
+    "scheduling.calendar-user-address-set": {"support": "unsupported"},
+    ## GMX does not return results for open-end date searches (only start given)
+    'search.time-range.open.end': {'support': 'unsupported'},
+    "old_flags":  [
+        #"text_search_is_case_insensitive",
+        "vtodo-cannot-be-uncompleted",
+    ]
+}
+
+## https://www.open-xchange.com/
+## OX App Suite CalDAV served at /caldav/ (Apache proxies to /servlet/dav/caldav on port 8009).
+## The Docker image must be built locally before use (see tests/docker-test-servers/ox/build.sh).
+ox = {
+    ## Renaming a calendar after creation via PROPPATCH is not supported
+    'create-calendar.set-displayname': {'support': 'unsupported'},
+    ## VTODOs must be in a dedicated VTODO-only calendar; mixed calendars not supported
+    'save-load.todo.mixed-calendar': {'support': 'unsupported'},
+    ## Basic VTODO support works fine; only recurrences are broken
+    'save-load.todo': {'support': 'full'},
+    ## Recurring VTODOs (RRULE in VTODO) are rejected with 400
+    'save-load.todo.recurrences': {'support': 'ungraceful'},
+    ## VJOURNAL is not supported
+    'save-load.journal': {'support': 'unsupported'},
+    ## Search limitations
+    'search.time-range.event.old-dates': {'support': 'unsupported'},
+    'search.time-range.todo.old-dates': {'support': 'unsupported'},
+    'search.time-range.alarm': {'support': 'unsupported'},
+    'search.unlimited-time-range': {'support': 'broken'},
+    'search.comp-type.optional': {'support': 'ungraceful'},
+    'search.text': {'support': 'unsupported'},
+    'search.text.category': {'support': 'unsupported'},
+    'search.text.case-sensitive': {'support': 'unsupported'},
+    'search.text.case-insensitive': {'support': 'unsupported'},
+    ## Recurrence searching broken (sliding window + old-dates limitation)
+    'search.recurrences.includes-implicit': {'support': 'unsupported'},
+    'search.recurrences.includes-implicit.todo.pending': {'support': 'unsupported'},
+    'search.recurrences.expanded': {'support': 'unsupported'},
+    ## is-not-defined for DTEND is not supported
+    'search.is-not-defined.dtend': {'support': 'unsupported'},
+    ## Freebusy queries are not supported (returns 400)
+    'freebusy-query': {'support': 'ungraceful'},
+    ## Principal search not supported
+    'principal-search': {'support': 'unsupported'},
+    'principal-search.by-name.self': {'support': 'unsupported'},
+    'principal-search.list-all': {'support': 'unsupported'},
+    ## Cross-calendar duplicate UID test fails (AuthorizationError creating second calendar)
+    'save.duplicate-uid.cross-calendar': {'support': 'ungraceful'},
+    'save-load.icalendar.related-to': {'support': 'broken'},
+    ## OX App Suite has complex user provisioning; cross-user scheduling tests not yet set up.
+    "scheduling": {"support": "unknown"},
+    "scheduling.freebusy-query": "ungraceful",
+    'search.time-range.open.start': "broken",
+    'search.time-range.open.end': True,
+    ## time-range.open is "broken", while time-range.open.start.duration is "unsupported"?
+    ## this may possibly be some problems with the checker rather than with Ox
+    'search.time-range.open.start.duration': "unsupported"
+}
+
+# fmt: on
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Container, Iterator
 from typing import TYPE_CHECKING
 
 import icalendar
@@ -21,6 +22,91 @@ import icalendar
 if TYPE_CHECKING:
     import vobject
 
+## End of the property name in a content line
+_NAME_END = re.compile("[;:]")
+
+## A UID line without parameters
+_UID_LINE = re.compile(r"^UID:(.+)$", re.MULTILINE)
+
+
+def _value(line: str) -> str:
+    """The value of an (unfolded) content line, without the parameters"""
+    if '"' not in line:
+        return line[line.index(":") + 1 :]
+    ## Parameter values may be quoted, and may then contain colons
+    quoted = False
+    for i, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            return line[i + 1 :]
+    raise ValueError("no value in content line")
+
+
+def scan_components(data: str, names: Container[str]) -> Iterator[tuple[str, dict[str, list[str]]]]:
+    """Picks properties out of iCalendar data without parsing it.
+
+    Yields the name and the requested properties of every component
+    directly inside the VCALENDAR (VEVENT, VTODO, VTIMEZONE, ...), in
+    the order they appear.  Nested components like VALARM are skipped.
+
+    The data is read one line at a time.  Only the lines of the
+    requested properties (and BEGIN/END) are unfolded; anything else
+    is passed over.  The values are given as they are in the data -
+    with the parameters stripped, but text values are not unescaped.
+
+    :param data: iCalendar data
+    :param names: Upper case names of the properties to pick out
+    :return: Iterator of (component name, {property name: [values]})
+    """
+    stack = []
+    ## Depth of the components to pick properties from, and the
+    ## properties of the current one
+    depth = None
+    found = None
+    pos = 0
+    end = len(data)
+    while pos < end:
+        eol = data.find("\n", pos)
+        if eol == -1:
+            eol = end
+        line = data[pos:eol].rstrip("\r")
+        pos = eol + 1
+        if not line or line[0] in " \t":
+            ## Continuation of a line not asked for
+            continue
+        match = _NAME_END.search(line)
+        if match:
+            name = line[: match.start()].upper()
+            if name not in ("BEGIN", "END") and (found is None or name not in names):
+                continue
+        ## Unfold the line
+        while pos < end and data[pos] in " \t":
+            eol = data.find("\n", pos)
+            if eol == -1:
+                eol = end
+            line += data[pos + 1 : eol].rstrip("\r")
+            pos = eol + 1
+        if not match:
+            match = _NAME_END.search(line)
+            if not match:
+                continue
+            name = line[: match.start()].upper()
+        if name == "BEGIN":
+            stack.append(_value(line).strip().upper())
+            if depth is None and (len(stack) == 1 and stack[0] != "VCALENDAR" or len(stack) == 2):
+                depth = len(stack)
+            if len(stack) == depth:
+                found = {}
+        elif name == "END":
+            if found is not None and len(stack) == depth:
+                yield (stack[-1], found)
+                found = None
+            if stack:
+                stack.pop()
+        elif found is not None and len(stack) == depth and name in names:
+            found.setdefault(name, []).append(_value(line))
+
 
 class DataState(ABC):
     """Abstract base class for calendar data states.
@@ -30,6 +116,9 @@ class DataState(ABC):
     only one is authoritative at any time.
     """
 
+    ## One state object is held by every calendar object - no __dict__
+    __slots__ = ()
+
     @abstractmethod
     def get_data(self) -> str:
         """Get raw iCalendar string representation.
@@ -79,6 +168,14 @@ class DataState(ABC):
                 return comp.name
         return None
 
+    def scan(self, names: Container[str]) -> Iterator[tuple[str, dict[str, list[str]]]] | None:
+        """Pick properties out of the data through :func:`scan_components`.
+
+        Returns None unless the data is held as a string - accessing
+        the parsed data is then cheaper.
+        """
+        return None
+
     def has_data(self) -> bool:
         """Check if this state has any data."""
         return True
@@ -91,6 +188,8 @@ class NoDataState(DataState):
     any initial data. It provides empty/default values for all accessors.
     """
 
+    __slots__ = ()
+
     def get_data(self) -> str:
         return ""
 
@@ -117,28 +216,55 @@ class RawDataState(DataState):
 
     This is the most common initial state when data is loaded from
     a CalDAV server.
+
+    If a ``fixup`` function is given, it's applied to the data the
+    first time the full data is needed.  The UID and component type
+    are found through the cheap accessors without it, so objects that
+    are only listed (i.e. to compare etags) never pay for the fixup.
     """
 
-    def __init__(self, data: str):
+    __slots__ = ("_data", "_fixup")
+
+    def __init__(self, data: str, fixup: Callable[[str], str] | None = None):
         self._data = data
+        self._fixup = fixup
 
     def get_data(self) -> str:
+        if self._fixup is not None:
+            self._data = self._fixup(self._data)
+            self._fixup = None
         return self._data
 
     def get_icalendar_copy(self) -> icalendar.Calendar:
-        return icalendar.Calendar.from_ical(self._data)
+        return icalendar.Calendar.from_ical(self.get_data())
 
     def get_vobject_copy(self) -> vobject.base.Component:
         import vobject
 
-        return vobject.readOne(self._data)
+        return vobject.readOne(self.get_data())
+
+    def scan(self, names: Container[str]) -> Iterator[tuple[str, dict[str, list[str]]]]:
+        return scan_components(self.get_data(), names)
 
     def get_uid(self) -> str | None:
         # Optimization: use regex instead of full parsing
-        match = re.search(r"^UID:(.+)$", self._data, re.MULTILINE)
+        match = _UID_LINE.search(self._data)
         if match:
-            return match.group(1).strip()
-        # Fall back to parsing if regex fails (e.g., folded lines)
+            uid = match.group(1)
+            end = match.end()
+            if "\\" not in uid and self._data[end + 1 : end + 2] not in (" ", "\t"):
+                return uid.strip()
+        # The UID line is folded, escaped or has parameters - scan the data
+        try:
+            for name, found in scan_components(self._data, ("UID",)):
+                if name in ("VEVENT", "VTODO", "VJOURNAL", "VFREEBUSY") and "UID" in found:
+                    uid = found["UID"][0]
+                    if "\\" not in uid:
+                        return uid.strip()
+                    break
+        except ValueError:
+            pass
+        # Fall back to parsing (e.g. escaped characters in the UID)
         return super().get_uid()
 
     def get_component_type(self) -> str | None:
@@ -163,6 +289,8 @@ class IcalendarState(DataState):
     - User modifies the icalendar object
     """
 
+    __slots__ = ("_calendar",)
+
     def __init__(self, calendar: icalendar.Calendar):
         self._calendar = calendar
 
@@ -207,6 +335,8 @@ class VobjectState(DataState):
     - User modifies the vobject object
     """
 
+    __slots__ = ("_vobject",)
+
     def __init__(self, vobj: vobject.base.Component):
         self._vobject = vobj
 
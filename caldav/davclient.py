@@ -10,6 +10,7 @@ For async code, use: from caldav import aio
 
 import logging
 import sys
+import threading
 import time
 import warnings
 from types import TracebackType
@@ -41,14 +42,15 @@ from caldav import __version__
 from caldav.base_client import BaseDAVClient
 from caldav.base_client import get_calendars as _base_get_calendars
 from caldav.base_client import get_davclient as _base_get_davclient
-from caldav.collection import Calendar, Principal
 from caldav.compatibility_hints import FeatureSet
 
 # Re-export CONNKEYS for backward compatibility
 from caldav.config import CONNKEYS  # noqa: F401
 from caldav.lib import error
 from caldav.lib.python_utilities import to_wire
+from caldav.lib.ratelimit import RateLimiter, rate_limiter_from_settings
 from caldav.lib.url import URL
+from caldav.lib.validationcache import ValidationCache, validation_cache_from_settings
 from caldav.requests import HTTPBearerAuth
 from caldav.response import DAVResponse
 
@@ -61,6 +63,7 @@ else:
 
 if TYPE_CHECKING:
     from caldav.calendarobjectresource import CalendarObjectResource
+    from caldav.collection import Calendar, Principal
 
 
 """
@@ -167,6 +170,9 @@ class DAVClient(BaseDAVClient):
     proxy: str | None = None
     url: URL = None
     huge_tree: bool = False
+    rate_limiter: RateLimiter | None = None
+    validation_cache: ValidationCache | None = None
+    fake_sync_token_stores: dict | None = None
 
     def __init__(
         self,
@@ -187,6 +193,11 @@ class DAVClient(BaseDAVClient):
         rate_limit_handle: bool | None = None,
         rate_limit_default_sleep: int | None = None,
         rate_limit_max_sleep: int | None = None,
+        rate_limit_interval: float | None = None,
+        rate_limit_count: int | None = None,
+        pool_size: int | None = None,
+        keepalive: float | None = None,
+        validation_cache: "bool | ValidationCache" = False,
     ) -> None:
         """
         Sets up a HTTPConnection object towards the server in the url.
@@ -234,6 +245,30 @@ class DAVClient(BaseDAVClient):
           rate_limit_max_sleep: int or None, maximum number of seconds to sleep when rate limited,
                                 regardless of the server's Retry-After value. None (default) means
                                 there is no cap and the server-requested delay is respected as-is.
+          rate_limit_interval: number of seconds, or None.  When set, the client will throttle
+                               itself to send at most rate_limit_count requests within this
+                               interval, rather than waiting for the server to respond with 429.
+                               Default: taken from the rate-limit feature in the server
+                               compatibility hints, if enabled.
+          rate_limit_count: int or None, the number of requests allowed per rate_limit_interval.
+                            Default: taken from the compatibility hints, or 1.
+          pool_size: int or None, the max number of connections per host kept open in the
+                     connection pool.  Set it to (at least) the number of threads sharing
+                     the client.  Default: the HTTP library default (10).
+          keepalive: number of seconds, or None.  How long an idle connection is kept
+                     alive in the pool (only supported with niquests).  Default: the
+                     niquests default.
+          validation_cache: bool or a ValidationCache.  When set, loading an object
+                            that was loaded before is done through a conditional GET,
+                            and the server may respond 304 Not Modified rather than
+                            sending the data again.  See caldav.lib.validationcache.
+
+        A DAVClient may be shared by several threads (i.e. worker threads
+        in a ``concurrent.futures.ThreadPoolExecutor``).  The connections
+        are taken from a shared connection pool (see ``pool_size``), and
+        authentication negotiation is done only once, by the first
+        request getting a 401 - the other threads will wait for it and
+        reuse the result.  The pro-active rate limiter is also shared.
 
         The niquests library will honor a .netrc-file, if such a file exists
         username and password may be omitted.
@@ -253,11 +288,27 @@ class DAVClient(BaseDAVClient):
         self.features = FeatureSet(features)
         self.huge_tree = huge_tree
 
+        ## Protects auth negotiation when the client is shared by several threads
+        self._auth_lock = threading.Lock()
+
+        pool_kwargs: dict[str, Any] = {}
+        if pool_size:
+            pool_kwargs = {"pool_connections": pool_size, "pool_maxsize": pool_size}
         try:
             multiplexed = self.features.is_supported("http.multiplexing")
-            self.session = requests.Session(multiplexed=multiplexed)
+            keepalive_kwargs = {"keepalive_delay": keepalive} if keepalive is not None else {}
+            self.session = requests.Session(
+                multiplexed=multiplexed, **pool_kwargs, **keepalive_kwargs
+            )
         except TypeError:
+            ## requests - the pool size has to be set on the adapters
             self.session = requests.Session()
+            if pool_kwargs:
+                adapter = requests.adapters.HTTPAdapter(**pool_kwargs)
+                self.session.mount("https://", adapter)
+                self.session.mount("http://", adapter)
+            if keepalive is not None:
+                log.info("The keepalive parameter is only supported with niquests, ignoring it")
 
         url, discovered_username = _auto_url(
             url,
@@ -344,6 +395,14 @@ class DAVClient(BaseDAVClient):
         self.rate_limit_handle = rate_limit_handle
         self.rate_limit_default_sleep = rate_limit_default_sleep
         self.rate_limit_max_sleep = rate_limit_max_sleep
+        ## Pro-active rate limiting, shared by everything using this client
+        self.rate_limiter = rate_limiter_from_settings(
+            rate_limit, rate_limit_interval, rate_limit_count
+        )
+        self.validation_cache = validation_cache_from_settings(validation_cache)
+        ## Calendar URL -> snapshots behind the fake sync tokens, see
+        ## Calendar.fake_sync_token_store
+        self.fake_sync_token_stores = {}
 
     def __enter__(self) -> Self:
         ## Used for tests, to set up a temporarily test server
@@ -425,6 +484,8 @@ class DAVClient(BaseDAVClient):
         higher-level methods for dealing with the principals
         calendars.
         """
+        from caldav.collection import Principal
+
         if not self._principal:
             self._principal = Principal(*largs, client=self, **kwargs)
         return self._principal
@@ -432,7 +493,7 @@ class DAVClient(BaseDAVClient):
     # ==================== High-Level Methods ====================
     # These methods mirror the async API for consistency.
 
-    def get_principal(self) -> Principal:
+    def get_principal(self) -> "Principal":
         """Get the principal (user) for this CalDAV connection.
 
         This is the recommended method for new code. It provides API
@@ -448,7 +509,7 @@ class DAVClient(BaseDAVClient):
         """
         return self.principal()
 
-    def get_calendars(self, principal: Principal | None = None) -> list[Calendar]:
+    def get_calendars(self, principal: Optional["Principal"] = None) -> list["Calendar"]:
         """Get all calendars for the given principal.
 
         This method fetches calendars from the principal's calendar-home-set
@@ -466,6 +527,7 @@ class DAVClient(BaseDAVClient):
             for cal in calendars:
                 print(f"Calendar: {cal.get_display_name()}")
         """
+        from caldav.collection import Calendar
         from caldav.collection import (
             _extract_calendar_home_set_from_results as extract_home_set,
         )
@@ -509,7 +571,7 @@ class DAVClient(BaseDAVClient):
 
     def search_calendar(
         self,
-        calendar: Calendar,
+        calendar: "Calendar",
         event: bool = False,
         todo: bool = False,
         journal: bool = False,
@@ -651,6 +713,7 @@ class DAVClient(BaseDAVClient):
         url: str | None = None,
         props=None,
         depth: int = 0,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Send a propfind request.
@@ -663,6 +726,9 @@ class DAVClient(BaseDAVClient):
             XML body string (old interface) or list of property names (new interface).
         depth : int
             maximum recursion depth
+        stream : bool
+            if True, the response body is not buffered.  Iterate over
+            ``response.iter_propfind()`` to parse it incrementally.
 
         Returns
         -------
@@ -678,7 +744,9 @@ class DAVClient(BaseDAVClient):
 
         # Use sync path with protocol layer parsing
         headers = {"Depth": str(depth)}
-        response = self.request(url or str(self.url), "PROPFIND", body, headers)
+        ## stream is only passed on when set, as subclasses may override request()
+        stream_kwargs = {"stream": True} if stream else {}
+        response = self.request(url or str(self.url), "PROPFIND", body, headers, **stream_kwargs)
 
         if response.status in (200, 207) and response._raw:
             response.results = response.parse_propfind()
@@ -698,7 +766,9 @@ class DAVClient(BaseDAVClient):
         """
         return self.request(url, "PROPPATCH", body)
 
-    def report(self, url: str, query: str = "", depth: int | None = 0) -> DAVResponse:
+    def report(
+        self, url: str, query: str = "", depth: int | None = 0, stream: bool = False
+    ) -> DAVResponse:
         """
         Send a report request.
 
@@ -707,12 +777,16 @@ class DAVClient(BaseDAVClient):
             query: XML request
             depth: maximum recursion depth. None means don't send Depth header
                 (required for calendar-multiget per RFC 4791 section 7.9).
+            stream: if True, the response body is not buffered.  Iterate over
+                ``response.iter_calendar_query()`` to parse it incrementally.
 
         Returns
             DAVResponse
         """
         headers = {"Depth": str(depth)} if depth is not None else CaseInsensitiveDict()
-        return self.request(url, "REPORT", query, headers)
+        ## stream is only passed on when set, as subclasses may override request()
+        stream_kwargs = {"stream": True} if stream else {}
+        return self.request(url, "REPORT", query, headers, **stream_kwargs)
 
     def mkcol(self, url: str, body: str, dummy: None = None) -> DAVResponse:
         """
@@ -807,6 +881,7 @@ class DAVClient(BaseDAVClient):
         body: str = "",
         headers: Mapping[str, str] = None,
         rate_limit_time_slept=0,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Send a generic HTTP request.
@@ -818,12 +893,16 @@ class DAVClient(BaseDAVClient):
             method: HTTP method (GET, PUT, DELETE, etc.)
             body: Request body
             headers: Optional headers dict
+            stream: Leave the response body on the wire, to be consumed
+                incrementally through the DAVResponse iter-methods
 
         Returns:
             DAVResponse
         """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
         try:
-            return self._sync_request(url, method, body, headers)
+            return self._sync_request(url, method, body, headers, stream=stream)
         except error.RateLimitError as e:
             if not self.rate_limit_handle:
                 raise
@@ -840,7 +919,9 @@ class DAVClient(BaseDAVClient):
             ):
                 raise
             time.sleep(sleep_seconds)
-            return self.request(url, method, body, headers, rate_limit_time_slept + sleep_seconds)
+            return self.request(
+                url, method, body, headers, rate_limit_time_slept + sleep_seconds, stream=stream
+            )
 
     def _sync_request(
         self,
@@ -848,6 +929,7 @@ class DAVClient(BaseDAVClient):
         method: str = "GET",
         body: str = "",
         headers: Mapping[str, str] = None,
+        stream: bool = False,
     ) -> DAVResponse:
         """
         Sync HTTP request implementation with auth negotiation.
@@ -859,33 +941,55 @@ class DAVClient(BaseDAVClient):
             proxies = {url_obj.scheme: self.proxy}
             log.debug("using proxy - %s" % (proxies))
 
+        auth = self.auth
         r = self.session.request(
             method,
             str(url_obj),
             data=to_wire(body),
             headers=combined_headers,
             proxies=proxies,
-            auth=self.auth,
+            auth=auth,
             timeout=self.timeout,
             verify=self.ssl_verify_cert,
             cert=self.ssl_cert,
+            stream=stream,
         )
 
         r_headers = CaseInsensitiveDict(r.headers)
 
-        # Handle 429/503 responses: raise RateLimitError so the caller can decide whether to retry
-        error.raise_if_rate_limited(r.status_code, str(url_obj), r_headers.get("Retry-After"))
-
-        # Handle 401: negotiate auth then retry
+        # Handle 429/503 responses: raise RateLimitError so the caller can decide whether to retry.
+        # The response is closed, as a streamed body would otherwise hold on to the connection.
+        try:
+            error.raise_if_rate_limited(r.status_code, str(url_obj), r_headers.get("Retry-After"))
+        except error.RateLimitError:
+            r.close()
+            raise
+
+        # Handle 401: negotiate auth then retry.  When the client is shared
+        # by several threads, the negotiation is done once, under a lock,
+        # and other threads getting a 401 meanwhile will reuse it.  The
+        # 401 response is closed first, as a streamed body would otherwise
+        # hold on to the connection.
+        if r.status_code == 401 and auth is None and self.auth is not None:
+            r.close()
+            return self._sync_request(url, method, body, headers, stream=stream)
         if self._should_negotiate_auth(r.status_code, r_headers):
-            self._build_auth_from_401(r_headers["WWW-Authenticate"])
-            return self._sync_request(url, method, body, headers)
+            r.close()
+            with self._auth_lock:
+                if not self.auth:
+                    self._build_auth_from_401(r_headers["WWW-Authenticate"])
+            return self._sync_request(url, method, body, headers, stream=stream)
 
         # Raise AuthorizationError for 401/403 after auth attempt
         if r.status_code in (401, 403):
+            r.close()
             self._raise_authorization_error(str(url_obj), r)
 
-        response = DAVResponse(r, self)
+        ## Error responses are always buffered, so that the error
+        ## message can include the body.  (``stream`` is only passed on
+        ## when set, as DAVResponse may be substituted by a subclass)
+        stream_kwargs = {"stream": True} if stream and r.status_code < 400 else {}
+        response = DAVResponse(r, self, **stream_kwargs)
 
         if error.debug_dump_communication:
             error._dump_communication(method, url, combined_headers, body, response)
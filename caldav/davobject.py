@@ -44,10 +44,25 @@ class DAVObject:
     and an absolute or relative URL, or from the parent object.
     """
 
-    id: str | None = None
-    url: URL | None = None
-    client: Optional["DAVClient"] = None
-    parent: Optional["DAVObject"] = None
+    ## The attributes set in __init__ are kept in slots.  The __dict__
+    ## is allocated only if some other attribute is set, hence objects
+    ## that are only listed (i.e. search results) stay compact, while
+    ## subclasses and library users may still set arbitrary attributes.
+    __slots__ = (
+        "client",
+        "parent",
+        "id",
+        "url",
+        "props",
+        "extra_init_options",
+        "__dict__",
+        "__weakref__",
+    )
+
+    id: str | None
+    url: URL | None
+    client: Optional["DAVClient"]
+    parent: Optional["DAVObject"]
 
     def __init__(
         self,
@@ -230,21 +245,26 @@ class DAVObject:
         query_method="propfind",
         url=None,
         expected_return_value=None,
+        stream: bool = False,
     ) -> "Any | Coroutine[Any, Any, Any]":
         """
         This is an internal method for doing a query.  It's a
         result of code-refactoring work, attempting to consolidate
         similar-looking code into a common method.
 
+        With ``stream=True``, the body of a successful response is
+        not buffered (see :class:`caldav.response.DAVResponse`).
+
         For async clients, returns a coroutine that must be awaited.
         """
         if self.is_async_client:
-            return self._async_query(root, depth, query_method, url, expected_return_value)
+            return self._async_query(root, depth, query_method, url, expected_return_value, stream)
 
         body = self._build_xml_body(root)
         if url is None:
             url = self.url
-        ret = getattr(self.client, query_method)(url, body, depth)
+        stream_kwargs = {"stream": True} if stream else {}
+        ret = getattr(self.client, query_method)(url, body, depth, **stream_kwargs)
         if ret.status == 404:
             raise error.NotFoundError(errmsg(ret))
         if (
@@ -255,7 +275,7 @@ class DAVObject:
             body = to_wire(body)
             if ret.status == 500 and b"D:getetag" not in body and b"<C:calendar-data" in body:
                 body = body.replace(b"<C:calendar-data", b"<D:getetag/><C:calendar-data")
-                return self._query(body, depth, query_method, url, expected_return_value)
+                return self._query(body, depth, query_method, url, expected_return_value, stream)
             raise error.exception_by_method[query_method](errmsg(ret))
         return ret
 
@@ -266,12 +286,14 @@ class DAVObject:
         query_method="propfind",
         url=None,
         expected_return_value=None,
+        stream: bool = False,
     ):
         """Async implementation of _query."""
         body = self._build_xml_body(root)
         if url is None:
             url = self.url
-        ret = await getattr(self.client, query_method)(url, body, depth)
+        stream_kwargs = {"stream": True} if stream else {}
+        ret = await getattr(self.client, query_method)(url, body, depth, **stream_kwargs)
         if ret.status == 404:
             raise error.NotFoundError(errmsg(ret))
         if (
@@ -281,7 +303,9 @@ class DAVObject:
             body = to_wire(body)
             if ret.status == 500 and b"D:getetag" not in body and b"<C:calendar-data" in body:
                 body = body.replace(b"<C:calendar-data", b"<D:getetag/><C:calendar-data")
-                return await self._query(body, depth, query_method, url, expected_return_value)
+                return await self._query(
+                    body, depth, query_method, url, expected_return_value, stream
+                )
             raise error.exception_by_method[query_method](errmsg(ret))
         return ret
 
@@ -40,9 +40,6 @@ import logging
 from dataclasses import dataclass
 from urllib.parse import urljoin, urlparse
 
-import dns.exception
-import dns.resolver
-
 try:
     import niquests as requests
 except ImportError:
@@ -203,6 +200,10 @@ def _srv_lookup(
 
     log.debug(f"Performing SRV lookup for {srv_name}")
 
+    ## dnspython is only imported when a lookup is done
+    import dns.exception
+    import dns.resolver
+
     try:
         answers = dns.resolver.resolve(srv_name, "SRV")
         results = []
@@ -246,6 +247,9 @@ def _txt_lookup(domain: str, service_type: str, use_tls: bool = True) -> str | N
 
     log.debug(f"Performing TXT lookup for {txt_name}")
 
+    import dns.exception
+    import dns.resolver
+
     try:
         answers = dns.resolver.resolve(txt_name, "TXT")
 
@@ -138,6 +138,17 @@ class Comp(NamedBaseElement):
     tag: ClassVar[str] = ns("C", "comp")
 
 
+class Prop(NamedBaseElement):
+    """Selects an iCalendar property in calendar-data, RFC 4791 section 9.6.4
+    (not to be confused with the WebDAV prop element, dav.Prop)"""
+
+    tag: ClassVar[str] = ns("C", "prop")
+
+
+class Allcomp(BaseElement):
+    tag: ClassVar[str] = ns("C", "allcomp")
+
+
 # Properties
 class CalendarUserAddressSet(BaseElement):
     tag: ClassVar[str] = ns("C", "calendar-user-address-set")
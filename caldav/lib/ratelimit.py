@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Pro-active, client-side rate limiting.
+
+Some servers (or providers) only accept a given number of requests
+within some time interval, and will answer with 429 Too Many Requests
+(and possibly some penalty time) if the client is too eager.  Rather
+than waiting for the server to complain, the client may throttle
+itself, as described by the ``interval`` and ``count`` keys of the
+``rate-limit`` feature in :mod:`caldav.compatibility_hints`.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    A token bucket allowing ``count`` requests within ``interval``
+    seconds.
+
+    The bucket starts full, so a burst of ``count`` requests is sent
+    without delay, after that the requests are spread out evenly.
+
+    The same RateLimiter may be shared by several threads (through
+    :meth:`acquire`) and several asyncio tasks (through
+    :meth:`async_acquire`).  Waiting requests are served in the order
+    they arrived, as each request reserves its slot before sleeping.
+    """
+
+    def __init__(self, interval: float, count: int = 1) -> None:
+        if interval <= 0 or count < 1:
+            raise ValueError(f"Invalid rate limit: {count} requests per {interval} seconds")
+        self.interval = interval
+        self.count = count
+        self._rate = count / interval
+        self._tokens = float(count)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(interval={self.interval}, count={self.count})"
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.  Returns the number of seconds
+        the caller has to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.count, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            ## The bucket is in debt - requests queued up before us will
+            ## pay it back first
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def async_acquire(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def rate_limiter_from_settings(
+    rate_limit: dict | None,
+    interval: float | None = None,
+    count: int | None = None,
+) -> RateLimiter | None:
+    """
+    Builds the RateLimiter for a client, if any.
+
+    Args:
+        rate_limit: the ``rate-limit`` feature from the server compatibility hints
+        interval: explicitly given interval, takes precedence over the hints
+        count: explicitly given count, takes precedence over the hints
+    """
+    if interval is None and rate_limit and rate_limit.get("enable"):
+        interval = rate_limit.get("interval")
+        if count is None:
+            count = rate_limit.get("count")
+    if not interval:
+        return None
+    return RateLimiter(interval, count or 1)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+"""
+Client-side expansion of recurrence sets.
+
+Recurring components are expanded through ``recurring-ical-events``
+when the server can't do it.  It covers every corner of RFC 5545, but
+the bookkeeping done for every single occurrence makes it slow for
+year views over hundreds of daily or weekly series.
+
+The common case - a series with one RRULE, possibly with EXDATE and
+RDATE values and overridden instances - is handled here instead.  The
+start times within the range are computed in one pass over the rule,
+EXDATE values and RECURRENCE-ID overrides are applied as set and dict
+lookups, and the occurrences are views sharing the property values of
+the master component.  The results are the same as from
+``recurring-ical-events``, which is used for anything not covered
+here (:func:`expand_recurrence_set` returns None).
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, tzinfo
+
+from dateutil.rrule import rruleset, rrulestr
+from icalendar import Component
+from icalendar.prop import vDDDTypes
+
+## Properties dropped from the occurrences
+_MASTER_ONLY = frozenset(("RRULE", "RDATE", "EXDATE", "DURATION"))
+
+
+class _Unsupported(Exception):
+    """The recurrence set has to be expanded by recurring-ical-events"""
+
+
+def _is_date(value) -> bool:
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def _check_tz(value) -> None:
+    ## pytz time zones need localize() and normalize() after every
+    ## calculation
+    if hasattr(getattr(value, "tzinfo", None), "localize"):
+        raise _Unsupported()
+
+
+def _to_datetime(value: date | datetime, tz: tzinfo | None) -> datetime:
+    """
+    Same conversion as recurring-ical-events does to make dates,
+    floating and zoned times comparable
+    """
+    if _is_date(value):
+        return datetime(value.year, value.month, value.day, tzinfo=tz)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=tz)
+    if tz is None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _comparable(*values):
+    tz = None
+    for value in values:
+        _check_tz(value)
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            tz = value.tzinfo
+            break
+    if all(_is_date(value) for value in values):
+        return values
+    return [_to_datetime(value, tz) for value in values]
+
+
+def _span(component: Component) -> tuple:
+    """The start and end of a component, as recurring-ical-events sees it"""
+    start = component["DTSTART"].dt
+    if "DTEND" in component:
+        end = component["DTEND"].dt
+    elif "DURATION" in component:
+        duration = component["DURATION"].dt
+        if _is_date(start) and duration.seconds:
+            start = datetime(start.year, start.month, start.day)
+        end = start + duration
+    elif _is_date(start):
+        end = start + timedelta(days=1)
+    else:
+        end = start
+    start, end = _comparable(start, end)
+    if start > end:
+        return end, start
+    return start, end
+
+
+def _date_values(component: Component, name: str) -> list:
+    """The values of an EXDATE or RDATE property, which may be repeated"""
+    prop = component.get(name, [])
+    ret = []
+    for values in prop if isinstance(prop, list) else [prop]:
+        ret.extend(value.dt for value in values.dts)
+    return ret
+
+
+def _in_span(span_start: datetime, span_end: datetime, start, end) -> bool:
+    """Same overlap test as recurring-ical-events"""
+    tz = span_start.tzinfo
+    start = _to_datetime(start, tz)
+    end = _to_datetime(end, tz)
+    if start == end:
+        return span_start <= start < span_end or start == span_start == span_end
+    if span_start == span_end:
+        return start <= span_start < end
+    return start < span_end and span_start < end
+
+
+def _date_prop(value, like: vDDDTypes) -> vDDDTypes:
+    """
+    A property holding the value, sharing the parameters of ``like``
+    if they fit - building new parameters is most of the cost.
+    """
+    if type(value) is type(like.dt) and getattr(value, "tzinfo", None) is getattr(
+        like.dt, "tzinfo", None
+    ):
+        ret = vDDDTypes.__new__(vDDDTypes)
+        ret.dt = value
+        ret.params = like.params
+        return ret
+    return vDDDTypes(value)
+
+
+def _template(component: Component) -> tuple:
+    """What the occurrences of ``component`` are built from"""
+    dtstart = component["DTSTART"]
+    items = [(key, value) for key, value in component.items() if key not in _MASTER_ONLY]
+    return (component, items, dtstart, component.get("DTEND", dtstart))
+
+
+def _occurrence(template: tuple, start, end, sequence) -> Component:
+    """
+    A shallow view of a component, moved to ``start``-``end``.  The
+    property values and subcomponents are shared with the component.
+    """
+    (component, items, dtstart, dtend) = template
+    ret = type(component)()
+    setitem = OrderedDict.__setitem__
+    for key, value in items:
+        setitem(ret, key, value)
+    setitem(ret, "DTSTART", _date_prop(start, dtstart))
+    setitem(ret, "DTEND", _date_prop(end, dtend))
+    if "RECURRENCE-ID" not in ret:
+        setitem(ret, "RECURRENCE-ID", _date_prop(start, dtstart))
+    if sequence is not None:
+        setitem(ret, "SEQUENCE", sequence)
+    ret.subcomponents = list(component.subcomponents)
+    return ret
+
+
+def _expand(components: list[Component], start: datetime, end: datetime) -> list[Component]:
+    (master,) = [x for x in components if "RRULE" in x]
+    overrides = [x for x in components if x is not master]
+    rrule = master["RRULE"]
+    if (
+        master.name != "VEVENT"
+        or isinstance(rrule, list)
+        or "EXRULE" in master
+        or "RECURRENCE-ID" in master
+        or any(
+            x.name != "VEVENT"
+            or "RRULE" in x
+            or "RECURRENCE-ID" not in x
+            or "RANGE" in x["RECURRENCE-ID"].params
+            for x in overrides
+        )
+    ):
+        raise _Unsupported()
+
+    ## The "local" time line of the series: zoned if DTSTART is,
+    ## otherwise naive (dates and floating times)
+    master_start, master_end = _span(master)
+    tz = getattr(master_start, "tzinfo", None)
+    exdates = _date_values(master, "EXDATE")
+    rdates = _date_values(master, "RDATE")
+    for value in exdates + rdates:
+        _check_tz(value)
+        if isinstance(value, tuple) or (
+            tz is None and isinstance(value, datetime) and value.tzinfo is not None
+        ):
+            raise _Unsupported()
+    all_dates = _is_date(master["DTSTART"].dt) and _is_date(master_end)
+    series_start = _to_datetime(master_start, tz)
+    duration = _to_datetime(master_end, tz) - series_start
+
+    rules = rruleset()
+    rule = rrulestr(rrule.to_ical().decode(), dtstart=series_start)
+    rules.rrule(rule)
+    for value in rdates:
+        rules.rdate(_to_datetime(value, tz))
+    until = rrule.get("UNTIL")
+    if not until or series_start <= _to_datetime(until[0], tz):
+        rules.rdate(series_start)
+
+    excluded = {_to_datetime(x, tz) for x in exdates}
+    excluded_dates = {x for x in exdates if _is_date(x)}
+    by_recurrence_id = {}
+    for override in overrides:
+        recurrence_id = override["RECURRENCE-ID"].dt
+        _check_tz(recurrence_id)
+        if tz is None and isinstance(recurrence_id, datetime) and recurrence_id.tzinfo:
+            raise _Unsupported()
+        by_recurrence_id[_to_datetime(recurrence_id, tz)] = override
+
+    sequences = [x["SEQUENCE"] for x in components if "SEQUENCE" in x]
+    sequence = max(sequences) if sequences else None
+
+    if tz is None:
+        range_start = start.replace(tzinfo=None)
+        range_end = end.replace(tzinfo=None)
+    else:
+        range_start, range_end = start, end
+
+    template = _template(master)
+    ret = []
+    for occurrence_start in rules.between(range_start - duration, range_end, inc=True):
+        if occurrence_start in excluded or occurrence_start.date() in excluded_dates:
+            continue
+        override = by_recurrence_id.pop(occurrence_start, None)
+        if override is not None:
+            if _in_span(start, end, *_span(override)):
+                ret.append(_occurrence(_template(override), *_span(override), sequence))
+            continue
+        occurrence_end = occurrence_start + duration
+        if _in_span(start, end, occurrence_start, occurrence_end):
+            if all_dates:
+                occurrence_start = occurrence_start.date()
+                occurrence_end = occurrence_end.date()
+            ret.append(_occurrence(template, occurrence_start, occurrence_end, sequence))
+
+    ## Overrides moved into the range from somewhere outside of it
+    for recurrence_id, override in by_recurrence_id.items():
+        if recurrence_id in excluded:
+            continue
+        if _in_span(start, end, *_span(override)):
+            ret.append(_occurrence(_template(override), *_span(override), sequence))
+    return ret
+
+
+def expand_recurrence_set(
+    components: list[Component],
+    start: datetime | None,
+    end: datetime | None,
+    comptypes=("VEVENT", "VTODO", "VJOURNAL"),
+) -> list[Component] | None:
+    """
+    Expands a recurrence set (the master component and the overridden
+    instances) into the occurrences overlapping ``start``-``end``.
+
+    The occurrences share the property values and subcomponents of
+    the components they come from, and should be treated as read-only.
+
+    :param components: The components of one calendar object resource
+    :param start: Start of the range, timezone-aware
+    :param end: End of the range, timezone-aware
+    :param comptypes: Component types to expand
+    :return: The occurrences, or None if the recurrence set needs to
+      be expanded by ``recurring-ical-events``
+    """
+    if not (
+        isinstance(start, datetime)
+        and isinstance(end, datetime)
+        and start.tzinfo is not None
+        and end.tzinfo is not None
+        and start <= end
+        and "VEVENT" in comptypes
+        and len([x for x in components if "RRULE" in x]) == 1
+    ):
+        return None
+    try:
+        _check_tz(start)
+        return _expand(components, start, end)
+    except (_Unsupported, KeyError, TypeError, ValueError):
+        return None
@@ -11,6 +11,20 @@ if sys.version_info < (3, 11):
 else:
     from typing import Self
 
+## URL objects are immutable, so the results of canonical() and join()
+## may be shared.  Those caches map from the URL strings to the
+## resulting URL objects.  They are simply emptied when full.
+_CACHE_SIZE = 4096
+_canonical_cache: dict[str, "URL"] = {}
+_join_cache: dict[tuple[str, str], "URL"] = {}
+
+
+def _cache_put(cache: dict, key: Any, value: "URL") -> "URL":
+    if len(cache) >= _CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+    return value
+
 
 class URL:
     """
@@ -40,15 +54,32 @@ class URL:
     maintaining backward compatibility.  Basically, all methods should
     accept any kind of URL.
 
+    URL objects are immutable.  The parsed URL, the canonical URL and
+    the hash are computed when first needed and then kept.
     """
 
+    ## No per-instance __dict__ - there may be a lot of URL objects around
+    __slots__ = ("url_raw", "url_parsed", "_canonical", "_hash")
+
     def __init__(self, url: str | ParseResult | SplitResult) -> None:
+        set_ = object.__setattr__
         if isinstance(url, ParseResult) or isinstance(url, SplitResult):
-            self.url_parsed: ParseResult | SplitResult | None = url
-            self.url_raw = None
+            set_(self, "url_parsed", url)
+            set_(self, "url_raw", None)
         else:
-            self.url_raw = url
-            self.url_parsed = None
+            set_(self, "url_raw", url)
+            set_(self, "url_parsed", None)
+        set_(self, "_canonical", None)
+        set_(self, "_hash", None)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        raise AttributeError("URL objects are immutable")
+
+    def __delattr__(self, attr: str) -> None:
+        raise AttributeError("URL objects are immutable")
+
+    def __reduce__(self):
+        return (URL, (self.url_parsed if self.url_raw is None else self.url_raw,))
 
     def __bool__(self) -> bool:
         if self.url_raw or self.url_parsed:
@@ -70,7 +101,9 @@ class URL:
 
     def __hash__(self) -> int:
         # Must use canonical form to match __eq__ behavior
-        return hash(str(self.canonical()))
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(str(self.canonical())))
+        return self._hash
 
     # TODO: better naming?  Will return url if url is already a URL
     # object, else will instantiate a new URL object
@@ -81,18 +114,33 @@ class URL:
         else:
             return URL(url)
 
+    def _parsed(self) -> ParseResult | SplitResult:
+        if self.url_parsed is None:
+            object.__setattr__(
+                self, "url_parsed", cast(urllib.parse.ParseResult, urlparse(self.url_raw))
+            )
+        return self.url_parsed
+
     # To deal with all kind of methods/properties in the ParseResult
     # class
     def __getattr__(self, attr: str):
-        if "url_parsed" not in vars(self):
-            raise AttributeError
-        if self.url_parsed is None:
-            self.url_parsed = cast(urllib.parse.ParseResult, urlparse(self.url_raw))
-        if hasattr(self.url_parsed, attr):
-            return getattr(self.url_parsed, attr)
+        ## Unset slots (i.e. while unpickling) end up here
+        if attr in URL.__slots__:
+            raise AttributeError(attr)
+        url_parsed = self._parsed()
+        if hasattr(url_parsed, attr):
+            return getattr(url_parsed, attr)
         else:
             return getattr(self.__unicode__(), attr)
 
+    ## The most used ParseResult attributes, without the __getattr__ detour
+    scheme = property(lambda self: self._parsed().scheme)
+    netloc = property(lambda self: self._parsed().netloc)
+    path = property(lambda self: self._parsed().path)
+    hostname = property(lambda self: self._parsed().hostname)
+    port = property(lambda self: self._parsed().port)
+    username = property(lambda self: self._parsed().username)
+
     # returns the url in text format
     def __str__(self) -> str:
         return to_normal_str(self.__unicode__())
@@ -103,7 +151,7 @@ class URL:
             if self.url_parsed is None:
                 raise ValueError("Unexpected value None for self.url_parsed")
 
-            self.url_raw = self.url_parsed.geturl()
+            object.__setattr__(self, "url_raw", self.url_parsed.geturl())
         return to_unicode(self.url_raw)
 
     def __repr__(self) -> str:
@@ -137,10 +185,23 @@ class URL:
         a canonical URL ... remove authentication details, make sure there
         are no double slashes, and to make sure the URL is always the same,
         run it through the urlparser, and make sure path is properly quoted
+
+        The canonical URL is computed once per URL object, and shared
+        between URL objects with the same string.
         """
+        if self._canonical is not None:
+            return self._canonical
+        key = str(self)
+        url = _canonical_cache.get(key)
+        if url is None:
+            url = _cache_put(_canonical_cache, key, self._make_canonical())
+        object.__setattr__(self, "_canonical", url)
+        return url
+
+    def _make_canonical(self) -> "URL":
         url = self.unauth()
 
-        arr = list(cast(urllib.parse.ParseResult, self.url_parsed))
+        arr = list(cast(urllib.parse.ParseResult, self._parsed()))
         ## quoting path and removing double slashes
         arr[2] = quote(unquote(url.path.replace("//", "/")))
         ## sensible defaults
@@ -155,11 +216,10 @@ class URL:
                 portpart = ""
             arr[1] += portpart
 
-        # make sure to delete the string version
-        url.url_raw = urlunparse(arr)
-        url.url_parsed = None
-
-        return url
+        canonical = URL(sys.intern(urlunparse(arr)))
+        ## The canonical URL is its own canonical URL
+        object.__setattr__(canonical, "_canonical", canonical)
+        return canonical
 
     def join(self, path: Any) -> "URL":
         """
@@ -172,6 +232,13 @@ class URL:
         pathAsString = str(path)
         if not path or not pathAsString:
             return self
+        key = (str(self), pathAsString)
+        ret = _join_cache.get(key)
+        if ret is None:
+            ret = _cache_put(_join_cache, key, self._join(path))
+        return ret
+
+    def _join(self, path: Any) -> "URL":
         path = URL.objectify(path)
         if (
             (path.scheme and self.scheme and path.scheme != self.scheme)
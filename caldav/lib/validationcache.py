@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+HTTP validation cache for calendar object resources.
+
+When enabled on the client (``DAVClient(validation_cache=True)``),
+:meth:`caldav.calendarobjectresource.CalendarObjectResource.load`
+remembers the etag and the calendar data of each object it loads.  The
+next load of the same URL is sent as a conditional GET with
+``If-None-Match``, and if the server responds 304 Not Modified, the
+remembered data is used rather than transferring and parsing it again.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class ValidationCache:
+    """
+    Maps canonical object URLs to the ``(etag, data)`` last loaded
+    from the server.  Only the ``maxsize`` most recently used entries
+    are kept.  The cache may be shared by several threads.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> tuple[str, str] | None:
+        """Returns ``(etag, data)`` for the URL, or None"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, url: str, etag: str, data: str) -> None:
+        with self._lock:
+            self._entries[url] = (etag, data)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, url: str) -> None:
+        with self._lock:
+            self._entries.pop(url, None)
+
+
+def validation_cache_from_settings(
+    validation_cache: "bool | ValidationCache | None",
+) -> ValidationCache | None:
+    """The validation cache for a client, given the constructor parameter"""
+    if isinstance(validation_cache, ValidationCache):
+        return validation_cache
+    return ValidationCache() if validation_cache else None
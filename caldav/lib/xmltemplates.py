@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Pre-serialized XML request bodies.
+
+Most REPORT bodies sent by the library look the same every time, except
+for a few values (hrefs, a sync token, a time range).  Building the
+element tree and serializing it through lxml for every request is
+wasteful for clients polling at a high rate.  A :class:`BodyTemplate`
+is serialized once, with :data:`SLOT` in place of the variable values,
+and rendering it is only a matter of joining byte strings.
+"""
+
+from lxml import etree
+
+from caldav.elements.base import BaseElement
+
+## Placeholder for the variable parts when a template is serialized.
+## (It must be something lxml leaves as it is, both in text and in
+## attribute values)
+SLOT = "caldav-template-slot"
+
+
+def escape(value: str) -> bytes:
+    """Escapes text the same way as lxml does when serializing"""
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\r", "&#13;")
+        .encode("utf-8")
+    )
+
+
+class BodyTemplate:
+    """
+    A request body serialized with :data:`SLOT` in place of the
+    variable values.
+    """
+
+    def __init__(self, root: BaseElement) -> None:
+        body = etree.tostring(root.xmlelement(), encoding="utf-8", xml_declaration=True)
+        self.parts = body.split(SLOT.encode())
+        if len(self.parts) == 2:
+            ## The separator for repeating the element holding the slot,
+            ## i.e. b"</D:href><D:href>"
+            (head, tail) = self.parts
+            self.separator = tail[: tail.index(b">") + 1] + head[head.rindex(b"<") :]
+
+    def render(self, *values: str) -> bytes:
+        """Fills in the values, in document order"""
+        ret = [self.parts[0]]
+        for value, part in zip(values, self.parts[1:], strict=True):
+            ret += [escape(value), part]
+        return b"".join(ret)
+
+    def render_list(self, values: list[str]) -> bytes:
+        """
+        Repeats the element holding the only slot once for every value.
+        There has to be at least one value.
+        """
+        (head, tail) = self.parts
+        return head + self.separator.join(escape(value) for value in values) + tail
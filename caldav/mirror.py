@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""
+A persistent, local copy of calendars.
+
+A :class:`caldav.collection.SynchronizableCalendarObjectCollection`
+lives in memory only, so every process restart means downloading the
+full calendars again.  The :class:`CalendarMirror` keeps the calendar
+data, etags, schedule-tags and the sync token in an SQLite database,
+so that after a restart only the changes since the last run needs to
+be fetched from the server::
+
+    mirror = CalendarMirror()
+    (updated, deleted) = mirror.sync(calendar)
+    for event in mirror.objects(calendar):
+        ...
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Coroutine, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .collection import (
+    MULTIGET_MAX_CONCURRENCY,
+    SynchronizableCalendarObjectCollection,
+)
+from .elements import cdav, dav
+
+if TYPE_CHECKING:
+    from .calendarobjectresource import CalendarObjectResource
+    from .collection import Calendar
+
+log = logging.getLogger("caldav")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    url TEXT PRIMARY KEY,
+    sync_token TEXT
+);
+CREATE TABLE IF NOT EXISTS objects (
+    url TEXT PRIMARY KEY,
+    collection TEXT NOT NULL,
+    data TEXT NOT NULL,
+    etag TEXT,
+    schedule_tag TEXT
+);
+CREATE INDEX IF NOT EXISTS objects_collection ON objects (collection);
+"""
+
+
+def default_mirror_path() -> Path:
+    """
+    ``$XDG_CACHE_HOME/caldav/mirror.sqlite``, with ``~/.cache`` as the
+    default cache directory
+    """
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.environ.get("HOME", "/"), ".cache"
+    )
+    return Path(cache_dir) / "caldav" / "mirror.sqlite"
+
+
+class CalendarMirror:
+    """
+    Local copies of calendars, kept in an SQLite database.
+
+    The calendars and objects are keyed by their canonical URL, so
+    the same database may hold calendars from several servers and
+    accounts.  The mirror may be shared between threads.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        """
+        Args:
+          path: The SQLite database file, created if needed.  Defaults
+            to :func:`default_mirror_path`.  ``":memory:"`` gives a
+            non-persistent mirror.
+        """
+        if path is None:
+            path = default_mirror_path()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "CalendarMirror":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def sync_token(self, calendar: "Calendar") -> str | None:
+        """The stored sync token for the calendar, None if it's not mirrored"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT sync_token FROM collections WHERE url = ?",
+                (str(calendar.url.canonical()),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def objects(self, calendar: "Calendar") -> SynchronizableCalendarObjectCollection:
+        """
+        Returns the stored copy of the calendar, without contacting the
+        server.  The collection is empty and has no sync token if the
+        calendar has not been mirrored yet.
+        """
+        sync_token = self.sync_token(calendar)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url, data, etag, schedule_tag FROM objects WHERE collection = ? "
+                "ORDER BY url",
+                (str(calendar.url.canonical()),),
+            ).fetchall()
+        objects = []
+        for url, data, etag, schedule_tag in rows:
+            props = {}
+            if etag is not None:
+                props[dav.GetEtag.tag] = etag
+            if schedule_tag is not None:
+                props[cdav.ScheduleTag.tag] = schedule_tag
+            objects.append(
+                calendar._calendar_comp_class_by_data(data)(
+                    calendar.client, url=url, data=data, parent=calendar, props=props
+                )
+            )
+        return SynchronizableCalendarObjectCollection(
+            calendar=calendar, objects=objects, sync_token=sync_token
+        )
+
+    def sync(
+        self,
+        calendar: "Calendar",
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
+    ) -> "tuple[list[Any], list[Any]] | Coroutine[Any, Any, tuple[list[Any], list[Any]]]":
+        """
+        Brings the stored copy of the calendar up to date with the server.
+
+        The first time, all objects are downloaded.  After that, the
+        stored sync token is passed to
+        :meth:`caldav.collection.Calendar.get_objects_by_sync_token`,
+        so only the changed objects are downloaded.
+
+        Returns a tuple of the updated (or new) and the deleted
+        objects, like :meth:`SynchronizableCalendarObjectCollection.sync`.
+        For async clients, a coroutine is returned.
+
+        ## WARNING: async logic is duplicated in _async_sync — mirror any changes there
+        """
+        if calendar.is_async_client:
+            return self._async_sync(calendar, multiget_chunk_size, max_concurrency)
+        collection = self.objects(calendar)
+        if collection.sync_token is None:
+            collection = calendar.get_objects_by_sync_token(
+                load_objects=True,
+                multiget_chunk_size=multiget_chunk_size,
+                max_concurrency=max_concurrency,
+            )
+            return self._store(calendar, collection.sync_token, collection, [], replace=True)
+        (updated, deleted) = collection.sync(multiget_chunk_size, max_concurrency)
+        return self._store(calendar, collection.sync_token, updated, deleted)
+
+    async def _async_sync(
+        self,
+        calendar: "Calendar",
+        multiget_chunk_size: int | None = None,
+        max_concurrency: int = MULTIGET_MAX_CONCURRENCY,
+    ) -> tuple[list[Any], list[Any]]:
+        ## WARNING: sync logic is duplicated in sync — mirror any changes there
+        collection = self.objects(calendar)
+        if collection.sync_token is None:
+            collection = await calendar.get_objects_by_sync_token(
+                load_objects=True,
+                multiget_chunk_size=multiget_chunk_size,
+                max_concurrency=max_concurrency,
+            )
+            return self._store(calendar, collection.sync_token, collection, [], replace=True)
+        (updated, deleted) = await collection.sync(multiget_chunk_size, max_concurrency)
+        return self._store(calendar, collection.sync_token, updated, deleted)
+
+    def forget(self, calendar: "Calendar") -> None:
+        """Deletes the stored copy of the calendar"""
+        collection_url = str(calendar.url.canonical())
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM objects WHERE collection = ?", (collection_url,))
+            self._db.execute("DELETE FROM collections WHERE url = ?", (collection_url,))
+
+    def _store(
+        self,
+        calendar: "Calendar",
+        sync_token: Any,
+        updated: Iterable["CalendarObjectResource"],
+        deleted: Iterable["CalendarObjectResource"],
+        replace: bool = False,
+    ) -> tuple[list[Any], list[Any]]:
+        """
+        Writes the changes to the database, in one transaction - so the
+        sync token never gets out of step with the objects.  Objects
+        without data (i.e. deleted while syncing) are not stored.
+        """
+        collection_url = str(calendar.url.canonical())
+        updated = [obj for obj in updated if obj.is_loaded()]
+        deleted = list(deleted)
+        rows = [
+            (
+                str(obj.url.canonical()),
+                collection_url,
+                obj.data,
+                obj.props.get(dav.GetEtag.tag),
+                obj.props.get(cdav.ScheduleTag.tag),
+            )
+            for obj in updated
+        ]
+        with self._lock, self._db:
+            if replace:
+                self._db.execute("DELETE FROM objects WHERE collection = ?", (collection_url,))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO objects (url, collection, data, etag, schedule_tag) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.executemany(
+                "DELETE FROM objects WHERE url = ?",
+                [(str(obj.url.canonical()),) for obj in deleted],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO collections (url, sync_token) VALUES (?, ?)",
+                (collection_url, None if sync_token is None else str(sync_token)),
+            )
+        log.debug(f"Mirror of {collection_url}: {len(rows)} objects stored, {len(deleted)} deleted")
+        return (updated, deleted)
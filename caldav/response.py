@@ -2,9 +2,10 @@
 DAV response parsing: base class, result types and XML parse functions.
 """
 
+import inspect
 import logging
 import warnings
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import unquote
@@ -12,7 +13,6 @@ from urllib.parse import unquote
 from lxml import etree
 from lxml.etree import _Element
 
-from caldav.calendarobjectresource import FreeBusy
 from caldav.elements import cdav, dav
 from caldav.elements.base import BaseElement
 from caldav.lib import error
@@ -24,13 +24,17 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+## Size of the chunks read from the HTTP stream when a response is parsed
+## incrementally (see ``DAVResponse(..., stream=True)``)
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Result dataclasses (previously in protocol/types.py)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PropfindResult:
     """Parsed result of a PROPFIND request for a single resource."""
 
@@ -39,7 +43,7 @@ class PropfindResult:
     status: int = 200
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarQueryResult:
     """Parsed result of a calendar-query or calendar-multiget REPORT for a single object."""
 
@@ -49,7 +53,7 @@ class CalendarQueryResult:
     status: int = 200
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncCollectionResult:
     """Parsed result of a sync-collection REPORT."""
 
@@ -177,6 +181,78 @@ def _element_to_value(elem: _Element) -> Any:
     return elem
 
 
+## The default selection of values from a property with child elements
+_PROP_DESCENDANTS = etree.XPath("descendant::*")
+
+
+def _simple_prop_value(
+    proptag: str,
+    prop_xml: _Element,
+    multi_value_allowed: bool = False,
+    xpath: str | None = None,
+) -> str | list[str] | None:
+    """
+    The value of a property element, as text.  A property with child
+    elements gives the text (or the tag, if there is no text) of every
+    descendant.  See DAVResponse.expand_simple_props.
+    """
+    if not xpath and len(prop_xml) == 0 and not prop_xml.attrib:
+        ## The common case, a property with only text
+        text = prop_xml.text
+        if multi_value_allowed:
+            return [text] if text else []
+        return text or None
+    values: list[str] = []
+    for item in prop_xml.items():
+        if proptag == cdav.CalendarData.tag:
+            if item[0].lower().endswith("content-type") and item[1].lower() == "text/calendar":
+                continue
+            if item[0].lower().endswith("version") and item[1] in ("2", "2.0"):
+                continue
+        log.error(
+            f"If you see this, please add a report at https://github.com/python-caldav/caldav/issues/209 - in _expand_simple_prop, dealing with {proptag}, extra item found: {'='.join(item)}."
+        )
+    if not xpath and len(prop_xml) == 0:
+        if prop_xml.text:
+            values.append(prop_xml.text)
+    else:
+        leafs = prop_xml.findall(xpath) if xpath else _PROP_DESCENDANTS(prop_xml)
+        for leaf in leafs:
+            error.assert_(not leaf.items())
+            if leaf.text:
+                values.append(leaf.text)
+            else:
+                values.append(leaf.tag)
+    if multi_value_allowed:
+        return values
+    else:
+        if not values:
+            return None
+        error.assert_(len(values) == 1)
+        return values[0]
+
+
+async def _aiter_response_chunks(response: Any) -> AsyncIterator[bytes]:
+    """Read the body of an async httpx or niquests response in chunks."""
+    if hasattr(response, "aiter_bytes"):
+        ## httpx / httpxyz
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            yield chunk
+    else:
+        ## niquests AsyncResponse - iter_content is a coroutine returning the generator
+        async for chunk in await response.iter_content(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+async def _aclose_response(response: Any) -> None:
+    """Release the connection held by an async httpx or niquests response."""
+    close = getattr(response, "aclose", None) or getattr(response, "close", None)
+    if close is not None:
+        ret = close()
+        if inspect.isawaitable(ret):
+            await ret
+
+
 class DAVResponse:
     """
     Base class containing shared response parsing logic.
@@ -194,15 +270,27 @@ class DAVResponse:
     davclient: Any = None
     results: list[PropfindResult | CalendarQueryResult] | None = None
     _sync_token: str | None = None
+    ## Set when the response was created with stream=True
+    streaming: bool = False
+    _stream_response: Any = None
 
-    def __init__(self, response: "Response", davclient: Any = None) -> None:
-        self._init_from_response(response, davclient)
+    def __init__(self, response: "Response", davclient: Any = None, stream: bool = False) -> None:
+        self._init_from_response(response, davclient, stream=stream)
 
     @classmethod
     def from_bytes(
-        cls, body: bytes, status_code: int = 207, huge_tree: bool = False
+        cls,
+        body: bytes,
+        status_code: int = 207,
+        huge_tree: bool = False,
+        stream: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
     ) -> "DAVResponse":
-        """Construct a DAVResponse from raw bytes — intended for tests."""
+        """Construct a DAVResponse from raw bytes — intended for tests.
+
+        With ``stream=True`` the body is handed to the incremental parser
+        in pieces of ``chunk_size`` bytes, emulating a streamed HTTP body.
+        """
 
         class _FakeResponse:
             headers: dict = {}
@@ -211,6 +299,17 @@ class DAVResponse:
             text = ""
             reason = "OK"
 
+            def iter_content(self, size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+                for i in range(0, len(self.content), chunk_size):
+                    yield self.content[i : i + chunk_size]
+
+            async def aiter_bytes(self, size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+                for chunk in self.iter_content(size):
+                    yield chunk
+
+            def close(self) -> None:
+                pass
+
         fake = _FakeResponse()
         fake.status_code = status_code
         fake.content = body
@@ -220,10 +319,12 @@ class DAVResponse:
         obj.davclient = None
         obj.results = None
         obj._sync_token = None
-        obj._init_from_response(fake)
+        obj._init_from_response(fake, stream=stream)
         return obj
 
-    def _init_from_response(self, response: "Response", davclient: Any = None) -> None:
+    def _init_from_response(
+        self, response: "Response", davclient: Any = None, stream: bool = False
+    ) -> None:
         """
         Initialize response from an HTTP response object.
 
@@ -233,17 +334,35 @@ class DAVResponse:
         Args:
             response: The HTTP response object from niquests
             davclient: Optional reference to the DAVClient for huge_tree setting
+            stream: If True, the body is not read here.  It is consumed
+                incrementally by :meth:`iter_propfind` / :meth:`iter_calendar_query`
+                (or the async twins), which requires the HTTP request to have
+                been sent with streaming enabled.
         """
         self.headers = response.headers
         self.status = response.status_code
         log.debug("response headers: " + str(self.headers))
         log.debug("response status: " + str(self.status))
 
-        self._raw = response.content
         self.davclient = davclient
         if davclient:
             self.huge_tree = davclient.huge_tree
 
+        if stream:
+            ## The body is left on the wire.  Nothing is buffered, and
+            ## the tree is never built.
+            self.streaming = True
+            self._stream_response = response
+            self._raw = ""
+            self.tree = None
+            try:
+                self.reason = getattr(response, "reason_phrase", None) or response.reason
+            except AttributeError:
+                self.reason = ""
+            return
+
+        self._raw = response.content
+
         content_type = self.headers.get("Content-Type", "")
         xml_types = ["text/xml", "application/xml"]
         no_xml_types = ["text/plain", "text/calendar", "application/octet-stream"]
@@ -373,12 +492,34 @@ class DAVResponse:
                     etag = child.text
         return etag, calendar_data
 
+    def _propfind_result(self, elem: _Element) -> PropfindResult:
+        """Build a PropfindResult from one <response> element."""
+        href, propstats, status = self._parse_response(elem)
+        return PropfindResult(
+            href=href,
+            properties=_extract_properties(propstats),
+            status=_status_to_code(status) if status else 200,
+        )
+
+    def _calendar_query_result(self, elem: _Element) -> CalendarQueryResult:
+        """Build a CalendarQueryResult from one <response> element."""
+        href, propstats, status = self._parse_response(elem)
+        etag, calendar_data = self._extract_calendar_query_props(propstats)
+        return CalendarQueryResult(
+            href=href,
+            etag=etag,
+            calendar_data=calendar_data,
+            status=_status_to_code(status) if status else 200,
+        )
+
     def parse_propfind(self) -> "list[PropfindResult]":
         """Parse the response body as a PROPFIND multi-status reply."""
         if self.status == 404:
             return []
         if self.status not in (200, 207):
             raise error.ResponseError(f"PROPFIND failed with status {self.status}")
+        if self.streaming:
+            return list(self.iter_propfind())
         if self.tree is None:
             return []
         results: list[PropfindResult] = []
@@ -388,38 +529,182 @@ class DAVResponse:
                 continue
             if elem.tag != dav.Response.tag:
                 continue
-            href, propstats, status = self._parse_response(elem)
-            results.append(
-                PropfindResult(
-                    href=href,
-                    properties=_extract_properties(propstats),
-                    status=_status_to_code(status) if status else 200,
-                )
-            )
+            results.append(self._propfind_result(elem))
         return results
 
     def parse_calendar_query(self) -> "list[CalendarQueryResult]":
         """Parse the response body as a calendar-query or calendar-multiget REPORT reply."""
         if self.status not in (200, 207):
             raise error.ResponseError(f"REPORT failed with status {self.status}")
+        if self.streaming:
+            return list(self.iter_calendar_query())
         if self.tree is None:
             return []
         results: list[CalendarQueryResult] = []
         for elem in self._strip_to_multistatus():
             if elem.tag != dav.Response.tag:
                 continue
-            href, propstats, status = self._parse_response(elem)
-            etag, calendar_data = self._extract_calendar_query_props(propstats)
-            results.append(
-                CalendarQueryResult(
-                    href=href,
-                    etag=etag,
-                    calendar_data=calendar_data,
-                    status=_status_to_code(status) if status else 200,
-                )
-            )
+            results.append(self._calendar_query_result(elem))
         return results
 
+    ## Incremental parsing.
+    ##
+    ## The iter_* / aiter_* methods below yield one result per
+    ## <response> element.  On a response created with stream=True the
+    ## body is fed chunk by chunk into an lxml pull parser, and every
+    ## <response> subtree is unlinked from the document as soon as it
+    ## has been converted, so memory usage does not grow with the
+    ## number of objects in the reply.  On an ordinary response they
+    ## simply iterate over the already parsed tree.
+
+    def iter_propfind(self) -> Iterator[PropfindResult]:
+        """Iterate over a PROPFIND multi-status reply, one PropfindResult at a time."""
+        if not self.streaming:
+            yield from self.parse_propfind()
+            return
+        if self.status == 404:
+            self._release_stream()
+            return
+        self._check_stream_status("PROPFIND")
+        for elem in self._iter_stream_elements():
+            yield self._propfind_result(elem)
+
+    def iter_calendar_query(self) -> Iterator[CalendarQueryResult]:
+        """Iterate over a calendar-query / calendar-multiget REPORT reply,
+        one CalendarQueryResult at a time."""
+        if not self.streaming:
+            yield from self.parse_calendar_query()
+            return
+        self._check_stream_status("REPORT")
+        for elem in self._iter_stream_elements():
+            yield self._calendar_query_result(elem)
+
+    async def aiter_propfind(self) -> AsyncIterator[PropfindResult]:
+        """Async twin of :meth:`iter_propfind`."""
+        if not self.streaming:
+            for result in self.parse_propfind():
+                yield result
+            return
+        if self.status == 404:
+            await self._arelease_stream()
+            return
+        await self._acheck_stream_status("PROPFIND")
+        async for elem in self._aiter_stream_elements():
+            yield self._propfind_result(elem)
+
+    async def aiter_calendar_query(self) -> AsyncIterator[CalendarQueryResult]:
+        """Async twin of :meth:`iter_calendar_query`."""
+        if not self.streaming:
+            for result in self.parse_calendar_query():
+                yield result
+            return
+        await self._acheck_stream_status("REPORT")
+        async for elem in self._aiter_stream_elements():
+            yield self._calendar_query_result(elem)
+
+    def _take_stream(self) -> Any:
+        """Hand over the underlying HTTP response.  A streamed body can only be read once."""
+        response = self._stream_response
+        if response is None:
+            raise error.ResponseError("the streamed response body has already been consumed")
+        self._stream_response = None
+        return response
+
+    def _release_stream(self) -> None:
+        if self._stream_response is not None:
+            response = self._take_stream()
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+    async def _arelease_stream(self) -> None:
+        if self._stream_response is not None:
+            await _aclose_response(self._take_stream())
+
+    async def _abuffer_stream(self) -> None:
+        """Read a streamed body in full, turning this into a buffered response.
+
+        Used for error replies, so that the error message can include the body.
+        """
+        response = self._take_stream()
+        try:
+            self._raw = b"".join([chunk async for chunk in _aiter_response_chunks(response)])
+        finally:
+            await _aclose_response(response)
+        self.streaming = False
+
+    def _check_stream_status(self, method: str) -> None:
+        if self.status not in (200, 207):
+            self._release_stream()
+            raise error.ResponseError(f"{method} failed with status {self.status}")
+
+    async def _acheck_stream_status(self, method: str) -> None:
+        if self.status not in (200, 207):
+            await self._arelease_stream()
+            raise error.ResponseError(f"{method} failed with status {self.status}")
+
+    def _new_stream_parser(self) -> "etree.XMLPullParser":
+        return etree.XMLPullParser(
+            events=("end",),
+            tag=(dav.Response.tag, dav.SyncToken.tag),
+            remove_blank_text=True,
+            huge_tree=self.huge_tree,
+        )
+
+    def _read_stream_events(self, parser: "etree.XMLPullParser") -> Iterator[_Element]:
+        """Yield the completed <response> elements, and drop each of them
+        from the document once the caller is done with it."""
+        for _event, elem in parser.read_events():
+            parent = elem.getparent()
+            if elem.tag == dav.SyncToken.tag:
+                ## A sync-token may also be a requested property inside
+                ## a <prop>.  Only the top level one is the collection token.
+                if parent is not None and parent.tag == dav.MultiStatus.tag:
+                    self._sync_token = elem.text
+                    parent.remove(elem)
+                continue
+            yield elem
+            if parent is not None:
+                parent.remove(elem)
+
+    def _iter_stream_elements(self) -> Iterator[_Element]:
+        response = self._take_stream()
+        parser = self._new_stream_parser()
+        fed = False
+        try:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                fed = True
+                parser.feed(chunk)
+                yield from self._read_stream_events(parser)
+            if fed:
+                parser.close()
+                yield from self._read_stream_events(parser)
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+    async def _aiter_stream_elements(self) -> AsyncIterator[_Element]:
+        response = self._take_stream()
+        parser = self._new_stream_parser()
+        fed = False
+        try:
+            async for chunk in _aiter_response_chunks(response):
+                if not chunk:
+                    continue
+                fed = True
+                parser.feed(chunk)
+                for elem in self._read_stream_events(parser):
+                    yield elem
+            if fed:
+                parser.close()
+                for elem in self._read_stream_events(parser):
+                    yield elem
+        finally:
+            await _aclose_response(response)
+
     def parse_sync_collection(self) -> "SyncCollectionResult":
         """Parse the response body as a sync-collection REPORT reply."""
         if self.status not in (200, 207):
@@ -513,6 +798,8 @@ class DAVResponse:
               * errors - dict with email addresses -> error messages
 
         """
+        from caldav.calendarobjectresource import FreeBusy
+
         self.objects = {}
         self.objects["errors"] = {}
         error.assert_(self.tree.tag == cdav.ScheduleResponse.tag)
@@ -579,10 +866,19 @@ class DAVResponse:
     ## protocol.xml_parsers layer is a better approach.  Look for more
     ## cases of old code that was is still remaining after the
     ## protocol layer refactoring
-    def _find_objects_and_props(self) -> dict[str, dict[str, _Element]]:
-        """Internal implementation of find_objects_and_props without deprecation warning."""
+    def _find_objects_and_props(
+        self, expand: dict[str, bool] | None = None
+    ) -> dict[str, dict[str, _Element]]:
+        """Internal implementation of find_objects_and_props without deprecation warning.
+
+        ``expand`` maps property tags to whether multiple values are
+        allowed.  Those properties are stored as values (see
+        :meth:`expand_simple_props`) rather than as elements, in the
+        same pass.
+        """
         self.objects: dict[str, dict[str, _Element]] = {}
         self.statuses: dict[str, str] = {}
+        expand = expand or {}
 
         ## TODO: the schedule_tag is not used anywhere as for now
         ## TODO: should it be set somewhere else? (now it's not
@@ -591,6 +887,8 @@ class DAVResponse:
             self.schedule_tag = self.headers["Schedule-Tag"]
 
         responses = self._strip_to_multistatus()
+        prop_tag = dav.Prop.tag
+        status_tag = dav.Status.tag
 
         for r in responses:
             if r.tag == dav.SyncToken.tag:
@@ -605,28 +903,42 @@ class DAVResponse:
             if href not in self.objects:
                 self.objects[href] = {}
                 self.statuses[href] = status
+            props_found = self.objects[href]
 
             ## The properties may be delivered either in one
             ## propstat with multiple props or in multiple
             ## propstat
             for propstat in propstats:
-                cnt = 0
-                status = propstat.find(dav.Status.tag)
+                ## One pass over the children, there shouldn't be
+                ## any other elements than status and prop
+                status = None
+                props = []
+                for elem in propstat:
+                    if elem.tag == prop_tag:
+                        props.append(elem)
+                    else:
+                        error.assert_(elem.tag == status_tag and status is None)
+                        status = elem
                 error.assert_(status is not None)
                 if status is not None and status.text is not None:
                     error.assert_(len(status) == 0)
-                    cnt += 1
                     self.validate_status(status.text)
                     ## if a prop was not found, ignore it
                     if " 404 " in status.text:
                         continue
-                for prop in propstat.iterfind(dav.Prop.tag):
-                    cnt += 1
+                for prop in props:
                     for theprop in prop:
-                        self.objects[href][theprop.tag] = theprop
-
-                ## there shouldn't be any more elements except for status and prop
-                error.assert_(cnt == len(propstat))
+                        tag = theprop.tag
+                        if tag in expand:
+                            props_found[tag] = _simple_prop_value(tag, theprop, expand[tag])
+                        else:
+                            props_found[tag] = theprop
+
+        if expand:
+            for props_found in self.objects.values():
+                for tag, multi_value_allowed in expand.items():
+                    if tag not in props_found:
+                        props_found[tag] = [] if multi_value_allowed else None
 
         return self.objects
 
@@ -659,41 +971,11 @@ class DAVResponse:
         multi_value_allowed: bool = False,
         xpath: str | None = None,
     ) -> str | list[str] | None:
-        values: list[str] = []
         if proptag in props_found:
-            prop_xml = props_found[proptag]
-            for item in prop_xml.items():
-                if proptag == cdav.CalendarData.tag:
-                    if (
-                        item[0].lower().endswith("content-type")
-                        and item[1].lower() == "text/calendar"
-                    ):
-                        continue
-                    if item[0].lower().endswith("version") and item[1] in ("2", "2.0"):
-                        continue
-                log.error(
-                    f"If you see this, please add a report at https://github.com/python-caldav/caldav/issues/209 - in _expand_simple_prop, dealing with {proptag}, extra item found: {'='.join(item)}."
-                )
-            if not xpath and len(prop_xml) == 0:
-                if prop_xml.text:
-                    values.append(prop_xml.text)
-            else:
-                _xpath = xpath if xpath else ".//*"
-                leafs = prop_xml.findall(_xpath)
-                values = []
-                for leaf in leafs:
-                    error.assert_(not leaf.items())
-                    if leaf.text:
-                        values.append(leaf.text)
-                    else:
-                        values.append(leaf.tag)
-        if multi_value_allowed:
-            return values
-        else:
-            if not values:
-                return None
-            error.assert_(len(values) == 1)
-            return values[0]
+            return _simple_prop_value(
+                proptag, props_found[proptag], multi_value_allowed, xpath=xpath
+            )
+        return [] if multi_value_allowed else None
 
     ## TODO: word "expand" does not feel quite right.
     ## TODO: I'm considering to deprecate this in v4
@@ -712,12 +994,20 @@ class DAVResponse:
         text.
 
         Executes find_objects_and_props if not run already, then
-        modifies and returns self.objects.
+        modifies and returns self.objects.  If it's not run already
+        (and no xpath is given), the props are expanded while the
+        response is traversed, rather than in a second pass.
         """
         props = props or []
         multi_value_props = multi_value_props or []
 
         if not hasattr(self, "objects"):
+            if xpath is None:
+                expand = {prop.tag: False for prop in props if prop.tag is not None}
+                expand.update(
+                    {prop.tag: True for prop in multi_value_props if prop.tag is not None}
+                )
+                return cast(dict[str, dict[str, str]], self._find_objects_and_props(expand))
             self._find_objects_and_props()
         for href in self.objects:
             props_found = self.objects[href]
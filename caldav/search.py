@@ -1,20 +1,26 @@
+import asyncio
 import inspect
 import logging
+import re
+from collections.abc import AsyncIterator, Iterable, Iterator
 from copy import deepcopy
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, Optional
 
 from icalendar import Timezone
 from icalendar.prop import TypesFactory
-from icalendar_searcher import Searcher
+from icalendar_searcher import Searcher, comma_list
 from icalendar_searcher.collation import Collation
 
 from .calendarobjectresource import CalendarObjectResource, Event, Journal, Todo
 from .collection import Calendar
 from .elements import cdav, dav
 from .lib import error
+from .lib.python_utilities import to_unicode
+from .lib.recurrence import expand_recurrence_set
+from .lib.xmltemplates import SLOT, BodyTemplate
 
 if TYPE_CHECKING:
     from .calendarobjectresource import (
@@ -40,6 +46,116 @@ def _collation_to_caldav(collation: Collation, case_sensitive: bool = True) -> s
 collation_to_caldav = _collation_to_caldav
 
 
+def _uid_ruled_out(searcher: "Searcher", obj: "CalendarObjectResource") -> bool:
+    """
+    True if the UID filter of the searcher rules out the object, found
+    by scanning the raw data.  False if it may match, or if the data
+    is already parsed.
+    """
+    operator = searcher._property_operator.get("uid")
+    if (
+        operator not in ("contains", "==")
+        or searcher._property_collation.get("uid") != Collation.SIMPLE
+        or not searcher._property_case_sensitive.get("uid", True)
+    ):
+        return False
+    scan = getattr(obj, "_scan_cheap", None)
+    components = scan(("UID",)) if scan else None
+    if components is None:
+        return False
+    wanted = str(searcher._property_filters["uid"])
+    try:
+        for name, found in components:
+            if name == "VTIMEZONE":
+                continue
+            for uid in found.get("UID", ()):
+                if "\\" in uid or (wanted in uid if operator == "contains" else wanted == uid):
+                    return False
+    except ValueError:
+        return False
+    return True
+
+
+class _SortingDate:
+    """Stand-in for a date property value, for Searcher.sorting_value"""
+
+    __slots__ = ("dt",)
+
+    def __init__(self, dt: date) -> None:
+        self.dt = dt
+
+
+## DATE and DATE-TIME values: "20260301", "20260301T100000" or "20260301T100000Z"
+_RAW_DATE = re.compile(r"(\d{4})(\d\d)(\d\d)(?:T(\d\d)(\d\d)(\d\d)Z?)?")
+
+
+class _SortingHeader(dict):
+    """
+    The properties needed for sorting an object, picked from the raw
+    data.  Searcher.sorting_value accepts this in place of the parsed
+    component.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+def _sorting_header(obj: "CalendarObjectResource", sort_keys: list) -> _SortingHeader | None:
+    """
+    The values of the sort keys (and DUE and DTSTART, which may be
+    needed for the defaults) of the first component in the raw data
+    of the object, converted the same way as icalendar does.  None if
+    the data is already parsed, or if the sort keys can't be handled
+    without the full parser.
+    """
+    scan = getattr(obj, "_scan_cheap", None)
+    if scan is None:
+        return None
+    keys = {"due", "dtstart"}
+    for key, _ in sort_keys:
+        if comma_list.is_plural_sort_key(key):
+            return None
+        keys.add(key)
+    components = scan({key.upper() for key in keys})
+    if components is None:
+        return None
+    try:
+        first = next((x for x in components if x[0] != "VTIMEZONE"), None)
+    except ValueError:
+        return None
+    if first is None or first[0] not in ("VEVENT", "VTODO", "VJOURNAL"):
+        return None
+    (name, found) = first
+    ret = _SortingHeader(name)
+    for key, values in found.items():
+        if len(values) != 1:
+            return None
+        value = values[0]
+        value_type = _icalendar_types.types_map.get(key.lower())
+        if value_type == "date-time":
+            match = _RAW_DATE.fullmatch(value)
+            if not match:
+                return None
+            parts = [int(x) for x in match.groups() if x is not None]
+            try:
+                ret[key.lower()] = _SortingDate(
+                    datetime(*parts) if len(parts) > 3 else date(*parts)
+                )
+            except ValueError:
+                return None
+        elif value_type == "integer":
+            try:
+                ret[key.lower()] = int(value)
+            except ValueError:
+                return None
+        elif value_type == "text" and "\\" not in value:
+            ret[key.lower()] = value
+        else:
+            return None
+    return ret
+
+
 def _filter_search_results(
     objects: list["CalendarObjectResource"],
     searcher: "Searcher",
@@ -53,6 +169,8 @@ def _filter_search_results(
 
     result = []
     for o in objects:
+        if post_filter and _uid_ruled_out(searcher, o):
+            continue
         if searcher.expand or post_filter:
             try:
                 filtered = searcher.check_component(o, expand_only=not post_filter)
@@ -75,15 +193,9 @@ def _filter_search_results(
             if isinstance(comp, Timezone):
                 continue
             if split_expanded:
-                new_obj = o.copy(keep_uid=True)
-                new_i = new_obj.icalendar_instance
-                new_i.subcomponents = []
-                for tz in tz_:
-                    new_i.add_component(tz)
-                result.append(new_obj)
+                result.append(o._expanded_occurrence(comp, tz_))
             else:
-                new_i = i
-            new_i.add_component(comp)
+                i.add_component(comp)
 
         if not split_expanded:
             result.append(o)
@@ -101,13 +213,17 @@ def _build_search_xml_query(
     props: list[Any] | None = None,
     filters: Any = None,
     _hacks: str | None = None,
+    fields: Iterable[str] | None = None,
 ) -> tuple[Any, type | None]:
-    """Build a CalDAV calendar-query XML request body."""
+    """Build a CalDAV calendar-query XML request body.
+
+    If ``fields`` is given, only those iCalendar properties are
+    requested (RFC4791 section 9.6).
+    """
     data = cdav.CalendarData()
     if server_expand:
         if not searcher.start or not searcher.end:
             raise error.ReportError("can't expand without a date range")
-        data += cdav.Expand(searcher.start, searcher.end)
 
     props_ = [data] if props is None else [data] + list(props)
     prop = dav.Prop() + props_
@@ -205,17 +321,7 @@ def _build_search_xml_query(
                 if hasattr(value, "to_ical"):
                     value = value.to_ical()
 
-                collation_str = "i;octet"
-                if (
-                    hasattr(searcher, "_property_collation")
-                    and property in searcher._property_collation
-                ):
-                    case_sensitive = searcher._property_case_sensitive.get(property, True)
-                    collation_str = _collation_to_caldav(
-                        searcher._property_collation[property], case_sensitive
-                    )
-
-                match = cdav.TextMatch(value, collation=collation_str)
+                match = cdav.TextMatch(value, collation=_text_match_collation(searcher, property))
                 filters.append(cdav.PropFilter(property_) + match)
 
     if comp_filter and filters:
@@ -226,12 +332,155 @@ def _build_search_xml_query(
     elif filters:
         vcalendar += filters
 
+    if fields is not None:
+        data += _calendar_data_selector(
+            fields, comp_class, bool(searcher.alarm_start or searcher.alarm_end)
+        )
+    if server_expand:
+        data += cdav.Expand(searcher.start, searcher.end)
+
     filter_elem = cdav.Filter() + vcalendar
     root = cdav.CalendarQuery() + [prop, filter_elem]
 
     return (root, comp_class)
 
 
+def _text_match_collation(searcher: "Searcher", property: str) -> str:
+    """The collation of the text-match for a property filter"""
+    if hasattr(searcher, "_property_collation") and property in searcher._property_collation:
+        case_sensitive = searcher._property_case_sensitive.get(property, True)
+        return _collation_to_caldav(searcher._property_collation[property], case_sensitive)
+    return "i;octet"
+
+
+## Templates for the common calendar-query bodies, see _build_search_xml_body
+_search_templates: dict[tuple, tuple[BodyTemplate, type | None]] = {}
+_comp_flags = {Event: "event", Todo: "todo", Journal: "journal"}
+
+
+def _build_search_xml_body(
+    searcher: "Searcher",
+    server_expand: bool = False,
+    props: list[Any] | None = None,
+    filters: Any = None,
+    _hacks: str | None = None,
+    fields: Iterable[str] | None = None,
+) -> tuple[Any, type | None]:
+    """Like :meth:`CalDAVSearcher.build_search_xml_query`, but the
+    common queries - a component type, a time range and/or a UID
+    text-match - are returned as request bodies rendered from a
+    template (see caldav.lib.xmltemplates), rather than as element
+    trees.  The template is made from the element tree of the first
+    query of its kind, so the bodies are the same either way.
+    """
+    if (
+        props
+        or filters
+        or fields is not None
+        or _hacks not in (None, "insist")
+        or searcher.alarm_start
+        or searcher.alarm_end
+        or (server_expand and not (searcher.start and searcher.end))
+        or not set(searcher._property_operator) <= {"uid"}
+        or searcher._property_operator.get("uid") == "undef"
+    ):
+        return searcher.build_search_xml_query(
+            server_expand, props=props, filters=filters, _hacks=_hacks, fields=fields
+        )
+
+    uid = None
+    if "uid" in searcher._property_operator:
+        uid = searcher._property_filters["uid"]
+        if hasattr(uid, "to_ical"):
+            uid = uid.to_ical()
+        uid = to_unicode(uid)
+    key = (
+        searcher.comp_class,
+        bool(searcher.event),
+        bool(searcher.todo),
+        bool(searcher.journal),
+        bool(searcher.start),
+        bool(searcher.end),
+        bool(server_expand),
+        None if uid is None else _text_match_collation(searcher, "uid"),
+    )
+    if key in _search_templates:
+        (template, comp_class) = _search_templates[key]
+        if comp_class is not None:
+            setattr(searcher, _comp_flags[comp_class], True)
+    else:
+        (root, comp_class) = _build_search_xml_query(searcher, server_expand, _hacks=_hacks)
+        template = BodyTemplate(_slotted(root))
+        _search_templates[key] = (template, comp_class)
+
+    dates = [cdav._to_utc_date_string(x) for x in (searcher.start, searcher.end) if x]
+    values = (dates if server_expand else []) + dates + ([uid] if uid is not None else [])
+    return (template.render(*values), comp_class)
+
+
+def _slotted(root: Any) -> Any:
+    """Puts SLOT in place of the time ranges and the UID text-match of
+    a calendar-query element tree"""
+    for child in root.children:
+        if child.tag in (cdav.TimeRange.tag, cdav.Expand.tag):
+            for name in ("start", "end"):
+                if name in child.attributes:
+                    child.attributes[name] = SLOT
+        elif child.tag == cdav.PropFilter.tag and child.attributes.get("name") == "UID":
+            for match in child.children:
+                match.value = SLOT
+        _slotted(child)
+    return root
+
+
+## Properties always fetched when a search is limited to some fields.
+## The recurrence handling, the client-side filtering and the
+## component type detection depends on those.
+_PARTIAL_BASE_FIELDS = frozenset(
+    {
+        "UID",
+        "RECURRENCE-ID",
+        "DTSTART",
+        "DTEND",
+        "DUE",
+        "DURATION",
+        "RRULE",
+        "RDATE",
+        "EXDATE",
+        "STATUS",
+        "COMPLETED",
+    }
+)
+
+
+def _calendar_data_selector(fields: Iterable[str], comp_class: Any, alarms: bool) -> Any:
+    """The comp/prop selection for a calendar-data element, RFC4791 section 9.6
+
+    The VCALENDAR properties and time zones are fetched in full.  The
+    alarms are only needed for alarm searches.
+    """
+    vtimezone = cdav.Comp("VTIMEZONE") + [cdav.Allprop(), cdav.Allcomp()]
+    vcalendar = cdav.Comp("VCALENDAR") + [cdav.Allprop(), vtimezone]
+    comp_names = {Event: "VEVENT", Todo: "VTODO", Journal: "VJOURNAL"}
+    for comp_name in [comp_names[comp_class]] if comp_class in comp_names else comp_names.values():
+        comp = cdav.Comp(comp_name) + [cdav.Prop(field) for field in sorted(fields)]
+        if alarms:
+            comp += cdav.Comp("VALARM") + [cdav.Allprop(), cdav.Allcomp()]
+        vcalendar += comp
+    return vcalendar
+
+
+def _trim_to_fields(obj: "CalendarObjectResource", fields: frozenset, alarms: bool) -> None:
+    """Client-side counterpart of _calendar_data_selector"""
+    for comp in obj.icalendar_instance.subcomponents:
+        if isinstance(comp, Timezone):
+            continue
+        for name in [name for name in comp if name not in fields]:
+            del comp[name]
+        if not alarms:
+            comp.subcomponents = []
+
+
 def _is_not_defined_supported(features: Any, prop: str) -> bool:
     """Check if is-not-defined search is supported for a specific property.
 
@@ -268,6 +517,7 @@ class SearchAction(Enum):
     REQUEST_REPORT = auto()  # (xml, comp_class, props) -> make CalDAV request
     LOAD_OBJECT = auto()  # (obj) -> load object data
     RETURN = auto()  # (result) -> return this value
+    STREAM_REPORT = auto()  # (calendar, xml, comp_class, post_filter, split_expanded, server_expand) -> stream objects to the caller (iter_search only)
 
 
 @dataclass
@@ -311,9 +561,19 @@ class CalDAVSearcher(Searcher):
     "properties".  Make sure not to confuse those.  iCalendar
     properties used for filtering can be passed using
     ``searcher.add_property_filter``.
+
+    ``fields`` is a list of iCalendar properties (i.e. ``["SUMMARY",
+    "DTSTART"]``).  If given, the objects returned will contain only
+    those properties (plus the UID and the properties needed for
+    recurrence handling, filtering and sorting).  This is done
+    server-side when the ``search.partial-retrieval`` feature is
+    supported, saving transfer and parsing.  The objects returned
+    are partial (``obj.is_partial()``), and can't be saved until
+    they are loaded.
     """
 
     comp_class: Optional["CalendarObjectResource"] = None
+    fields: list[str] | None = None
     _explicit_operators: set = field(default_factory=set)
     _calendar: Optional["Calendar"] = field(default=None, repr=False)
 
@@ -393,6 +653,29 @@ class CalDAVSearcher(Searcher):
                 locale=locale,
             )
 
+    def _expand_recurrences(self, recurrence_set: list, comptypesu: set[str]) -> Iterable:
+        """Expands a recurrence set within the search range.
+
+        Overrides the base class, which always goes through
+        recurring-ical-events.  The common cases are handled by the
+        faster expansion in :mod:`caldav.lib.recurrence`, the rest is
+        passed on to the base class.
+        """
+        expanded = expand_recurrence_set(recurrence_set, self.start, self.end, comptypesu)
+        if expanded is None:
+            return super()._expand_recurrences(recurrence_set, comptypesu)
+        return expanded
+
+    def sorting_value(self, component: Any) -> tuple:
+        """Returns a sortable value from the component.
+
+        Overrides the base class to avoid parsing objects holding raw
+        data - the sort keys are picked out of the data by
+        :func:`caldav.datastate.scan_components` when possible.
+        """
+        header = _sorting_header(component, self._sort_keys)
+        return super().sorting_value(component if header is None else header)
+
     def _clone_without_filters(
         self,
         filters_to_remove: list[str] | None = None,
@@ -423,6 +706,42 @@ class CalDAVSearcher(Searcher):
             clone._explicit_operators = self._explicit_operators - set(filters_to_remove)
         return clone
 
+    def _fields_to_fetch(self) -> frozenset | None:
+        """The iCalendar properties to fetch, or None if all of them are needed"""
+        if self.fields is None:
+            return None
+        fields = set(_PARTIAL_BASE_FIELDS)
+        fields.update(x.upper() for x in self.fields)
+        fields.update(x.upper() for x in self._property_operator)
+        fields.update(key.upper() for key, _ in self._sort_keys)
+        if "CATEGORY" in fields:
+            fields.discard("CATEGORY")
+            fields.add("CATEGORIES")
+        return frozenset(fields)
+
+    def _partial_retrieval(self, calendar: Calendar) -> bool:
+        """Should the server be asked to only return some of the fields?"""
+        return self.fields is not None and calendar.client.features.is_supported(
+            "search.partial-retrieval"
+        )
+
+    def _project_fields(self, objects: list, calendar: Calendar) -> list:
+        """
+        Marks the objects as partial if ``fields`` is set.  If the
+        server could not be asked to do it, the objects are trimmed
+        client-side.
+        """
+        fields = self._fields_to_fetch()
+        if fields is None:
+            return objects
+        trim = not self._partial_retrieval(calendar)
+        alarms = bool(self.alarm_start or self.alarm_end)
+        for obj in objects:
+            if trim:
+                _trim_to_fields(obj, fields, alarms)
+            obj._partial_fields = fields
+        return objects
+
     def _search_impl(
         self,
         calendar: Calendar,
@@ -432,12 +751,20 @@ class CalDAVSearcher(Searcher):
         xml: str | None,
         post_filter: bool | None,
         _hacks: str | None,
+        stream: bool = False,
     ):
         """Core search implementation as a generator yielding actions.
 
         This generator contains all the search logic and yields (action, data) tuples
         that the caller (sync or async) executes. Results are sent back via .send().
 
+        With ``stream`` set (used by :meth:`iter_search`), the plain
+        single-REPORT case is handed over to the caller through
+        ``SearchAction.STREAM_REPORT`` rather than ``REQUEST_REPORT``,
+        so the objects can be post-processed and passed on one by one.
+        Should the REPORT fail with a ReportError, the caller throws
+        it back into the generator.
+
         TODO: refactoring beyond readability?  Is this sane? If
         nothing else, the generator data flow better.  Possibly this
         method is too long and should be split up for improved
@@ -699,8 +1026,13 @@ class CalDAVSearcher(Searcher):
             orig_xml = xml
 
             if not xml or (not isinstance(xml, str) and not xml.tag.endswith("calendar-query")):
-                (xml, self.comp_class) = self.build_search_xml_query(
-                    server_expand, props=props, filters=xml, _hacks=_hacks
+                (xml, self.comp_class) = _build_search_xml_body(
+                    self,
+                    server_expand,
+                    props=props,
+                    filters=xml,
+                    _hacks=_hacks,
+                    fields=self._fields_to_fetch() if self._partial_retrieval(calendar) else None,
                 )
 
             if not self.comp_class and not calendar.client.features.is_supported(
@@ -717,6 +1049,24 @@ class CalDAVSearcher(Searcher):
                 return
 
             try:
+                ## Streaming is not possible when the objects needs to
+                ## be sorted, when extra props are requested (only
+                ## calendar data and etag are collected from the
+                ## stream), or when the "insist" hack needs to know
+                ## if the result set is empty.
+                if stream and not props and not self._sort_keys and _hacks != "insist":
+                    yield (
+                        SearchAction.STREAM_REPORT,
+                        (
+                            calendar,
+                            xml,
+                            self.comp_class,
+                            post_filter,
+                            split_expanded,
+                            server_expand,
+                        ),
+                    )
+                    return
                 response, objects = yield (
                     SearchAction.REQUEST_REPORT,
                     (calendar, xml, self.comp_class, props),
@@ -804,6 +1154,7 @@ class CalDAVSearcher(Searcher):
             except Exception:
                 pass
 
+        objects = self._project_fields(objects, calendar)
         yield (SearchAction.RETURN, self.sort(objects))
 
     def search(
@@ -882,6 +1233,191 @@ class CalDAVSearcher(Searcher):
             except StopIteration:
                 return []
 
+    def iter_search(
+        self,
+        calendar: Calendar = None,
+        server_expand: bool = False,
+        split_expanded: bool = True,
+        props: list[cdav.CalendarData] | None = None,
+        xml: str = None,
+        post_filter=None,
+        _hacks: str = None,
+    ) -> Iterator[CalendarObjectResource]:
+        """Generator version of :meth:`search`.
+
+        Takes the same parameters and applies the same compatibility
+        logic as :meth:`search`, but yields the objects one at a time.
+        In the common case, where the search is done through one single
+        REPORT, the response is parsed incrementally and each object is
+        loaded, post-filtered and yielded as soon as its ``<response>``
+        element has been parsed - so neither the time until the first
+        result nor the memory usage grows with the size of the calendar.
+
+        If sort keys are given, or if the search needs to be split into
+        several queries due to server incompatibilities, the full result
+        is collected before the first object is yielded.
+        """
+        gen = self._search_impl(
+            calendar, server_expand, split_expanded, props, xml, post_filter, _hacks, stream=True
+        )
+        send = gen.send
+        result = None
+
+        while True:
+            try:
+                action, data = send(result)
+            except StopIteration:
+                return
+            send = gen.send
+            result = None
+
+            if action == SearchAction.RECURSIVE_SEARCH:
+                clone, cal, srv_exp, spl_exp, prp, xm, pf, hk = data
+                result = clone.search(cal, srv_exp, spl_exp, prp, xm, pf, hk)
+            elif action == SearchAction.SEARCH_WITH_COMPTYPES:
+                cal, srv_exp, spl_exp, prp, xm, hk, pf = data
+                result = self._search_with_comptypes(cal, srv_exp, spl_exp, prp, xm, hk, pf)
+            elif action == SearchAction.REQUEST_REPORT:
+                cal, xm, comp_cls, prp = data
+                result = cal._request_report_build_resultlist(xm, comp_cls, props=prp)
+            elif action == SearchAction.LOAD_OBJECT:
+                data.load(only_if_unloaded=True)
+            elif action == SearchAction.STREAM_REPORT:
+                cal, xm, comp_cls, pf, spl_exp, srv_exp = data
+                try:
+                    objects = cal._request_report_iter_objects(xm, comp_cls)
+                except error.ReportError as err:
+                    ## let _search_impl decide if there is a fallback
+                    send = gen.throw
+                    result = err
+                    continue
+                yield from self._iter_post_process(objects, pf, spl_exp, srv_exp, cal)
+            elif action == SearchAction.RETURN:
+                yield from data
+                return
+
+    def _iter_post_process(
+        self,
+        objects: Iterable[CalendarObjectResource],
+        post_filter: bool | None,
+        split_expanded: bool,
+        server_expand: bool,
+        calendar: Calendar,
+    ) -> Iterator[CalendarObjectResource]:
+        """Per-object version of the post-processing at the end of _search_impl.
+
+        ## WARNING: async logic is duplicated in _aiter_post_process — mirror any changes there
+        """
+        for o in objects:
+            try:
+                o.load(only_if_unloaded=True)
+            except Exception:
+                logging.error(
+                    "Server does not want to reveal details about the calendar object",
+                    exc_info=True,
+                )
+                continue
+            # Google sometimes returns empty objects
+            if not o.has_component():
+                continue
+            for obj in self.filter([o], post_filter, split_expanded, server_expand):
+                # Partial workaround for https://github.com/python-caldav/caldav/issues/201
+                try:
+                    obj.load(only_if_unloaded=True)
+                except Exception:
+                    pass
+                yield from self._project_fields([obj], calendar)
+
+    async def aiter_search(
+        self,
+        calendar: "AsyncCalendar" = None,
+        server_expand: bool = False,
+        split_expanded: bool = True,
+        props: list[cdav.CalendarData] | None = None,
+        xml: str = None,
+        post_filter=None,
+        _hacks: str = None,
+    ) -> AsyncIterator["AsyncCalendarObjectResource"]:
+        """Async iterator version of :meth:`iter_search`, for async clients."""
+        gen = self._search_impl(
+            calendar, server_expand, split_expanded, props, xml, post_filter, _hacks, stream=True
+        )
+        send = gen.send
+        result = None
+
+        while True:
+            try:
+                action, data = send(result)
+            except StopIteration:
+                return
+            send = gen.send
+            result = None
+
+            if action == SearchAction.RECURSIVE_SEARCH:
+                clone, cal, srv_exp, spl_exp, prp, xm, pf, hk = data
+                result = await clone.async_search(cal, srv_exp, spl_exp, prp, xm, pf, hk)
+            elif action == SearchAction.SEARCH_WITH_COMPTYPES:
+                cal, srv_exp, spl_exp, prp, xm, hk, pf = data
+                result = await self._async_search_with_comptypes(
+                    cal, srv_exp, spl_exp, prp, xm, hk, pf
+                )
+            elif action == SearchAction.REQUEST_REPORT:
+                cal, xm, comp_cls, prp = data
+                result = await cal._request_report_build_resultlist(xm, comp_cls, props=prp)
+            elif action == SearchAction.LOAD_OBJECT:
+                load_result = data.load(only_if_unloaded=True)
+                if inspect.isawaitable(load_result):
+                    await load_result
+            elif action == SearchAction.STREAM_REPORT:
+                cal, xm, comp_cls, pf, spl_exp, srv_exp = data
+                try:
+                    objects = await cal._request_report_iter_objects(xm, comp_cls)
+                except error.ReportError as err:
+                    send = gen.throw
+                    result = err
+                    continue
+                async for obj in self._aiter_post_process(objects, pf, spl_exp, srv_exp, cal):
+                    yield obj
+            elif action == SearchAction.RETURN:
+                for obj in data:
+                    yield obj
+                return
+
+    async def _aiter_post_process(
+        self,
+        objects: AsyncIterator["AsyncCalendarObjectResource"],
+        post_filter: bool | None,
+        split_expanded: bool,
+        server_expand: bool,
+        calendar: "AsyncCalendar",
+    ) -> AsyncIterator["AsyncCalendarObjectResource"]:
+        """Async version of _iter_post_process.
+
+        ## WARNING: sync logic is duplicated in _iter_post_process — mirror any changes there
+        """
+        async for o in objects:
+            try:
+                load_result = o.load(only_if_unloaded=True)
+                if inspect.isawaitable(load_result):
+                    await load_result
+            except Exception:
+                logging.error(
+                    "Server does not want to reveal details about the calendar object",
+                    exc_info=True,
+                )
+                continue
+            if not o.has_component():
+                continue
+            for obj in self.filter([o], post_filter, split_expanded, server_expand):
+                try:
+                    load_result = obj.load(only_if_unloaded=True)
+                    if inspect.isawaitable(load_result):
+                        await load_result
+                except Exception:
+                    pass
+                for projected in self._project_fields([obj], calendar):
+                    yield projected
+
     def _search_with_comptypes(
         self,
         calendar: Calendar,
@@ -902,22 +1438,31 @@ class CalDAVSearcher(Searcher):
             # matches, and comp_class detection falls back to auto-detect.
             _, objects = calendar._request_report_build_resultlist(xml, None, props)
             return self.sort(objects)
-        objects = []
-
         assert self.event is None and self.todo is None and self.journal is None
 
-        for comp_class in (Event, Todo, Journal):
-            if not calendar.client.features.is_supported(
-                f"save-load.{comp_class.__name__.lower()}"
-            ):
-                continue
+        def search_comp_class(comp_class):
             clone = replace(self)
             clone.comp_class = comp_class
-            objects += clone.search(
+            return clone.search(
                 calendar, server_expand, split_expanded, props, xml, post_filter, _hacks
             )
+
+        ## The searches are independent.  With HTTP/2 multiplexing they
+        ## are run in parallel, results are still merged in order.
+        comp_classes = self._comp_classes_to_search(calendar)
+        objects = []
+        for result in calendar._map_multiplexed(search_comp_class, comp_classes, len(comp_classes)):
+            objects += result
         return self.sort(objects)
 
+    @staticmethod
+    def _comp_classes_to_search(calendar: Calendar) -> list:
+        return [
+            comp_class
+            for comp_class in (Event, Todo, Journal)
+            if calendar.client.features.is_supported(f"save-load.{comp_class.__name__.lower()}")
+        ]
+
     async def async_search(
         self,
         calendar: "AsyncCalendar" = None,
@@ -988,21 +1533,25 @@ class CalDAVSearcher(Searcher):
             # Fall back to a single REPORT request with the XML as-is.
             _, objects = await calendar._request_report_build_resultlist(xml, None, props)
             return self.sort(objects)
-        objects: list[AsyncCalendarObjectResource] = []
-
         assert self.event is None and self.todo is None and self.journal is None
 
-        for comp_class in (Event, Todo, Journal):
-            if not calendar.client.features.is_supported(
-                f"save-load.{comp_class.__name__.lower()}"
-            ):
-                continue
+        def search_comp_class(comp_class):
             clone = replace(self)
             clone.comp_class = comp_class
-            results = await clone.async_search(
+            return clone.async_search(
                 calendar, server_expand, split_expanded, props, xml, post_filter, _hacks
             )
-            objects.extend(results)
+
+        ## The searches are independent, so they are run concurrently
+        results = await asyncio.gather(
+            *(
+                search_comp_class(comp_class)
+                for comp_class in self._comp_classes_to_search(calendar)
+            )
+        )
+        objects: list[AsyncCalendarObjectResource] = []
+        for result in results:
+            objects.extend(result)
         return self.sort(objects)
 
     def filter(
@@ -1039,7 +1588,9 @@ class CalDAVSearcher(Searcher):
             server_expand=server_expand,
         )
 
-    def build_search_xml_query(self, server_expand=False, props=None, filters=None, _hacks=None):
+    def build_search_xml_query(
+        self, server_expand=False, props=None, filters=None, _hacks=None, fields=None
+    ):
         """Build a CalDAV calendar-query XML request.
 
         Delegates to the operations layer for the actual XML building.
@@ -1050,6 +1601,7 @@ class CalDAVSearcher(Searcher):
         :param props: Additional CalDAV properties to request
         :param filters: Pre-built filter elements (or None to build from self)
         :param _hacks: Compatibility hack mode
+        :param fields: Only request those iCalendar properties
         :return: Tuple of (xml_element, comp_class)
         """
         xml, comp_class = _build_search_xml_query(
@@ -1058,6 +1610,7 @@ class CalDAVSearcher(Searcher):
             props=props,
             filters=filters,
             _hacks=_hacks,
+            fields=fields,
         )
         # Update self.comp_class from the result (side effect for compatibility)
         self.comp_class = comp_class
@@ -1058,3 +1058,134 @@ class TestAsyncRateLimiting:
         with patch("caldav.async_davclient.asyncio.sleep", new_callable=AsyncMock):
             with pytest.raises(error.RateLimitError):
                 await client.request("/")
+
+    @pytest.mark.asyncio
+    async def test_proactive_rate_limiting(self):
+        with (
+            patch("caldav.lib.ratelimit.time.monotonic", return_value=100.0),
+            patch("caldav.lib.ratelimit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            client = AsyncDAVClient(
+                url="http://cal.example.com/",
+                features={"rate-limit": {"enable": True, "interval": 4, "count": 2}},
+            )
+            assert (client.rate_limiter.interval, client.rate_limiter.count) == (4, 2)
+            client.session.request = AsyncMock(return_value=self._make_response(200))
+            for _ in range(4):
+                await client.request("/")
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0]
+
+
+class TestAsyncBatch:
+    """
+    Unit tests for AsyncDAVClient.batch().
+    No real server communication.
+    """
+
+    def _make_response(self, status_code, headers=None):
+        resp = create_mock_response(status_code=status_code, headers=headers)
+        if status_code == 429:
+            resp.reason = resp.reason_phrase = "Too Many Requests"
+        return resp
+
+    @pytest.mark.asyncio
+    async def test_batch_results_in_order(self) -> None:
+        client = AsyncDAVClient(url="https://caldav.example.com/dav/")
+
+        async def request(method, url, **kwargs):
+            if url.endswith("/fail.ics"):
+                raise ConnectionError("connection reset")
+            return self._make_response(201 if method == "PUT" else 204)
+
+        client.session.request = request
+        batch = client.batch()
+        batch.put("/dav/cal/1.ics", "BEGIN:VCALENDAR")
+        batch.put("/dav/cal/fail.ics", "BEGIN:VCALENDAR")
+        batch.delete("/dav/cal/2.ics")
+
+        async def not_a_request():
+            return "done"
+
+        assert batch.add(not_a_request) == 3
+        assert len(batch) == 4
+
+        results = await batch.run()
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert results[0].result.status == 201
+        assert isinstance(results[1].error, ConnectionError)
+        assert results[2].result.status == 204
+        assert results[3].result == "done"
+        ## The batch is emptied when run
+        assert len(batch) == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_max_in_flight(self) -> None:
+        import asyncio
+
+        client = AsyncDAVClient(url="https://caldav.example.com/dav/")
+        in_flight = []
+        max_in_flight = []
+
+        async def request(method, url, **kwargs):
+            in_flight.append(url)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(url)
+            return self._make_response(201)
+
+        client.session.request = request
+        batch = client.batch(max_in_flight=3)
+        for i in range(10):
+            batch.put(f"/dav/cal/{i}.ics", "BEGIN:VCALENDAR")
+        results = await batch.run()
+        assert all(r.ok for r in results)
+        assert max(max_in_flight) == 3
+
+        with pytest.raises(ValueError):
+            client.batch(max_in_flight=0)
+
+    @pytest.mark.asyncio
+    async def test_batch_rate_limited_without_handling(self) -> None:
+        client = AsyncDAVClient(url="https://caldav.example.com/dav/")
+        client.session.request = AsyncMock(
+            side_effect=[
+                self._make_response(201),
+                self._make_response(429, {"Retry-After": "5"}),
+            ]
+        )
+        batch = client.batch(max_in_flight=1)
+        batch.put("/dav/cal/1.ics", "BEGIN:VCALENDAR")
+        batch.put("/dav/cal/2.ics", "BEGIN:VCALENDAR")
+        results = await batch.run()
+        assert results[0].ok
+        assert isinstance(results[1].error, error.RateLimitError)
+        assert results[1].error.retry_after_seconds == 5.0
+
+    @pytest.mark.asyncio
+    async def test_batch_rate_limit_pauses_whole_batch(self) -> None:
+        """
+        A Retry-After on one request holds back the requests started
+        while it is sleeping.  The clock is frozen here, so all the later
+        requests look like they were started during the back-off.
+        """
+        client = AsyncDAVClient(url="https://caldav.example.com/dav/", rate_limit_handle=True)
+        client.session.request = AsyncMock(
+            side_effect=[
+                self._make_response(429, {"Retry-After": "5"}),
+                self._make_response(201),
+                self._make_response(201),
+                self._make_response(201),
+            ]
+        )
+        batch = client.batch(max_in_flight=1)
+        for i in range(3):
+            batch.put(f"/dav/cal/{i}.ics", "BEGIN:VCALENDAR")
+        with (
+            patch("caldav.async_davclient.time.monotonic", return_value=1000.0),
+            patch("caldav.async_davclient.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            results = await batch.run()
+        assert all(r.ok for r in results)
+        assert client.session.request.call_count == 4
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [5.0, 5.0, 5.0]
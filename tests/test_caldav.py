@@ -4226,6 +4226,61 @@ class TestProxy(proxy.TestCase):
     ## TODO: test username/password in the proxy URL
 
 
+@pytest.mark.skipif(not test_xandikos, reason="Xandikos is not available")
+class TestThreadSafeClient:
+    """
+    Stress test - one DAVClient shared by many worker threads, towards
+    the embedded Xandikos server.
+    """
+
+    @classmethod
+    def setup_class(cls):
+        from caldav.testing import XandikosServer
+
+        cls.server = XandikosServer({"port": xandikos_port + 2})
+        cls.server.start()
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.stop()
+
+    def testConcurrentPropfind(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        props = [dav.DisplayName(), dav.ResourceType()]
+        with DAVClient(url=self.server.url, pool_size=8) as conn:
+            principal = conn.principal()
+            expected = principal.get_properties(props)
+
+            def propfind(i):
+                return Principal(client=conn, url=principal.url).get_properties(props)
+
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = list(pool.map(propfind, range(400)))
+
+        assert len(results) == 400
+        assert all(result == expected for result in results)
+
+    def testConcurrentCalendarOperations(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with DAVClient(url=self.server.url, pool_size=8) as conn:
+            calendar = conn.principal().make_calendar(name="Thread safety test")
+            try:
+
+                def save(i):
+                    return calendar.save_event(
+                        ev1.replace("20010712T182145Z-123401", f"threads-{i}")
+                    ).url
+
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    urls = list(pool.map(save, range(40)))
+                assert len(set(urls)) == 40
+                assert len(calendar.get_events()) == 40
+            finally:
+                calendar.delete()
+
+
 # We want to run all tests in the above class through all caldav_servers;
 # and I don't really want to create a custom nose test loader.  The
 # solution here seems to be to generate one child class for each
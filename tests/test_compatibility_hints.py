@@ -525,6 +525,66 @@ class TestDeriveFromSubfeatures:
         )
 
 
+class TestIsSupportedMemo:
+    """The answers from is_supported are memoized until the feature set changes"""
+
+    def test_memoized(self) -> None:
+        fs = FeatureSet({"search.text.case-sensitive": {"support": "unsupported"}})
+        assert not fs.is_supported("search.text.case-sensitive")
+        assert fs.is_supported("search.text.case-sensitive", return_type=str) == "unsupported"
+        assert fs._is_supported_cache[("search.text.case-sensitive", bool, True, False)] is False
+        fs._server_features.clear()
+        ## still answered from the memo
+        assert not fs.is_supported("search.text.case-sensitive")
+
+    def test_set_feature_invalidates(self) -> None:
+        fs = FeatureSet({"sync-token": {"support": "fragile"}})
+        assert not fs.is_supported("sync-token")
+        assert fs.is_supported("sync-token", accept_fragile=True)
+        fs.set_feature("sync-token", "unsupported")
+        assert not fs.is_supported("sync-token", accept_fragile=True)
+        fs.set_feature("sync-token")
+        assert fs.is_supported("sync-token")
+
+    def test_derived_parent_invalidated_by_child(self) -> None:
+        fs = FeatureSet({"search.recurrences.expanded": {"support": "unsupported"}})
+        assert fs.is_supported("search.recurrences", return_type=str) == "full"
+        fs.copyFeatureSet(
+            {"search.recurrences.includes-implicit": {"support": "unsupported"}}, collapse=False
+        )
+        assert fs.is_supported("search.recurrences", return_type=str) == "unsupported"
+
+    def test_collapse_invalidates(self) -> None:
+        fs = FeatureSet(
+            {
+                "search.recurrences.expanded": {"support": "unsupported"},
+                "search.recurrences.includes-implicit": {"support": "unsupported"},
+            }
+        )
+        assert fs.is_supported("search.recurrences", return_type=dict, return_defaults=False) == {
+            "support": "unsupported"
+        }
+        fs.collapse()
+        assert fs.is_supported("search.recurrences.expanded", return_type=str) == "unsupported"
+        assert "search.recurrences.expanded" not in fs._server_features
+
+    def test_copy_has_its_own_memo(self) -> None:
+        fs = FeatureSet({"sync-token": {"support": "unsupported"}})
+        assert not fs.is_supported("sync-token")
+        fs2 = FeatureSet(fs)
+        fs2.set_feature("sync-token")
+        assert fs2.is_supported("sync-token")
+        assert not fs.is_supported("sync-token")
+
+    def test_find_feature(self) -> None:
+        info = FeatureSet.find_feature("search.text.case-sensitive")
+        assert info["name"] == "search.text.case-sensitive"
+        assert info["parent"] is FeatureSet.find_feature("search.text")
+        assert "case-sensitive" in info["parent"]["subfeatures"]
+        with pytest.raises(AssertionError):
+            FeatureSet.find_feature("no-such-feature")
+
+
 class TestResolveFeatures:
     """Test _resolve_features base+override resolution."""
 
@@ -13,11 +13,18 @@ import pytest
 
 PYTHON = sys.executable
 
+## Budget for the time spent in caldav's own modules (excluding the
+## dependencies) when importing caldav and setting up a client.  It is
+## around 50 ms on a laptop; the budget is generous to avoid false
+## alarms on slow CI runners, but catches modules like
+## caldav.collection or caldav.compatibility_profiles being pulled in.
+IMPORT_BUDGET_MS = 150
 
-def _run(code: str) -> subprocess.CompletedProcess:
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
     """Run *code* in a fresh Python subprocess."""
     return subprocess.run(
-        [PYTHON, "-c", textwrap.dedent(code)],
+        [PYTHON, *args, "-c", textwrap.dedent(code)],
         capture_output=True,
         text=True,
         timeout=30,
@@ -139,3 +146,57 @@ class TestLazyImport:
             )
         """)
         assert r.returncode == 0, r.stderr
+
+    def test_client_construction_is_lazy(self):
+        r = _run("""\
+            import sys
+            from caldav import DAVClient
+            from caldav.async_davclient import AsyncDAVClient
+            DAVClient(url="http://localhost:5232/")
+            AsyncDAVClient(url="http://localhost:5232/")
+            for mod in ("icalendar", "icalendar_searcher", "recurring_ical_events",
+                        "dns", "caldav.collection", "caldav.discovery",
+                        "caldav.compatibility_profiles"):
+                assert mod not in sys.modules, f"{mod} loaded by client construction"
+        """)
+        assert r.returncode == 0, r.stderr
+
+    def test_compatibility_profile_loaded_by_name(self):
+        r = _run("""\
+            import sys
+            from caldav import DAVClient
+            from caldav import compatibility_hints
+            client = DAVClient(url="http://localhost:5232/", features="xandikos")
+            assert "caldav.compatibility_profiles" in sys.modules
+            assert not client.features.is_supported("principal-search")
+            assert "xandikos" in dir(compatibility_hints)
+            assert compatibility_hints.ecloud["auto-connect.url"]
+            try:
+                compatibility_hints.no_such_server
+                raise SystemExit("should have raised AttributeError")
+            except AttributeError:
+                pass
+        """)
+        assert r.returncode == 0, r.stderr
+
+    def test_import_time_budget(self):
+        r = _run(
+            """\
+            from caldav import DAVClient
+            DAVClient(url="http://localhost:5232/")
+        """,
+            "-X",
+            "importtime",
+        )
+        assert r.returncode == 0, r.stderr
+        ## Lines like "import time:  self [us] | cumulative | imported package"
+        spent = 0
+        for line in r.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            (self_us, cumulative, name) = line[len("import time:") :].split("|")
+            if name.strip().split(".")[0] == "caldav" and self_us.strip().isdigit():
+                spent += int(self_us)
+        assert 0 < spent < IMPORT_BUDGET_MS * 1000, (
+            f"caldav modules took {spent / 1000:.1f} ms to import, budget is {IMPORT_BUDGET_MS} ms"
+        )
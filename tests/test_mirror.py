@@ -0,0 +1,277 @@
+"""
+Unit tests for the persistent calendar mirror (caldav.mirror).
+
+The server is emulated by a DAVClient subclass keeping a change log,
+so that sync-collection REPORTs only return the objects changed since
+the given sync token.
+"""
+
+import asyncio
+import re
+from unittest import mock
+
+import pytest
+
+from caldav.async_davclient import AsyncDAVClient
+from caldav.collection import Calendar, FakeSyncTokenStore
+from caldav.compatibility_hints import FeatureSet
+from caldav.davclient import DAVClient, DAVResponse
+from caldav.elements import dav
+from caldav.lib.python_utilities import to_normal_str
+from caldav.mirror import CalendarMirror, default_mirror_path
+
+EVENT = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Example Corp.//CalDAV Client//EN
+BEGIN:VEVENT
+UID:{uid}
+DTSTAMP:20060206T001102Z
+DTSTART:20060714T170000Z
+DTEND:20060715T040000Z
+SUMMARY:{summary}
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+class MockedSyncServer(DAVClient):
+    """
+    Answers sync-collection REPORTs, calendar-multiget REPORTs and GETs
+    for the calendar at /calendar/
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.changes = []
+        self.requests = []
+        DAVClient.__init__(self, url="https://calendar.example/")
+
+    def put_event(self, uid, summary="Event"):
+        path = f"/calendar/{uid}.ics"
+        self.changes.append(path)
+        self.objects[path] = (
+            f'"etag-{len(self.changes)}"',
+            EVENT.format(uid=uid, summary=summary),
+        )
+
+    def delete_event(self, uid):
+        path = f"/calendar/{uid}.ics"
+        self.changes.append(path)
+        del self.objects[path]
+
+    def _response(self, href, props=None):
+        if props is None:
+            return f"<d:response><d:href>{href}</d:href><d:status>HTTP/1.1 404 Not Found</d:status></d:response>"
+        return (
+            f"<d:response><d:href>{href}</d:href><d:propstat><d:prop>{props}</d:prop>"
+            "<d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>"
+        )
+
+    def _multistatus(self, responses, sync_token=None):
+        token = f"<d:sync-token>{sync_token}</d:sync-token>" if sync_token else ""
+        return (
+            '<d:multistatus xmlns:d="DAV:" xmlns:cal="urn:ietf:params:xml:ns:caldav">'
+            f"{''.join(responses)}{token}</d:multistatus>"
+        )
+
+    def request(self, url, method="GET", body="", headers=None, **kwargs):
+        body = to_normal_str(body) if body else ""
+        resp = mock.MagicMock()
+        resp.headers = {}
+        resp.reason = ""
+        resp.status_code = 207
+        if "sync-collection" in body:
+            token = re.search(r"<D:sync-token>token-(\d+)</D:sync-token>", body)
+            since = int(token.group(1)) if token else 0
+            self.requests.append(("sync", since))
+            paths = sorted(set(self.changes[since:]))
+            resp.content = self._multistatus(
+                [
+                    self._response(
+                        path,
+                        f"<d:getetag>{self.objects[path][0]}</d:getetag>"
+                        if path in self.objects
+                        else None,
+                    )
+                    for path in paths
+                ],
+                sync_token=f"token-{len(self.changes)}",
+            )
+        elif "calendar-multiget" in body:
+            hrefs = re.findall(r"<D:href>([^<]*)</D:href>", body)
+            self.requests.append(("multiget", hrefs))
+            resp.content = self._multistatus(
+                [
+                    self._response(
+                        href,
+                        f"<d:getetag>{self.objects[href][0]}</d:getetag>"
+                        f"<cal:calendar-data>{self.objects[href][1]}</cal:calendar-data>",
+                    )
+                    if href in self.objects
+                    else self._response(href)
+                    for href in hrefs
+                ]
+            )
+        elif method == "PROPFIND" and "getetag" in body:
+            self.requests.append(("propfind", None))
+            resp.content = self._multistatus(
+                [self._response("/calendar/", "<d:getetag>calendar</d:getetag>")]
+                + [
+                    self._response(path, f"<d:getetag>{etag}</d:getetag>")
+                    for path, (etag, data) in sorted(self.objects.items())
+                ]
+            )
+        else:
+            self.requests.append((method, url))
+            resp.status_code = 404
+            resp.content = b""
+        return DAVResponse(resp, self)
+
+
+@pytest.fixture
+def server():
+    server = MockedSyncServer()
+    for i in range(5):
+        server.put_event(f"event{i}")
+    return server
+
+
+def summaries(collection):
+    return {obj.url.path: obj.icalendar_component["SUMMARY"] for obj in collection}
+
+
+class TestCalendarMirror:
+    def test_first_sync_downloads_everything(self, server, tmp_path):
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        with CalendarMirror(tmp_path / "mirror.sqlite") as mirror:
+            assert mirror.sync_token(calendar) is None
+            assert len(mirror.objects(calendar)) == 0
+            (updated, deleted) = mirror.sync(calendar)
+            assert len(updated) == 5
+            assert deleted == []
+            assert mirror.sync_token(calendar) == "token-5"
+            objects = mirror.objects(calendar)
+            assert objects.sync_token == "token-5"
+            assert len(objects) == 5
+            assert all(obj.props[dav.GetEtag.tag] for obj in objects)
+
+    def test_warm_start_fetches_only_deltas(self, server, tmp_path):
+        path = tmp_path / "mirror.sqlite"
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        with CalendarMirror(path) as mirror:
+            mirror.sync(calendar)
+
+        server.put_event("event1", summary="Changed")
+        server.put_event("event5", summary="New")
+        server.delete_event("event3")
+        server.requests = []
+
+        ## A new process - new client, new mirror object
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        with CalendarMirror(path) as mirror:
+            (updated, deleted) = mirror.sync(calendar)
+            assert sorted(obj.url.path for obj in updated) == [
+                "/calendar/event1.ics",
+                "/calendar/event5.ics",
+            ]
+            assert [obj.url.path for obj in deleted] == ["/calendar/event3.ics"]
+            assert server.requests == [
+                ("sync", 5),
+                (
+                    "multiget",
+                    ["/calendar/event1.ics", "/calendar/event3.ics", "/calendar/event5.ics"],
+                ),
+            ]
+            objects = mirror.objects(calendar)
+            assert objects.sync_token == "token-8"
+            assert summaries(objects) == {
+                "/calendar/event0.ics": "Event",
+                "/calendar/event1.ics": "Changed",
+                "/calendar/event2.ics": "Event",
+                "/calendar/event4.ics": "Event",
+                "/calendar/event5.ics": "New",
+            }
+
+            ## Nothing changed, nothing transferred
+            server.requests = []
+            assert mirror.sync(calendar) == ([], [])
+            assert server.requests == [("sync", 8)]
+
+    def test_warm_start_without_sync_token_support(self, server, tmp_path):
+        """
+        With fake sync tokens, only an etag PROPFIND and a multiget of
+        the changed objects should be needed
+        """
+        server.features = FeatureSet({"sync-token": {"support": "unsupported"}})
+        path = tmp_path / "mirror.sqlite"
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        calendar.fake_sync_token_store = FakeSyncTokenStore()
+        with CalendarMirror(path) as mirror:
+            (updated, deleted) = mirror.sync(calendar)
+            assert len(updated) == 5
+            assert mirror.sync_token(calendar).startswith("fake-")
+
+        server.put_event("event1", summary="Changed")
+        server.put_event("event5", summary="New")
+        server.delete_event("event3")
+        server.requests = []
+
+        ## A new process, with no fake sync token snapshots in memory
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        calendar.fake_sync_token_store = FakeSyncTokenStore()
+        with CalendarMirror(path) as mirror:
+            (updated, deleted) = mirror.sync(calendar)
+            assert sorted(obj.url.path for obj in updated) == [
+                "/calendar/event1.ics",
+                "/calendar/event5.ics",
+            ]
+            assert [obj.url.path for obj in deleted] == ["/calendar/event3.ics"]
+            assert server.requests == [
+                ("propfind", None),
+                (
+                    "multiget",
+                    ["/calendar/event1.ics", "/calendar/event5.ics", "/calendar/event3.ics"],
+                ),
+            ]
+            assert summaries(mirror.objects(calendar))["/calendar/event1.ics"] == "Changed"
+
+            server.requests = []
+            assert mirror.sync(calendar) == ([], [])
+            assert server.requests == [("propfind", None)]
+
+    def test_forget(self, server):
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        other = Calendar(server, url="https://calendar.example/other/")
+        with CalendarMirror(":memory:") as mirror:
+            mirror.sync(calendar)
+            assert len(mirror.objects(other)) == 0
+            mirror.forget(calendar)
+            assert mirror.sync_token(calendar) is None
+            assert len(mirror.objects(calendar)) == 0
+
+    def test_async_sync(self, server, tmp_path):
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        path = tmp_path / "mirror.sqlite"
+        with CalendarMirror(path) as mirror:
+            mirror.sync(calendar)
+        server.put_event("event1", summary="Changed")
+
+        sync_request = server.request
+
+        async def request(*largs, **kwargs):
+            return sync_request(*largs, **kwargs)
+
+        server.__class__ = type("MockedAsyncSyncServer", (MockedSyncServer, AsyncDAVClient), {})
+        server.request = request
+        calendar = Calendar(server, url="https://calendar.example/calendar/")
+        with CalendarMirror(path) as mirror:
+            (updated, deleted) = asyncio.run(mirror.sync(calendar))
+            assert [obj.url.path for obj in updated] == ["/calendar/event1.ics"]
+            assert summaries(mirror.objects(calendar))["/calendar/event1.ics"] == "Changed"
+
+    def test_default_mirror_path(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_mirror_path() == tmp_path / "caldav" / "mirror.sqlite"
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert default_mirror_path() == tmp_path / ".cache" / "caldav" / "mirror.sqlite"
@@ -16,6 +16,7 @@ build_calendar_query_body = BaseDAVClient._build_calendar_query_body
 build_mkcalendar_body = BaseDAVClient._build_mkcalendar_body
 build_propfind_body = BaseDAVClient._build_propfind_body
 build_sync_collection_body = BaseDAVClient._build_sync_collection_body
+from caldav.lib import error
 from caldav.response import DAVResponse, SyncCollectionResult
 
 
@@ -72,6 +73,70 @@ class TestXMLBuilders:
         assert "sync-collection" in xml.lower()
         assert "token-123" in xml
 
+    def test_templated_bodies_match_element_trees(self):
+        """Bodies rendered from templates should be the same as serialized element trees."""
+        from lxml import etree
+
+        from caldav.elements import cdav, dav
+
+        def tostring(root):
+            return etree.tostring(root.xmlelement(), encoding="utf-8", xml_declaration=True)
+
+        hrefs = ["/cal/event 1.ics", "/cal/a&b<c>.ics"]
+        assert build_calendar_multiget_body(hrefs) == tostring(
+            cdav.CalendarMultiGet()
+            + (dav.Prop() + cdav.CalendarData())
+            + [dav.Href(value=href) for href in hrefs]
+        )
+        assert build_calendar_multiget_body(hrefs[:1], include_etag=True) == tostring(
+            cdav.CalendarMultiGet()
+            + (dav.Prop() + [dav.GetEtag(), cdav.CalendarData()])
+            + dav.Href(value=hrefs[0])
+        )
+
+        assert build_sync_collection_body(sync_token="token&1") == tostring(
+            dav.SyncCollection()
+            + [
+                dav.SyncToken(value="token&1"),
+                dav.SyncLevel(value="1"),
+                dav.Prop() + [dav.GetEtag(), cdav.CalendarData()],
+            ]
+        )
+        assert build_sync_collection_body() == tostring(
+            dav.SyncCollection()
+            + [
+                dav.SyncToken(value=""),
+                dav.SyncLevel(value="1"),
+                dav.Prop() + [dav.GetEtag(), cdav.CalendarData()],
+            ]
+        )
+
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 12, 31)
+        for _ in range(2):
+            body, _comp_type = build_calendar_query_body(
+                start=start, end=end, expand=True, todo=True
+            )
+            assert body == tostring(
+                cdav.CalendarQuery()
+                + [
+                    dav.Prop() + (cdav.CalendarData() + cdav.Expand(start, end)),
+                    cdav.Filter()
+                    + (
+                        cdav.CompFilter("VCALENDAR")
+                        + (cdav.CompFilter("VTODO") + cdav.TimeRange(start, end))
+                    ),
+                ]
+            )
+        body, _comp_type = build_calendar_query_body(end=end)
+        assert body == tostring(
+            cdav.CalendarQuery()
+            + [
+                dav.Prop() + cdav.CalendarData(),
+                cdav.Filter() + (cdav.CompFilter("VCALENDAR") + cdav.TimeRange(None, end)),
+            ]
+        )
+
     def test_build_mkcalendar_body(self):
         """Mkcalendar should include properties."""
         body = build_mkcalendar_body(
@@ -252,3 +317,111 @@ END:VCALENDAR</C:calendar-data>
         # calendar-home-set - extracted href
         home_set = props["{urn:ietf:params:xml:ns:caldav}calendar-home-set"]
         assert home_set == "/calendars/user/"
+
+
+def _calendar_query_xml(count: int) -> bytes:
+    responses = "".join(
+        f"""
+            <D:response>
+                <D:href>/cal/event{i}.ics</D:href>
+                <D:propstat>
+                    <D:prop>
+                        <D:getetag>"etag-{i}"</D:getetag>
+                        <C:calendar-data>BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:event{i}@example.com
+END:VEVENT
+END:VCALENDAR</C:calendar-data>
+                    </D:prop>
+                    <D:status>HTTP/1.1 200 OK</D:status>
+                </D:propstat>
+            </D:response>"""
+        for i in range(count)
+    )
+    return f"""<?xml version="1.0"?>
+        <D:multistatus xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">{responses}
+            <D:sync-token>stream-token</D:sync-token>
+        </D:multistatus>""".encode()
+
+
+class TestStreamingParser:
+    """Test the incremental (stream=True) multistatus parsing."""
+
+    def test_iter_calendar_query_matches_buffered_parse(self):
+        """Streamed parsing, fed in tiny chunks, gives the same results as buffered parsing."""
+        xml = _calendar_query_xml(25)
+        buffered = DAVResponse.from_bytes(xml).parse_calendar_query()
+        response = DAVResponse.from_bytes(xml, stream=True, chunk_size=7)
+        assert response.streaming
+        assert response.tree is None
+        streamed = list(response.iter_calendar_query())
+        assert streamed == buffered
+        assert len(streamed) == 25
+        assert streamed[3].etag == '"etag-3"'
+        assert "UID:event3@example.com" in streamed[3].calendar_data
+        assert response.sync_token == "stream-token"
+
+    def test_iter_yields_before_body_is_complete(self):
+        """The first result is available before the rest of the body has been read."""
+        xml = _calendar_query_xml(10)
+        response = DAVResponse.from_bytes(xml, stream=True, chunk_size=64)
+        fed = []
+        original = response._stream_response.iter_content
+
+        def tracking_iter_content(size):
+            for chunk in original(size):
+                fed.append(len(chunk))
+                yield chunk
+
+        response._stream_response.iter_content = tracking_iter_content
+        first = next(response.iter_calendar_query())
+        assert first.href == "/cal/event0.ics"
+        assert sum(fed) < len(xml)
+
+    def test_iter_propfind_ignores_nested_sync_token_property(self):
+        """A sync-token requested as a property is not taken as the collection token."""
+        xml = b"""<?xml version="1.0"?>
+        <D:multistatus xmlns:D="DAV:">
+            <D:response>
+                <D:href>/cal/</D:href>
+                <D:propstat>
+                    <D:prop><D:sync-token>prop-token</D:sync-token></D:prop>
+                    <D:status>HTTP/1.1 200 OK</D:status>
+                </D:propstat>
+            </D:response>
+        </D:multistatus>"""
+        response = DAVResponse.from_bytes(xml, stream=True, chunk_size=16)
+        results = list(response.iter_propfind())
+        assert len(results) == 1
+        assert results[0].properties["{DAV:}sync-token"] == "prop-token"
+        assert response._sync_token is None
+
+    def test_streamed_body_can_only_be_consumed_once(self):
+        response = DAVResponse.from_bytes(_calendar_query_xml(2), stream=True)
+        assert len(response.parse_calendar_query()) == 2
+        with pytest.raises(error.ResponseError):
+            list(response.iter_calendar_query())
+
+    def test_iter_on_buffered_response(self):
+        """The iterators also work on ordinary buffered responses."""
+        response = DAVResponse.from_bytes(_calendar_query_xml(3))
+        assert [r.href for r in response.iter_calendar_query()] == [
+            "/cal/event0.ics",
+            "/cal/event1.ics",
+            "/cal/event2.ics",
+        ]
+
+    def test_streamed_empty_and_error_responses(self):
+        assert list(DAVResponse.from_bytes(b"", stream=True).iter_calendar_query()) == []
+        assert list(DAVResponse.from_bytes(b"", status_code=404, stream=True).iter_propfind()) == []
+        with pytest.raises(error.ResponseError):
+            list(DAVResponse.from_bytes(b"", status_code=500, stream=True).iter_calendar_query())
+
+    @pytest.mark.asyncio
+    async def test_aiter_calendar_query(self):
+        xml = _calendar_query_xml(5)
+        response = DAVResponse.from_bytes(xml, stream=True, chunk_size=11)
+        streamed = [r async for r in response.aiter_calendar_query()]
+        assert streamed == DAVResponse.from_bytes(xml).parse_calendar_query()
+        assert response.sync_token == "stream-token"
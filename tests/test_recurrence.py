@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+"""
+The recurrence expansion in caldav.lib.recurrence should give the same
+results as recurring-ical-events, which it replaces for the common cases.
+"""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import icalendar
+import pytest
+import recurring_ical_events
+
+from caldav.lib.recurrence import expand_recurrence_set
+from caldav.search import CalDAVSearcher
+
+utc = timezone.utc
+oslo = ZoneInfo("Europe/Oslo")
+
+
+def vevent(*lines):
+    return "BEGIN:VEVENT\nUID:series@example.com\nDTSTAMP:20260101T000000Z\n%s\nEND:VEVENT\n" % (
+        "\n".join(lines)
+    )
+
+
+series = {
+    "zoned": vevent(
+        "DTSTART;TZID=Europe/Oslo:20260301T100000",
+        "DTEND;TZID=Europe/Oslo:20260301T110000",
+        "RRULE:FREQ=DAILY;COUNT=60",
+        "EXDATE:20260302T090000Z",
+        "SUMMARY:Daily meeting",
+    ),
+    "override": vevent(
+        "DTSTART;TZID=Europe/Oslo:20260301T100000",
+        "DTEND;TZID=Europe/Oslo:20260301T110000",
+        "RRULE:FREQ=DAILY",
+        "SEQUENCE:1",
+    )
+    + vevent(
+        "RECURRENCE-ID;TZID=Europe/Oslo:20260303T100000",
+        "DTSTART;TZID=Europe/Oslo:20260303T120000",
+        "DTEND;TZID=Europe/Oslo:20260303T130000",
+        "SUMMARY:Moved",
+        "SEQUENCE:2",
+    ),
+    "moved into the range": vevent("DTSTART:20260301T100000Z", "DURATION:PT1H", "RRULE:FREQ=WEEKLY")
+    + vevent("RECURRENCE-ID:20260201T100000Z", "DTSTART:20260304T120000Z", "DURATION:PT1H"),
+    "moved out of the range": vevent(
+        "DTSTART:20260301T100000Z", "DURATION:PT1H", "RRULE:FREQ=WEEKLY"
+    )
+    + vevent("RECURRENCE-ID:20260308T100000Z", "DTSTART:20260601T120000Z", "DURATION:PT1H"),
+    "override of an excluded occurrence": vevent(
+        "DTSTART:20260301T100000Z",
+        "DTEND:20260301T110000Z",
+        "RRULE:FREQ=DAILY;COUNT=5",
+        "EXDATE:20260302T100000Z",
+    )
+    + vevent(
+        "RECURRENCE-ID:20260302T100000Z", "DTSTART:20260302T120000Z", "DTEND:20260302T130000Z"
+    ),
+    "all-day": vevent(
+        "DTSTART;VALUE=DATE:20260301",
+        "DTEND;VALUE=DATE:20260302",
+        "RRULE:FREQ=DAILY;INTERVAL=3",
+        "EXDATE;VALUE=DATE:20260304",
+    ),
+    "all-day without DTEND": vevent("DTSTART;VALUE=DATE:20250301", "RRULE:FREQ=YEARLY"),
+    "floating": vevent(
+        "DTSTART:20260301T100000",
+        "DTEND:20260301T103000",
+        "RRULE:FREQ=DAILY;UNTIL=20260320T100000",
+        "EXDATE:20260305T100000",
+    ),
+    "daylight saving time": vevent(
+        "DTSTART;TZID=Europe/Oslo:20260320T023000",
+        "DTEND;TZID=Europe/Oslo:20260320T033000",
+        "RRULE:FREQ=DAILY;COUNT=20",
+    ),
+    "UNTIL in UTC": vevent(
+        "DTSTART;TZID=America/New_York:20260301T100000",
+        "DTEND;TZID=America/New_York:20260301T110000",
+        "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR;UNTIL=20260401T140000Z",
+    ),
+    "RDATE": vevent(
+        "DTSTART:20260301T100000Z",
+        "DTEND:20260301T110000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=4",
+        "RDATE:20260303T150000Z,20260410T100000Z",
+    ),
+    "no duration": vevent("DTSTART:20260301T000000Z", "RRULE:FREQ=DAILY;COUNT=10"),
+    "DTSTART not matching the rule": vevent(
+        "DTSTART:20260302T100000Z",
+        "DTEND:20260302T110000Z",
+        "RRULE:FREQ=WEEKLY;BYDAY=SU;COUNT=3",
+    ),
+    "EXDATE as a date": vevent(
+        "DTSTART;TZID=Europe/Oslo:20260301T100000",
+        "DTEND;TZID=Europe/Oslo:20260301T110000",
+        "RRULE:FREQ=DAILY;COUNT=10",
+        "EXDATE;VALUE=DATE:20260303",
+    ),
+    "alarm": vevent(
+        "DTSTART:20260301T100000Z",
+        "DTEND:20260301T110000Z",
+        "RRULE:FREQ=DAILY;COUNT=3",
+        "BEGIN:VALARM\nACTION:DISPLAY\nTRIGGER:-PT5M\nDESCRIPTION:Reminder\nEND:VALARM",
+    ),
+    "longer than the interval": vevent(
+        "DTSTART:20260225T100000Z", "DTEND:20260303T110000Z", "RRULE:FREQ=WEEKLY;COUNT=5"
+    ),
+}
+
+ranges = [
+    (datetime(2026, 3, 1, tzinfo=utc), datetime(2026, 3, 10, tzinfo=utc)),
+    (datetime(2026, 3, 2, 12, tzinfo=oslo), datetime(2026, 4, 1, tzinfo=oslo)),
+    (datetime(2026, 2, 1, tzinfo=utc), datetime(2027, 2, 1, tzinfo=utc)),
+    (datetime(2026, 3, 1, 10, tzinfo=utc), datetime(2026, 3, 1, 10, tzinfo=utc)),
+    (datetime(2026, 3, 3, 10, 30, tzinfo=utc), datetime(2026, 3, 3, 10, 31, tzinfo=utc)),
+]
+
+
+def load(data):
+    return icalendar.Calendar.from_ical(
+        "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Example//EN\n%sEND:VCALENDAR\n" % data
+    )
+
+
+@pytest.mark.parametrize("name", list(series))
+@pytest.mark.parametrize("start,end", ranges)
+def test_same_as_recurring_ical_events(name, start, end):
+    calendar = load(series[name])
+    expected = recurring_ical_events.of(calendar).between(start, end)
+    expanded = expand_recurrence_set(calendar.subcomponents, start, end)
+    assert expanded is not None
+    assert sorted(x.to_ical() for x in expanded) == sorted(x.to_ical() for x in expected)
+
+
+def test_occurrences_share_the_values_of_the_master():
+    calendar = load(series["alarm"])
+    master = calendar.subcomponents[0]
+    expanded = expand_recurrence_set(
+        calendar.subcomponents,
+        datetime(2026, 3, 1, tzinfo=utc),
+        datetime(2026, 3, 10, tzinfo=utc),
+    )
+    assert len(expanded) == 3
+    assert all(x["UID"] is master["UID"] for x in expanded)
+    assert all(x.subcomponents[0] is master.subcomponents[0] for x in expanded)
+    assert [x["DTSTART"].dt.day for x in expanded] == [1, 2, 3]
+    assert all("RRULE" not in x for x in expanded)
+    ## the master is left as it was
+    assert master["DTSTART"].dt == datetime(2026, 3, 1, 10, tzinfo=utc)
+    assert "RRULE" in master and "RECURRENCE-ID" not in master
+
+
+@pytest.mark.parametrize(
+    "data,start",
+    [
+        ## RANGE=THISANDFUTURE
+        (
+            series["zoned"]
+            + vevent(
+                "RECURRENCE-ID;RANGE=THISANDFUTURE:20260305T090000Z",
+                "DTSTART:20260305T110000Z",
+                "DTEND:20260305T120000Z",
+            ),
+            datetime(2026, 3, 1, tzinfo=utc),
+        ),
+        ## RDATE periods
+        (
+            vevent(
+                "DTSTART:20260301T100000Z",
+                "RRULE:FREQ=DAILY",
+                "RDATE;VALUE=PERIOD:20260301T150000Z/PT2H",
+            ),
+            datetime(2026, 3, 1, tzinfo=utc),
+        ),
+        ## tasks
+        (
+            "BEGIN:VTODO\nUID:todo\nDTSTAMP:20260101T000000Z\nDTSTART:20260301T100000Z\n"
+            "RRULE:FREQ=DAILY\nEND:VTODO\n",
+            datetime(2026, 3, 1, tzinfo=utc),
+        ),
+        ## floating search range
+        (series["zoned"], datetime(2026, 3, 1)),
+    ],
+)
+def test_unsupported_recurrence_sets_are_left_to_recurring_ical_events(data, start):
+    calendar = load(data)
+    end = start.replace(month=4)
+    assert expand_recurrence_set(calendar.subcomponents, start, end) is None
+
+
+def test_searcher_expands_through_the_engine():
+    calendar = load(series["override"])
+    searcher = CalDAVSearcher(
+        event=True,
+        start=datetime(2026, 3, 1, tzinfo=utc),
+        end=datetime(2026, 3, 5, tzinfo=utc),
+        expand=True,
+    )
+    expanded = list(searcher.check_component(calendar))
+    assert [str(x.get("SUMMARY", "")) for x in expanded] == ["", "", "Moved", ""]
+    assert all("RECURRENCE-ID" in x and "RRULE" not in x for x in expanded)
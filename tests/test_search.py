@@ -13,11 +13,15 @@ from unittest import mock
 
 import icalendar
 import pytest
+from icalendar_searcher import Searcher
+from lxml import etree
 
 from caldav import Event, Journal, Todo
 from caldav.davclient import DAVClient
+from caldav.elements import dav
+from caldav.lib import error
 from caldav.lib.url import URL
-from caldav.search import CalDAVSearcher
+from caldav.search import CalDAVSearcher, _build_search_xml_body
 
 # Example icalendar data for testing
 SIMPLE_EVENT = """BEGIN:VCALENDAR
@@ -356,6 +360,73 @@ class TestCalDAVSearcherFilterExpand:
             assert len(tz_components) == 1
             assert tz_components[0].get("TZID") == "America/New_York"
 
+    def test_filter_split_occurrences_share_structure(
+        self, mock_client: DAVClient, mock_url: str
+    ) -> None:
+        """Split occurrences share the timezones and property values until edited."""
+        searcher = CalDAVSearcher(
+            expand=True,
+            start=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            end=datetime(2024, 6, 30, tzinfo=timezone.utc),
+        )
+        data = RECURRING_EVENT_WITH_TIMEZONE.replace(
+            "SUMMARY:Morning Meeting",
+            "SUMMARY:Morning Meeting\nATTENDEE;PARTSTAT=NEEDS-ACTION:mailto:alice@example.com",
+        )
+        event = Event(client=mock_client, url=mock_url, data=data)
+
+        with mock.patch.object(Event, "copy", side_effect=AssertionError("copied")):
+            result = searcher.filter(
+                [event], post_filter=True, split_expanded=True, server_expand=False
+            )
+
+        assert len(result) == 3
+        assert all(x.url == event.url and x.id == "tz-event@example.com" for x in result)
+        (first, second, third) = [x.icalendar_instance.subcomponents for x in result]
+        assert first[0] is second[0]
+        assert first[1]["SUMMARY"] is second[1]["SUMMARY"]
+        assert first[1]["DTSTART"].dt != second[1]["DTSTART"].dt
+
+        ## Replacing a property only affects the occurrence itself
+        result[0].icalendar_component["SUMMARY"] = "Changed"
+        assert second[1]["SUMMARY"] == "Morning Meeting"
+
+        ## In-place edits are done on a copy of its own
+        result[1].change_attendee_status("mailto:alice@example.com", PARTSTAT="ACCEPTED")
+        with result[2].edit_icalendar_instance() as cal:
+            cal.subcomponents[0]["TZID"] = "Changed"
+        assert result[1].icalendar_component["ATTENDEE"].params["PARTSTAT"] == "ACCEPTED"
+        assert third[1]["ATTENDEE"].params["PARTSTAT"] == "NEEDS-ACTION"
+        assert first[0]["TZID"] == "America/New_York"
+        assert "Changed" not in result[0].data.replace("SUMMARY:Changed", "")
+
+    def test_filter_split_occurrences_add_repeated_property(
+        self, mock_client: DAVClient, mock_url: str
+    ) -> None:
+        """Adding to a repeated property only affects the occurrence itself."""
+        searcher = CalDAVSearcher(
+            expand=True,
+            start=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            end=datetime(2024, 6, 30, tzinfo=timezone.utc),
+        )
+        data = RECURRING_EVENT_WITH_TIMEZONE.replace(
+            "SUMMARY:Morning Meeting",
+            "SUMMARY:Morning Meeting\nATTENDEE:mailto:alice@example.com\n"
+            "ATTENDEE:mailto:bob@example.com",
+        )
+        event = Event(client=mock_client, url=mock_url, data=data)
+        master = event.icalendar_component
+        result = searcher.filter(
+            [event], post_filter=True, split_expanded=True, server_expand=False
+        )
+        assert len(result) == 3
+
+        result[0].icalendar_component.add("attendee", "mailto:carol@example.com")
+        assert len(result[0].icalendar_component["ATTENDEE"]) == 3
+        assert len(result[1].icalendar_component["ATTENDEE"]) == 2
+        assert len(result[2].icalendar_component["ATTENDEE"]) == 2
+        assert len(master["ATTENDEE"]) == 2
+
     def test_filter_non_recurring_event_no_expansion(
         self, mock_client: DAVClient, mock_url: str
     ) -> None:
@@ -867,3 +938,366 @@ class TestSearchWithCompTypesFullXML:
 
         assert result == [event]
         calendar._request_report_build_resultlist.assert_called_once_with(full_xml, None, None)
+
+
+class TestCalDAVSearcherFields:
+    """search(fields=...) should request only some iCalendar properties,
+    and trim the objects client-side if the server can't do it"""
+
+    def _search(self, mock_client, mock_url, partial_retrieval):
+        def mock_is_supported(feat, type_=bool):
+            if feat == "search.partial-retrieval":
+                return partial_retrieval
+            if type_ is str:
+                return "full"
+            return True
+
+        mock_client.features.is_supported = mock.Mock(side_effect=mock_is_supported)
+        mock_client.features.backward_compatibility_mode = False
+
+        event = Event(
+            client=mock_client, url=mock_url, data=SIMPLE_JOURNAL.replace("VJOURNAL", "VEVENT")
+        )
+        calendar = mock.Mock()
+        calendar.client = mock_client
+        calendar._request_report_build_resultlist.return_value = (mock.Mock(), [event])
+
+        searcher = CalDAVSearcher(event=True, fields=["summary"])
+        result = searcher.search(calendar)
+        xml = calendar._request_report_build_resultlist.call_args[0][0]
+        ## Queries without fields are rendered from a template
+        if not isinstance(xml, bytes):
+            xml = etree.tostring(xml.xmlelement())
+        return result, xml.decode()
+
+    def test_fields_server_side(self, mock_client: DAVClient, mock_url: str) -> None:
+        result, xml = self._search(mock_client, mock_url, True)
+        assert '<C:comp name="VEVENT">' in xml
+        assert '<C:prop name="SUMMARY"/>' in xml
+        assert '<C:prop name="UID"/>' in xml
+        assert 'name="DESCRIPTION"' not in xml
+        assert len(result) == 1
+        assert result[0].is_partial()
+        ## The server is trusted to do the trimming
+        assert "DESCRIPTION" in result[0].icalendar_component
+
+    def test_fields_client_side(self, mock_client: DAVClient, mock_url: str) -> None:
+        result, xml = self._search(mock_client, mock_url, False)
+        assert "<C:comp " not in xml
+        assert len(result) == 1
+        assert result[0].is_partial()
+        component = result[0].icalendar_component
+        assert "DESCRIPTION" not in component
+        assert "DTSTAMP" not in component
+        assert component["SUMMARY"] == "Daily notes"
+        assert component["UID"] == "simple-journal@example.com"
+        with pytest.raises(error.ConsistencyError):
+            result[0].save()
+        ## Setting the data makes the object complete
+        result[0].data = SIMPLE_EVENT
+        assert not result[0].is_partial()
+
+
+class TestCalDAVSearcherRawData:
+    """Sorting and UID filtering should not need to parse objects
+    holding raw data"""
+
+    def _todo(self, mock_client, mock_url, i, *lines):
+        data = "\n".join(
+            ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Example//EN", "BEGIN:VTODO"]
+            + [f"UID:todo-{i}@example.com", "DTSTAMP:20260101T000000Z"]
+            + list(lines)
+            + ["END:VTODO", "END:VCALENDAR", ""]
+        )
+        return Todo(client=mock_client, url=f"{mock_url}/{i}.ics", data=data)
+
+    @pytest.mark.parametrize(
+        "sort_keys",
+        [
+            [("due", False)],
+            [("due", True)],
+            [("priority", False), ("summary", False)],
+            [("status", True), ("dtstart", False)],
+            [("hasnt_started", False), ("dtstart", False)],
+        ],
+    )
+    def test_sorting_value_same_as_parsed(
+        self, mock_client: DAVClient, mock_url: str, sort_keys: list
+    ) -> None:
+        todos = [
+            self._todo(mock_client, mock_url, 1, "DUE:20260301T100000Z", "PRIORITY:5"),
+            self._todo(mock_client, mock_url, 2, "DUE;VALUE=DATE:20260215", "SUMMARY:Beta"),
+            self._todo(
+                mock_client,
+                mock_url,
+                3,
+                "DTSTART;TZID=Europe/Oslo:20260210T090000",
+                "STATUS:COMPLETED",
+                "SUMMARY:Alpha",
+            ),
+            self._todo(mock_client, mock_url, 4, "PRIORITY:1", "SUMMARY:Gamma"),
+        ]
+        searcher = CalDAVSearcher(todo=True)
+        for key, reverse in sort_keys:
+            searcher.add_sort_key(key, reverse)
+        for todo in todos:
+            expected = Searcher.sorting_value(searcher, icalendar.Calendar.from_ical(todo.data))
+            assert searcher.sorting_value(todo) == expected
+            assert todo._icalendar_instance is None
+
+    def test_sorting_value_falls_back_to_parsing(
+        self, mock_client: DAVClient, mock_url: str
+    ) -> None:
+        todo = self._todo(mock_client, mock_url, 1, "SUMMARY:Semi\\;colon")
+        searcher = CalDAVSearcher(todo=True)
+        searcher.add_sort_key("summary")
+        assert searcher.sorting_value(todo) == Searcher.sorting_value(searcher, todo)
+        assert searcher.sorting_value(todo)[0] == b"Semi;colon"
+
+    @pytest.mark.parametrize("operator", ["contains", "=="])
+    def test_uid_filter_without_parsing(
+        self, mock_client: DAVClient, mock_url: str, operator: str
+    ) -> None:
+        todos = [self._todo(mock_client, mock_url, i) for i in range(3)]
+        searcher = CalDAVSearcher(todo=True)
+        searcher.add_property_filter(
+            "uid", "todo-1" if operator == "contains" else "todo-1@example.com", operator
+        )
+        result = searcher.filter(todos, post_filter=True, split_expanded=False)
+        assert [x.url for x in result] == [todos[1].url]
+        assert todos[0]._icalendar_instance is None
+        assert todos[2]._icalendar_instance is None
+
+
+class TestCalDAVSearcherXMLTemplates:
+    """The common calendar-query bodies are rendered from templates"""
+
+    @pytest.mark.parametrize(
+        "kwargs,uid,server_expand",
+        [
+            ({"event": True}, None, False),
+            ({"todo": True, "start": True, "end": True}, None, False),
+            ({"event": True, "start": True, "end": True}, None, True),
+            ({"start": True}, None, False),
+            ({"comp_class": Journal, "end": True}, None, False),
+            ({}, {}, False),
+            ({"todo": True}, {"operator": "=="}, False),
+            ({"event": True, "start": True}, {"case_sensitive": False}, False),
+        ],
+    )
+    def test_templated_bodies_match_element_trees(
+        self, kwargs: dict, uid: dict | None, server_expand: bool
+    ) -> None:
+        ## The second round is rendered from the cached template
+        for i in range(2):
+            searchers = []
+            for _ in range(2):
+                kwargs_ = dict(kwargs)
+                for name in ("start", "end"):
+                    if name in kwargs_:
+                        kwargs_[name] = datetime(2026, 1 + i, 1 if name == "start" else 28)
+                searcher = CalDAVSearcher(**kwargs_)
+                if uid is not None:
+                    searcher.add_property_filter("uid", f"uid-{i}&<a>,b;c\\d", **uid)
+                searchers.append(searcher)
+            (body, comp_class) = _build_search_xml_body(searchers[0], server_expand)
+            (root, expected_class) = searchers[1].build_search_xml_query(server_expand)
+            assert body == etree.tostring(root.xmlelement(), encoding="utf-8", xml_declaration=True)
+            assert comp_class is expected_class
+            (first, second) = searchers
+            assert (first.event, first.todo, first.journal) == (
+                second.event,
+                second.todo,
+                second.journal,
+            )
+
+    def test_other_queries_are_built_as_element_trees(self) -> None:
+        searcher = CalDAVSearcher(event=True)
+        searcher.add_property_filter("SUMMARY", "meeting")
+        (xml, _comp_class) = _build_search_xml_body(searcher)
+        assert 'name="SUMMARY"' in str(xml)
+        (xml, _comp_class) = _build_search_xml_body(
+            CalDAVSearcher(event=True), props=[dav.GetEtag()]
+        )
+        assert "getetag" in str(xml)
+
+
+class TestSearchWithCompTypesParallel:
+    """Without search.comp-type.optional, one search is done per component
+    type.  Those should run concurrently when possible."""
+
+    def _calendar(self, mock_client, features):
+        import threading
+        import time
+
+        from caldav import Calendar
+        from caldav.compatibility_hints import FeatureSet
+
+        mock_client.features = FeatureSet(features)
+        calendar = Calendar(mock_client, url="https://calendar.example.com/calendars/user/cal/")
+        data = {Event: SIMPLE_EVENT, Todo: SIMPLE_TODO, Journal: SIMPLE_JOURNAL}
+        lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        def report(xml, comp_class, props=None):
+            with lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.05)
+            with lock:
+                self.in_flight -= 1
+            obj = comp_class(client=mock_client, parent=calendar, data=data[comp_class])
+            return (mock.Mock(), [obj])
+
+        calendar._request_report_build_resultlist = report
+        return calendar
+
+    @pytest.mark.parametrize("multiplexing", [False, True])
+    def test_search_with_comptypes(self, mock_client: DAVClient, multiplexing: bool) -> None:
+        calendar = self._calendar(
+            mock_client,
+            {"search.comp-type.optional": False, "http.multiplexing": multiplexing},
+        )
+        result = calendar.search()
+        assert [type(x) for x in result] == [Event, Todo, Journal]
+        assert self.max_in_flight == (3 if multiplexing else 1)
+
+    @pytest.mark.asyncio
+    async def test_async_search_with_comptypes(self) -> None:
+        import asyncio
+
+        from caldav.async_davclient import AsyncDAVClient
+
+        client = mock.Mock(spec=AsyncDAVClient)
+        client.url = URL("https://calendar.example.com/calendars/user/")
+        calendar = self._calendar(client, {"search.comp-type.optional": False})
+        data = {Event: SIMPLE_EVENT, Todo: SIMPLE_TODO, Journal: SIMPLE_JOURNAL}
+
+        async def report(xml, comp_class, props=None):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+            obj = comp_class(client=client, parent=calendar, data=data[comp_class])
+            return (mock.Mock(), [obj])
+
+        calendar._request_report_build_resultlist = report
+        result = await calendar.search()
+        assert [type(x) for x in result] == [Event, Todo, Journal]
+        assert self.max_in_flight == 3
+
+
+class TestPrincipalSearch:
+    """Principal.search runs the search on all calendars concurrently,
+    merging the results"""
+
+    def _calendars(self, client, count):
+        import threading
+        import time
+
+        from caldav import Calendar
+        from caldav.compatibility_hints import FeatureSet
+
+        client.features = FeatureSet({})
+        lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.events = []
+        calendars = []
+        for i in range(count):
+            calendar = Calendar(client, url=f"https://calendar.example.com/calendars/user/{i}/")
+            ## calendar i has events on day i+1 and i+1+count
+            events = [
+                SIMPLE_EVENT.replace("20240615", f"202406{day:02}").replace(
+                    "simple-event", f"event-{day}"
+                )
+                for day in (i + 1, i + 1 + count)
+            ]
+
+            def report(xml, comp_class, props=None, calendar=calendar, events=events):
+                with lock:
+                    self.in_flight += 1
+                    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                time.sleep(0.05)
+                with lock:
+                    self.in_flight -= 1
+                return (
+                    mock.Mock(),
+                    [Event(client=client, parent=calendar, data=data) for data in events],
+                )
+
+            calendar._request_report_build_resultlist = report
+            calendars.append(calendar)
+            self.events.append(events)
+        return calendars
+
+    def _principal(self, client):
+        from caldav import Principal
+
+        return Principal(client=client, url="https://calendar.example.com/principals/user/")
+
+    def test_search_merges_sorted_results(self, mock_client: DAVClient) -> None:
+        calendars = self._calendars(mock_client, 6)
+        principal = self._principal(mock_client)
+        result = principal.search(
+            calendars=calendars, event=True, sort_keys=["dtstart"], max_concurrency=3
+        )
+        assert [x.icalendar_component["UID"] for x in result] == [
+            f"event-{day}@example.com" for day in range(1, 13)
+        ]
+        assert self.max_in_flight == 3
+
+    def test_search_without_sort_keys(self, mock_client: DAVClient) -> None:
+        calendars = self._calendars(mock_client, 3)
+        mock_client.get_calendars.return_value = calendars
+        principal = self._principal(mock_client)
+        result = list(principal.iter_search(event=True))
+        ## in calendar order
+        assert [x.parent for x in result] == [c for c in calendars for _ in range(2)]
+        assert self.max_in_flight == 3
+
+    def test_search_with_searcher(self, mock_client: DAVClient) -> None:
+        calendars = self._calendars(mock_client, 2)
+        principal = self._principal(mock_client)
+        searcher = CalDAVSearcher(event=True)
+        searcher.add_sort_key("dtstart", reversed=True)
+        result = principal.search(calendars, searcher=searcher)
+        assert [x.icalendar_component["UID"] for x in result] == [
+            f"event-{day}@example.com" for day in (4, 3, 2, 1)
+        ]
+        with pytest.raises(error.ConsistencyError):
+            principal.search(calendars, searcher=searcher, event=True)
+
+    @pytest.mark.asyncio
+    async def test_async_search(self) -> None:
+        import asyncio
+
+        from caldav.async_davclient import AsyncDAVClient
+
+        client = mock.Mock(spec=AsyncDAVClient)
+        client.url = URL("https://calendar.example.com/calendars/user/")
+        calendars = self._calendars(client, 4)
+        for calendar, events in zip(calendars, self.events, strict=True):
+
+            async def report(xml, comp_class, props=None, calendar=calendar, events=events):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.05)
+                self.in_flight -= 1
+                return (
+                    mock.Mock(),
+                    [Event(client=client, parent=calendar, data=data) for data in events],
+                )
+
+            calendar._request_report_build_resultlist = report
+        principal = self._principal(client)
+        result = await principal.search(
+            calendars=calendars, event=True, sort_keys=["dtstart"], max_concurrency=2
+        )
+        assert [x.icalendar_component["UID"] for x in result] == [
+            f"event-{day}@example.com" for day in range(1, 9)
+        ]
+        assert self.max_in_flight == 2
+        result = [x async for x in principal.iter_search(calendars=calendars, event=True)]
+        assert len(result) == 8
@@ -9,8 +9,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from caldav.collection import Calendar
-from caldav.elements import dav
+from caldav.collection import Calendar, FakeSyncTokenStore
+from caldav.elements import cdav, dav
 from caldav.lib.url import URL
 
 
@@ -26,6 +26,7 @@ class TestSyncTokenFallback:
         self.mock_client.url = URL("http://example.com/")
 
         self.calendar = Calendar(client=self.mock_client, url=URL("http://example.com/calendar/"))
+        self.calendar.fake_sync_token_store = FakeSyncTokenStore()
 
     def create_mock_object(self, url_str: str, etag: str = None, data: str = None):
         """Create a mock CalendarObjectResource."""
@@ -139,8 +140,8 @@ class TestSyncTokenFallback:
         assert result2.sync_token == initial_token
 
     @patch.object(Calendar, "search")
-    def test_fallback_returns_all_when_etag_changed(self, mock_search) -> None:
-        """Test that fallback returns all objects when ETags change."""
+    def test_fallback_returns_changes_when_etag_changed(self, mock_search) -> None:
+        """Test that fallback returns only the changed objects when ETags change."""
         # First call: return objects with initial ETags
         obj1 = self.create_mock_object("http://example.com/1.ics", etag="etag-1")
         obj2 = self.create_mock_object("http://example.com/2.ics", etag="etag-2")
@@ -156,87 +157,128 @@ class TestSyncTokenFallback:
         obj2_same = self.create_mock_object("http://example.com/2.ics", etag="etag-2")
         mock_search.return_value = [obj1_modified, obj2_same]
 
-        # Second call: with old token, should detect change and return all objects
+        # Second call: with old token, should detect change and return the changed object
         result2 = self.calendar.get_objects_by_sync_token(
             sync_token=initial_token, load_objects=False
         )
 
-        assert len(list(result2)) == 2, "Should return all objects when changes detected"
+        assert list(result2) == [obj1_modified], "Should return the changed object only"
         assert result2.sync_token != initial_token
 
-    ## TODO
-    @pytest.mark.xfail(
-        reason="Mock objects don't preserve props updates properly - integration test needed"
-    )
-    @patch.object(Calendar, "_query_properties")
     @patch.object(Calendar, "search")
-    def test_fallback_fetches_etags_when_missing(self, mock_search, mock_query_props) -> None:
-        """
-        Test that fallback fetches ETags when search() doesn't return them.
+    def test_fallback_returns_additions_and_deletions(self, mock_search) -> None:
+        """Test that added objects and (unloaded) objects for deleted hrefs are returned."""
+        obj1 = self.create_mock_object("http://example.com/calendar/1.ics", etag="etag-1")
+        obj2 = self.create_mock_object("http://example.com/calendar/2.ics", etag="etag-2")
+        mock_search.return_value = [obj1, obj2]
+        self.mock_client.features.is_supported.return_value = {"support": "unsupported"}
+        initial_token = self.calendar.get_objects_by_sync_token().sync_token
 
-        This verifies the fix: when search() returns objects without ETags,
-        the fallback should do a PROPFIND to fetch them.
+        obj3 = self.create_mock_object("http://example.com/calendar/3.ics", etag="etag-3")
+        mock_search.return_value = [obj1, obj3]
+        result = list(self.calendar.get_objects_by_sync_token(sync_token=initial_token))
 
-        NOTE: This test is marked as xfail because Mock objects don't preserve
-        props updates properly. The actual functionality works in integration tests.
-        """
-        # First call: return objects without ETags
-        obj1 = self.create_mock_object("http://example.com/calendar/1.ics", data="DATA1")
-        obj2 = self.create_mock_object("http://example.com/calendar/2.ics", data="DATA2")
-        mock_search.return_value = [obj1, obj2]
+        assert result[0] is obj3
+        assert len(result) == 2
+        assert result[1].url == URL("http://example.com/calendar/2.ics")
+        assert result[1].data is None
 
-        # Mock PROPFIND response with ETags
-        mock_response = Mock()
-        mock_response.expand_simple_props.return_value = {
-            "http://example.com/calendar/1.ics": {dav.GetEtag.tag: "etag-1"},
-            "http://example.com/calendar/2.ics": {dav.GetEtag.tag: "etag-2"},
-        }
-        mock_query_props.return_value = mock_response
+    @patch.object(Calendar, "search")
+    def test_fallback_returns_all_for_unknown_token(self, mock_search) -> None:
+        """Without the snapshot behind the token, all objects are returned."""
+        obj1 = self.create_mock_object("http://example.com/1.ics", etag="etag-1")
+        obj2 = self.create_mock_object("http://example.com/2.ics", etag="etag-2")
+        mock_search.return_value = [obj1, obj2]
+        self.mock_client.features.is_supported.return_value = {"support": "unsupported"}
 
+        result = self.calendar.get_objects_by_sync_token(sync_token="fake-unknown")
+
+        assert len(list(result)) == 2
+        assert result.sync_token in self.calendar.fake_sync_token_store
+
+    def test_fake_sync_token_store_size(self) -> None:
+        store = FakeSyncTokenStore(maxsize=2)
+        store["fake-1"] = {}
+        store["fake-2"] = {"http://example.com/1.ics": "etag-1"}
+        store["fake-3"] = {}
+        assert list(store) == ["fake-2", "fake-3"]
+        assert store.get("fake-1") is None
+        assert store["fake-2"] == {"http://example.com/1.ics": "etag-1"}
+
+    def test_fake_sync_token_store_per_client_and_calendar(self) -> None:
+        from caldav.davclient import DAVClient
+
+        client = DAVClient(url="http://example.com/")
+        calendars = [client.calendar(url=f"http://example.com/cal{i}/") for i in range(20)]
+        for i, calendar in enumerate(calendars):
+            calendar.fake_sync_token_store[f"fake-{i}"] = {}
+        ## Every calendar keeps its own snapshots
+        assert all(f"fake-{i}" in x.fake_sync_token_store for i, x in enumerate(calendars))
+        assert list(calendars[0].fake_sync_token_store) == ["fake-0"]
+        ## The store belongs to the client, not to the Calendar object
+        assert "fake-0" in client.calendar(url="http://example.com/cal0/").fake_sync_token_store
+        other = DAVClient(url="http://example.com/")
+        assert not other.calendar(url="http://example.com/cal0/").fake_sync_token_store
+
+    @patch.object(Calendar, "_query")
+    @patch.object(Calendar, "_query_properties")
+    def test_fallback_fetches_etags_when_missing(self, mock_query_props, mock_query) -> None:
+        """
+        Test that the fallback fetches the ETags through a PROPFIND, and
+        loads only the added and changed objects through a multiget.
+        """
         self.mock_client.features.is_supported.return_value = {"support": "unsupported"}
 
-        result1 = self.calendar.get_objects_by_sync_token(sync_token=None, load_objects=False)
+        def propfind_response(etags):
+            response = Mock()
+            response.expand_simple_props.return_value = {
+                f"http://example.com/calendar/{i}.ics": {dav.GetEtag.tag: etag}
+                for (i, etag) in etags.items()
+            }
+            return response
+
+        def event_data(i):
+            return (
+                "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Example//Test//EN\n"
+                f"BEGIN:VEVENT\nUID:event-{i}\nDTSTAMP:20250101T000000Z\n"
+                "DTSTART:20250101T100000Z\nEND:VEVENT\nEND:VCALENDAR\n"
+            )
+
+        def multiget_response(*numbers):
+            response = Mock()
+            response.statuses = {}
+            response.expand_simple_props.return_value = {
+                f"http://example.com/calendar/{i}.ics": {cdav.CalendarData.tag: event_data(i)}
+                for i in numbers
+            }
+            return response
+
+        mock_query_props.return_value = propfind_response({1: "etag-1", 2: "etag-2"})
+        mock_query.return_value = multiget_response(1, 2)
+        result1 = self.calendar.get_objects_by_sync_token(sync_token=None, load_objects=True)
         initial_token = result1.sync_token
+        assert mock_query_props.call_count == 1, "PROPFIND should be called to fetch ETags"
+        assert [obj.props[dav.GetEtag.tag] for obj in result1] == ["etag-1", "etag-2"]
+        assert [obj.id for obj in result1] == ["event-1", "event-2"]
 
-        # Verify PROPFIND was called to fetch ETags
-        assert mock_query_props.call_count >= 1, "PROPFIND should be called to fetch ETags"
-
-        # Check that ETags were actually added to the first batch of objects
-        # (This verifies the ETag fetching mechanism worked)
-        if obj1.props:
-            print(f"DEBUG: obj1 props after first call: {obj1.props}")
-        if obj2.props:
-            print(f"DEBUG: obj2 props after first call: {obj2.props}")
-
-        # Simulate modification: search returns NEW objects with changed data
-        obj1_modified = self.create_mock_object(
-            "http://example.com/calendar/1.ics", data="MODIFIED_DATA1"
+        ## 1.ics is modified, 2.ics is unchanged and 3.ics is added
+        mock_query_props.return_value = propfind_response(
+            {1: "etag-1-new", 2: "etag-2", 3: "etag-3"}
         )
-        obj2_same = self.create_mock_object("http://example.com/calendar/2.ics", data="DATA2")
-        mock_search.return_value = [obj1_modified, obj2_same]
-
-        # Mock PROPFIND to return different ETag for modified object
-        mock_response2 = Mock()
-        mock_response2.expand_simple_props.return_value = {
-            "http://example.com/calendar/1.ics": {dav.GetEtag.tag: "etag-1-new"},
-            "http://example.com/calendar/2.ics": {dav.GetEtag.tag: "etag-2"},
-        }
-        mock_query_props.return_value = mock_response2
-
-        # Second call: should detect change via ETags
+        mock_query.return_value = multiget_response(1, 3)
+        mock_query.reset_mock()
         result2 = self.calendar.get_objects_by_sync_token(
-            sync_token=initial_token, load_objects=False
+            sync_token=initial_token, load_objects=True
         )
 
-        # Debug: check if ETags were added to second batch
-        if obj1_modified.props:
-            print(f"DEBUG: obj1_modified props after second call: {obj1_modified.props}")
-        if obj2_same.props:
-            print(f"DEBUG: obj2_same props after second call: {obj2_same.props}")
-
-        # Should return all objects because change was detected
-        assert len(list(result2)) == 2, (
-            "Should detect modification via ETags and return all objects"
+        assert [obj.url for obj in result2] == [
+            URL("http://example.com/calendar/1.ics"),
+            URL("http://example.com/calendar/3.ics"),
+        ], "Should return the added and changed objects only"
+        assert [obj.id for obj in result2] == ["event-1", "event-3"]
+        assert mock_query.call_count == 1, "The objects should be loaded in one multiget"
+        self.mock_client._build_calendar_multiget_body.assert_called_with(
+            ["/calendar/1.ics", "/calendar/3.ics"], include_etag=True
         )
         assert result2.sync_token != initial_token, "Token should change when ETag changes"
 
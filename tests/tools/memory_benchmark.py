@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes per object for a synthetic calendar.
+
+Usage:
+    python -m tests.tools.memory_benchmark [--events 100000]
+
+    (from the root of the source tree, so the caldav package there is used)
+
+No server is needed.  A calendar with the given number of events is
+emulated by feeding synthetic REPORT results through the same
+post-processing as ``calendar.search()`` and ``calendar.multiget()``,
+and the memory held by the resulting objects is measured through
+tracemalloc.  The calendar data itself is allocated before the
+measurement starts, so the numbers show the per-object overhead of the
+library (Event, URL, props, result dataclasses), not the payload.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from caldav import Calendar, DAVClient
+from caldav.elements import dav
+from caldav.response import CalendarQueryResult
+
+EVENT = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//python-caldav//memory benchmark//EN
+BEGIN:VEVENT
+UID:event-{i}@example.com
+DTSTAMP:20260101T000000Z
+DTSTART:20260101T{hour:02}0000Z
+DTEND:20260101T{hour:02}3000Z
+SUMMARY:Event number {i}
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def measure(label, count, build):
+    """Runs ``build()`` and reports the memory it holds on to"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<40} {(after - before) / count:10.1f} bytes/object")
+    return objects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+    count = args.events
+
+    client = DAVClient(url="https://calendar.example/")
+    calendar = Calendar(client, url="/calendars/user/benchmark/")
+    hrefs = [f"/calendars/user/benchmark/event-{i}.ics" for i in range(count)]
+    etags = [f'"etag-{i}"' for i in range(count)]
+    data = [EVENT.format(i=i, hour=i % 24) for i in range(count)]
+
+    print(f"Synthetic calendar with {count} events")
+    measure(
+        "CalendarQueryResult",
+        count,
+        lambda: [
+            CalendarQueryResult(href=h, etag=e, calendar_data=d)
+            for h, e, d in zip(hrefs, etags, data, strict=True)
+        ],
+    )
+    measure(
+        "URL (joined with the calendar URL)", count, lambda: [calendar.url.join(h) for h in hrefs]
+    )
+    measure(
+        "Event (search result, unparsed)",
+        count,
+        lambda: [
+            calendar._report_result_object(h, d, None, {dav.GetEtag.tag: e})
+            for h, e, d in zip(hrefs, etags, data, strict=True)
+        ],
+    )
+    measure(
+        "Event (multiget result, unparsed)",
+        count,
+        lambda: calendar._post_multiget(zip(hrefs, data, strict=True)),
+    )
+
+
+if __name__ == "__main__":
+    main()